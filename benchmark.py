@@ -0,0 +1,324 @@
+"""
+Hamming SEC-DED kodlama/çözme performans ölçüm aracı.
+
+Her motor (liste tabanlı encode/decode, tamsayı API'si, sendrom tablolu decode_lut, koda özel üretilmiş
+döngüsüz fonksiyonlar (codegen), NumPy toplu API, G/H matris motoru, Hsiao) ve her k için saniyedeki işlem sayısını (ops/s)
+ve sözcük başına gecikme yüzdeliklerini ölçer.
+Çözme, hatasız, tek hatalı ve çift hatalı girdi karışımlarıyla ayrı ayrı ölçülür.
+Sonuçlar git commit'ine göre anahtarlanmış bir JSON dosyasına kaydedilir; bir önceki (veya
+--baseline ile verilen) ölçüme göre verim eşik değerinden fazla düşerse çıkış kodu 1 olur.
+
+Kullanım:
+    python benchmark.py
+    python benchmark.py -k 8 16 32 64 --engines int batch --threshold 0.10
+"""
+
+import argparse
+import json
+import platform
+import random
+import subprocess
+import sys
+import time
+
+from hamming import HammingSECDED, _int_to_lanes, _require_numpy
+
+MIXES = ("none", "single", "double")
+DEFAULT_RESULTS_PATH = "benchmark_results.json"
+DEFAULT_THRESHOLD = 0.15
+PERCENTILES = (50, 90, 99)
+
+
+def _numpy():
+    """ Kuruluysa NumPy modülü, değilse None """
+    try:
+        return _require_numpy()
+    except ImportError:
+        return None
+
+
+def _hsiao(k):
+    from hamming_hsiao import HsiaoSECDED
+    return HsiaoSECDED(k)
+
+
+def _to_bits(value, width):
+    return [int(b) for b in format(value, f"0{width}b")]
+
+
+class ScalarEngine:
+    """ Sözcük sözcük çağrılan motor: girdiler tamsayıdır, gerekirse listeye çevrilir """
+
+    batch = False
+
+    def __init__(self, name, factory, encode, decode, as_list=False):
+        self.name = name
+        self.factory = factory
+        self.encode_name = encode
+        self.decode_name = decode
+        self.as_list = as_list
+
+    def prepare(self, code, data, received):
+        if self.as_list:
+            return [_to_bits(d, code.k) for d in data], [_to_bits(c, code.n) for c in received]
+        return list(data), list(received)
+
+    def operation(self, code, op):
+        return getattr(code, self.encode_name if op == "encode" else self.decode_name)
+
+
+class CompiledEngine(ScalarEngine):
+    """ Kod başına üretilmiş döngüsüz fonksiyonlar (HammingSECDED.compiled()) """
+
+    def operation(self, code, op):
+        return getattr(code.compiled(), self.encode_name if op == "encode" else self.decode_name)
+
+
+class BatchEngine:
+    """ NumPy toplu motor: tüm girdiler tek dizi olarak, batch_size'lık parçalar hâlinde çağrılır """
+
+    batch = True
+
+    def __init__(self, name, factory):
+        self.name = name
+        self.factory = factory
+
+    def prepare(self, code, data, received):
+        np = _require_numpy()
+        code._get_numpy_tables()
+
+        def array(values, dtype, lanes):
+            if lanes:
+                return np.array([_int_to_lanes(v, lanes) for v in values], dtype=dtype)
+            return np.array(values, dtype=dtype)
+        return (array(data, code.data_dtype, code.data_lanes),
+                array(received, code.codeword_dtype, code.codeword_lanes))
+
+    def operation(self, code, op):
+        return code.encode_batch if op == "encode" else code.decode_batch
+
+
+class MatrixEngine(BatchEngine):
+    """ Paketli G/H matrisleriyle toplu motor (HammingSECDED.matrices()) """
+
+    def operation(self, code, op):
+        matrices = code.matrices()
+        return matrices.encode if op == "encode" else matrices.decode
+
+
+# Yeni (daha hızlı) motorlar buraya eklenerek otomatik olarak ölçüme ve karşılaştırmaya dahil olur
+ENGINES = {
+    "list": ScalarEngine("list", HammingSECDED, "encode", "decode", as_list=True),
+    "int": ScalarEngine("int", HammingSECDED, "encode_int", "decode_int"),
+    "lut": ScalarEngine("lut", HammingSECDED, "encode_int", "decode_lut"),
+    "codegen-list": CompiledEngine("codegen-list", HammingSECDED, "encode", "decode", as_list=True),
+    "codegen-int": CompiledEngine("codegen-int", HammingSECDED, "encode_int", "decode_int"),
+    "batch": BatchEngine("batch", HammingSECDED),
+    "matrix": MatrixEngine("matrix", HammingSECDED),
+    "hsiao-int": ScalarEngine("hsiao-int", _hsiao, "encode_int", "decode_int"),
+    "hsiao-lut": ScalarEngine("hsiao-lut", _hsiao, "encode_int", "decode_lut"),
+    "hsiao-batch": BatchEngine("hsiao-batch", _hsiao),
+    "hsiao-matrix": MatrixEngine("hsiao-matrix", _hsiao),
+}
+
+
+def make_inputs(code, count, mix, seed=0):
+    """
+    count adet rastgele veri sözcüğü ve mix'e göre 0/1/2 bitlik hata eklenmiş kod sözcükleri.
+    Dönüş: (veri tamsayıları, alınan kod sözcüğü tamsayıları)
+    """
+    rng = random.Random(f"{seed}-{code.k}-{mix}")
+    flips = MIXES.index(mix)
+    data = [rng.getrandbits(code.k) for _ in range(count)]
+    received = []
+    for value in data:
+        codeword = code.encode_int(value)
+        for bit in rng.sample(range(code.n), flips):
+            codeword ^= 1 << bit
+        received.append(codeword)
+    return data, received
+
+
+def _percentiles(samples_ns):
+    ordered = sorted(samples_ns)
+    return {f"p{p}_ns": ordered[min(len(ordered) - 1, len(ordered) * p // 100)] for p in PERCENTILES}
+
+
+def measure(engine, code, op, inputs, repeat=3, batch_size=1024):
+    """
+    Tek bir (motor, kod, işlem, girdi) ölçümü.
+    Verim: zamanlayıcısız sıkı döngünün en iyi tekrarı. Gecikme: skaler motorlarda çağrı başına,
+    toplu motorlarda batch_size'lık çağrının süresi / batch_size (ns).
+    """
+    func = engine.operation(code, op)
+    count = len(inputs)
+    best = float("inf")
+    clock = time.perf_counter_ns
+    if engine.batch:
+        for _ in range(repeat):
+            start = clock()
+            func(inputs)
+            best = min(best, clock() - start)
+        samples = []
+        for offset in range(0, count, batch_size):
+            part = inputs[offset:offset + batch_size]
+            start = clock()
+            func(part)
+            samples.append((clock() - start) / len(part))
+    else:
+        for _ in range(repeat):
+            start = clock()
+            for value in inputs:
+                func(value)
+            best = min(best, clock() - start)
+        samples = []
+        for value in inputs:
+            start = clock()
+            func(value)
+            samples.append(clock() - start)
+    return {"ops_per_sec": count * 1e9 / best if best else float("inf"), **_percentiles(samples)}
+
+
+def run_benchmarks(k_values, engine_names, words=20000, list_words=2000, batch_words=1 << 18,
+                   repeat=3, seed=0):
+    """
+    Seçili motorları her k ve her karışım için ölçer.
+    Dönüş: {"engine", "k", "code", "op", "mix", "words", "ops_per_sec", "p50_ns", ...} satırlarının listesi.
+    """
+    rows = []
+    for name in engine_names:
+        engine = ENGINES[name]
+        if engine.batch and _numpy() is None:
+            print(f"'{name}' atlandı: NumPy kurulu değil.", file=sys.stderr)
+            continue
+        count = batch_words if engine.batch else (list_words if engine.as_list else words)
+        for k in k_values:
+            code = engine.factory(k)
+            for mix in MIXES:
+                data, received = engine.prepare(code, *make_inputs(code, count, mix, seed))
+                ops = ("encode", "decode") if mix == "none" else ("decode",)
+                for op in ops:
+                    result = measure(engine, code, op, data if op == "encode" else received, repeat)
+                    rows.append({"engine": name, "k": k, "code": code.get_code_params_str(), "op": op,
+                                 "mix": mix if op == "decode" else "-", "words": count, **result})
+    return rows
+
+
+def _row_key(row):
+    return f"{row['engine']}/k={row['k']}/{row['op']}/{row['mix']}"
+
+
+def current_commit():
+    """ Kısa commit kimliği; izlenen dosyalarda değişiklik varsa '-dirty' eklenir """
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                                text=True, check=True).stdout.strip()
+        dirty = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"],
+                               capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+    return commit + ("-dirty" if dirty else "")
+
+
+def load_results(path):
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def save_results(path, history, commit, rows):
+    history[commit] = {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "numpy": _numpy().__version__ if _numpy() is not None else None,
+        "machine": platform.machine(),
+        "results": rows,
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(history, f, indent=2, ensure_ascii=False)
+
+
+def find_regressions(rows, baseline_rows, threshold):
+    """ Verimi temel ölçüme göre threshold oranından fazla düşen satırlar: (anahtar, eski, yeni) """
+    baseline = {_row_key(row): row["ops_per_sec"] for row in baseline_rows}
+    regressions = []
+    for row in rows:
+        old = baseline.get(_row_key(row))
+        if old and row["ops_per_sec"] < old * (1 - threshold):
+            regressions.append((_row_key(row), old, row["ops_per_sec"]))
+    return regressions
+
+
+def format_table(rows, baseline_rows=None):
+    """ Karşılaştırma tablosu; en hızlı motora göre oran ve (varsa) temel ölçüme göre değişim """
+    baseline = {_row_key(row): row["ops_per_sec"] for row in baseline_rows or []}
+    fastest = {}
+    for row in rows:
+        key = (row["k"], row["op"], row["mix"])
+        fastest[key] = max(fastest.get(key, 0), row["ops_per_sec"])
+
+    header = (f"{'Motor':<13}{'Kod':>11}{'İşlem':>8}{'Hata':>8}{'ops/s':>14}"
+              f"{'p50 (ns)':>11}{'p90 (ns)':>11}{'p99 (ns)':>11}{'En hızlıya':>12}")
+    if baseline:
+        header += f"{'Değişim':>10}"
+    lines = [header]
+    for row in sorted(rows, key=lambda r: (r["k"], r["op"] != "encode", MIXES.index(r["mix"]) if r["mix"] in MIXES
+                                           else -1, -r["ops_per_sec"])):
+        relative = row["ops_per_sec"] / fastest[(row["k"], row["op"], row["mix"])]
+        line = (f"{row['engine']:<13}{row['code']:>11}{row['op']:>8}{row['mix']:>8}{row['ops_per_sec']:>14,.0f}"
+                f"{row['p50_ns']:>11,.0f}{row['p90_ns']:>11,.0f}{row['p99_ns']:>11,.0f}{relative:>11.2f}x")
+        old = baseline.get(_row_key(row))
+        if old:
+            line += f"{(row['ops_per_sec'] / old - 1) * 100:>+9.1f}%"
+        lines.append(line)
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Hamming SEC-DED kodlama/çözme performans ölçümü")
+    parser.add_argument("-k", "--data-bits", type=int, nargs="+", default=[8, 16, 32])
+    parser.add_argument("--engines", nargs="+", choices=list(ENGINES), default=list(ENGINES))
+    parser.add_argument("--words", type=int, default=20000, help="Tamsayı motorları için sözcük sayısı")
+    parser.add_argument("--list-words", type=int, default=2000, help="Liste tabanlı motor için sözcük sayısı")
+    parser.add_argument("--batch-words", type=int, default=1 << 18, help="Toplu motorlar için sözcük sayısı")
+    parser.add_argument("--repeat", type=int, default=5, help="Verim ölçümünün tekrar sayısı (en iyisi alınır)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--results", default=DEFAULT_RESULTS_PATH, help="JSON sonuç dosyası")
+    parser.add_argument("--no-save", action="store_true", help="Sonuçları dosyaya kaydetme")
+    parser.add_argument("--baseline", help="Karşılaştırılacak commit (varsayılan: dosyadaki en son diğer ölçüm)")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="İzin verilen en büyük verim düşüşü (örneğin 0.15 = %%15)")
+    args = parser.parse_args(argv)
+    if min(args.words, args.list_words, args.batch_words, args.repeat) <= 0:
+        parser.error("Sözcük ve tekrar sayıları pozitif olmalıdır.")
+
+    commit = current_commit()
+    history = load_results(args.results)
+    baseline_commit = args.baseline
+    if baseline_commit is None:
+        others = [c for c in history if c != commit]
+        baseline_commit = max(others, key=lambda c: history[c]["timestamp"]) if others else None
+    elif baseline_commit not in history:
+        parser.error(f"{args.results} içinde '{baseline_commit}' ölçümü yok.")
+    baseline_rows = history[baseline_commit]["results"] if baseline_commit else []
+
+    rows = run_benchmarks(args.data_bits, args.engines, args.words, args.list_words, args.batch_words,
+                          args.repeat, args.seed)
+    print(f"Commit {commit}" + (f", temel ölçüm {baseline_commit}" if baseline_commit else ""))
+    print(format_table(rows, baseline_rows))
+    if not args.no_save:
+        save_results(args.results, history, commit, rows)
+
+    regressions = find_regressions(rows, baseline_rows, args.threshold)
+    if regressions:
+        print(f"\nVerim gerilemesi (eşik %{args.threshold * 100:g}):", file=sys.stderr)
+        for key, old, new in regressions:
+            print(f"  {key}: {old:,.0f} -> {new:,.0f} ops/s ({(new / old - 1) * 100:+.1f}%)", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,1240 @@
+"""
+Hamming SEC-DED kodlayıcı/çözücü çekirdeği (tkinter bağımlılığı yoktur).
+
+Başsız (headless) sistemlerde ve işçi süreçlerinde doğrudan içe aktarılabilir:
+    from hamming import HammingSECDED
+    h = HammingSECDED(32)
+    data, status, syndrome = h.decode_int(h.encode_int(0xDEADBEEF))
+Toplu (batch) işlemler ve akış yardımcıları için NumPy gereklidir; çekirdek NumPy olmadan da çalışır.
+"""
+
+import random
+import threading
+import time
+from collections import namedtuple
+from types import MappingProxyType
+
+__all__ = [
+    "HammingSECDED", "DecodeResult", "CodeTables", "CodeRegistry", "CODE_REGISTRY", "preload_codes", "STANDARD_DATA_SIZES", "STREAM_MAGIC",
+    "INTERLEAVED_STREAM_MAGIC", "MAX_STREAM_DATA_BITS", "DEFAULT_CHUNK_SIZE",
+    "enable_metrics", "disable_metrics", "get_metrics",
+    "words_from_bytes", "bytes_from_words", "pack_codewords", "unpack_codewords", "encode_stream", "decode_stream",
+    "iter_stream_codewords",
+]
+
+# İsteğe bağlı: yalnızca toplu (batch) işlemler için gerekli. Kısa ömürlü işçi süreçlerinin
+# başlangıç süresini düşük tutmak için ilk toplu işlemde _require_numpy() tarafından yüklenir.
+np = None
+
+try:
+    _popcount = int.bit_count  # Python 3.10+
+except AttributeError:  # Eski Python sürümleri için yedek
+    def _popcount(x):
+        return bin(x).count("1")
+
+# İsteğe bağlı ölçümleme (bkz. hamming_metrics). None iken sıcak noktalardaki tek maliyet bir karşılaştırmadır.
+_metrics = None
+_perf_ns = time.perf_counter_ns
+
+
+def enable_metrics(metrics=None):
+    """ Süreç genelinde ölçümlemeyi açar; verilmezse yeni bir CodecMetrics oluşturur. Dönüş: etkin nesne """
+    global _metrics
+    if metrics is None:
+        from hamming_metrics import CodecMetrics
+        metrics = CodecMetrics()
+    _metrics = metrics
+    return metrics
+
+
+def disable_metrics():
+    """ Ölçümlemeyi kapatır. Dönüş: o ana kadar toplanan nesne (veya None) """
+    global _metrics
+    metrics, _metrics = _metrics, None
+    return metrics
+
+
+def get_metrics():
+    return _metrics
+
+
+def _require_numpy():
+    """ NumPy'yi (gerekirse) yükler ve modülü döndürür """
+    global np
+    if np is None:
+        try:
+            import numpy
+        except ImportError:
+            raise ImportError("Toplu işlemler için NumPy gereklidir (pip install numpy).") from None
+        np = numpy
+    return np
+
+
+def _uint_dtype(num_bits):
+    """
+    num_bits bitlik değerleri tutabilen en küçük işaretsiz NumPy tipi.
+    64 bitten geniş değerler uint64 "şeritler" (lane) halinde, şekli (N, _num_lanes(num_bits))
+    olan dizilerde tutulur; şerit 0 en düşük anlamlı 64 bittir.
+    """
+    _require_numpy()
+    for dtype in (np.uint8, np.uint16, np.uint32):
+        if num_bits <= np.dtype(dtype).itemsize * 8:
+            return np.dtype(dtype)
+    return np.dtype(np.uint64)
+
+
+def _num_lanes(num_bits):
+    """ Geniş değerler için uint64 şerit sayısı; 64 bite sığan değerler tek boyutlu dizidir (0) """
+    return 0 if num_bits <= 64 else (num_bits + 63) // 64
+
+
+def _int_to_lanes(value, lanes):
+    """ Python tamsayısını uint64 şerit listesine böler (lanes=0 ise değerin kendisi) """
+    if not lanes:
+        return value
+    return [(value >> (64 * i)) & 0xFFFFFFFFFFFFFFFF for i in range(lanes)]
+
+
+def _values_to_be_bytes(values):
+    """ Değer dizisini satır başına büyük-endian bayt dizisine (N, depolama_baytı) dönüştürür """
+    if values.ndim == 1:
+        big_endian = values.astype(values.dtype.newbyteorder(">"))
+    else:
+        big_endian = values[:, ::-1].astype(">u8")
+    return big_endian.view(np.uint8).reshape(len(values), -1)
+
+
+def _values_from_byte_rows(rows, num_bits):
+    """ (N, B) boyutlu büyük-endian bayt satırlarını (değer sağa hizalı) değer dizisine dönüştürür """
+    _require_numpy()
+    dtype, lanes = _uint_dtype(num_bits), _num_lanes(num_bits)
+    width = dtype.itemsize * max(lanes, 1)
+    padded = np.zeros((len(rows), width), dtype=np.uint8)
+    padded[:, width - rows.shape[1]:] = rows
+    if not lanes:
+        return padded.view(dtype.newbyteorder(">")).reshape(len(rows)).astype(dtype)
+    return np.ascontiguousarray(padded.view(">u8").reshape(len(rows), lanes)[:, ::-1]).astype(np.uint64)
+
+
+def _byte_view(buffer, writable=False):
+    """ Tampon protokolünü destekleyen nesnenin (bytes, bytearray, memoryview, mmap, ...) kopyasız uint8 görünümü """
+    _require_numpy()
+    view = memoryview(buffer)
+    if not view.c_contiguous:
+        raise ValueError("Tampon bitişik (C-contiguous) olmalıdır.")
+    if writable and view.readonly:
+        raise ValueError("Çıkış tamponu yazılabilir olmalıdır.")
+    if view.format != "B" or view.ndim != 1:
+        view = view.cast("B")
+    return np.frombuffer(view, dtype=np.uint8)
+
+
+def _values_from_bit_rows(bits, num_bits):
+    """ (N, num_bits) boyutlu MSB-önce bit satırlarını değer dizisine paketler """
+    _require_numpy()
+    dtype, lanes = _uint_dtype(num_bits), _num_lanes(num_bits)
+    width = dtype.itemsize * 8 * max(lanes, 1)
+    padded = np.zeros((len(bits), width), dtype=np.uint8)
+    padded[:, width - num_bits:] = bits
+    rows = np.packbits(padded, axis=1)
+    if not lanes:
+        return rows.view(dtype.newbyteorder(">")).reshape(len(bits)).astype(dtype)
+    return np.ascontiguousarray(rows.view(">u8").reshape(len(bits), lanes)[:, ::-1]).astype(np.uint64)
+
+
+def _parity_np(x):
+    """ Dizinin her elemanı için bit eşliği (0/1) """
+    if hasattr(np, "bitwise_count"):  # NumPy 2.0+
+        return np.bitwise_count(x) & 1
+    x = x.copy()
+    shift = x.dtype.itemsize * 4
+    while shift:
+        x ^= x >> x.dtype.type(shift)
+        shift //= 2
+    return x & 1
+
+
+# decode(..., structured=True) sonucu: yalnızca sayısal alanlar (durum kodu, sendrom, düzeltilen 1-indeksli
+# pozisyon; düzeltme yoksa 0). Mesaj dizesi oluşturulmadığından toplanabilir ve sıcak döngüde ucuzdur.
+DecodeResult = namedtuple("DecodeResult", ["status", "syndrome", "position"])
+
+
+# GUI ve komut satırında sunulan standart veri genişlikleri; (72,64) ve (137,128) klasik ECC düzenleridir
+STANDARD_DATA_SIZES = [8, 16, 32, 64, 128]
+
+
+def _freeze(value):
+    """ Listeleri demete, sözlükleri salt okunur görünüme, NumPy dizilerini salt okunur dizilere çevirir """
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, (dict, MappingProxyType)):
+        return MappingProxyType({name: _freeze(v) for name, v in value.items()})
+    if np is not None and isinstance(value, np.ndarray):
+        value.flags.writeable = False
+    return value
+
+
+class CodeTables:
+    """
+    Bir (değişken, k) kodunun önceden hesaplanmış, değişmez tabloları (eşlik maskeleri, sendrom ve
+    bayt dilimli tablolar). Aynı koda sahip tüm HammingSECDED örnekleri tek bir nesneyi paylaşır.
+    Alanlara öznitelik olarak erişilir (tables.parity_masks); NumPy tabloları ilk toplu işlemde bir kez eklenir.
+    """
+
+    __slots__ = ("variant", "k", "fields", "_numpy")
+
+    def __init__(self, variant, k, fields):
+        object.__setattr__(self, "variant", variant)
+        object.__setattr__(self, "k", k)
+        object.__setattr__(self, "fields", _freeze(fields))
+        object.__setattr__(self, "_numpy", None)
+
+    def __getattr__(self, name):
+        try:
+            return self.fields[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def __setattr__(self, name, value):
+        raise AttributeError("CodeTables nesneleri değiştirilemez.")
+
+    def __delattr__(self, name):
+        raise AttributeError("CodeTables nesneleri değiştirilemez.")
+
+    def __reduce__(self):
+        return CodeTables, (self.variant, self.k, {name: value for name, value in self.fields.items()})
+
+    @property
+    def numpy_tables(self):
+        """ (dtype/şerit öznitelikleri, NumPy tabloları) veya henüz oluşturulmadıysa None """
+        return self._numpy
+
+    def _set_numpy_tables(self, attrs, tables):
+        """ NumPy tablolarını bir kez ekler; zaten varsa mevcut olanı döndürür """
+        if self._numpy is None:
+            object.__setattr__(self, "_numpy", (_freeze(attrs), _freeze(tables)))
+        return self._numpy
+
+
+class CodeRegistry:
+    """
+    (değişken, k) -> CodeTables önbelleği; tablolar süreç başına yalnızca bir kez oluşturulur.
+    fork ile başlatılan işçi süreçleri dolu önbelleği üst süreçten yeniden hesaplamadan devralır
+    (bkz. preload_codes). hits/misses sayaçları önbelleğin ne kadar işe yaradığını gösterir.
+    """
+
+    def __init__(self):
+        self._tables = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, variant, k, build):
+        """ Önbellekteki tabloları döndürür; yoksa build() ile oluşturup kaydeder """
+        key = (variant, k)
+        tables = self._tables.get(key)
+        if tables is None:
+            with self._lock:
+                tables = self._tables.get(key)
+                if tables is None:
+                    self.misses += 1
+                    tables = self._tables[key] = build()
+                    return tables
+        self.hits += 1
+        return tables
+
+    def stats(self):
+        return {"hits": self.hits, "misses": self.misses, "entries": len(self._tables)}
+
+    def clear(self):
+        with self._lock:
+            self._tables.clear()
+            self.hits = self.misses = 0
+
+    def __contains__(self, key):
+        return key in self._tables
+
+    def __len__(self):
+        return len(self._tables)
+
+
+CODE_REGISTRY = CodeRegistry()
+
+
+def preload_codes(k_values, code_cls=None, numpy_tables=True):
+    """
+    Verilen k değerleri için tabloları (ve isteğe bağlı NumPy tablolarını) önceden oluşturur.
+    İşçi süreç havuzu kurulmadan önce çağrılırsa fork edilen işçiler tabloları hazır devralır.
+    """
+    codes = [(code_cls or HammingSECDED)(k) for k in k_values]
+    if numpy_tables:
+        for code in codes:
+            code._get_numpy_tables()
+    return codes
+
+
+class HammingSECDED:
+    # Önbellek anahtarındaki değişken adı; farklı düzen kuran alt sınıflar kendi adını vermelidir
+    variant = "hamming"
+    # Paylaşılan CodeTables nesnesine konan (k'ya bağlı, örnekler arasında ortak) öznitelikler
+    _shared_fields = ("p_sec", "num_parity_bits_sec", "num_parity_bits_ded", "n", "parity_positions_sec",
+                      "data_positions", "overall_parity_position", "codeword_mask", "data_mask", "parity_masks",
+                      "syndrome_columns", "data_columns", "encode_tables", "decode_tables",
+                      "lut_syndrome_masks", "syndrome_lut", "extract_runs", "syndrome_positions")
+
+    def __init__(self, k_data_bits):
+        """
+        Genel bir Hamming SEC-DED kodlayıcı/kod çözücü başlatır.
+        k_data_bits: Veri biti sayısı (örneğin, 8, 16, 32, 64 için (72,64), 128 için (137,128)).
+        Tablolar CODE_REGISTRY üzerinden (değişken, k) başına bir kez oluşturulur ve paylaşılır.
+        """
+        if not isinstance(k_data_bits, int) or k_data_bits < 1:
+            raise ValueError("Veri biti sayısı pozitif bir tamsayı olmalıdır.")
+
+        self.k = k_data_bits
+        self._attach_tables(CODE_REGISTRY.get(self.variant, self.k, self._compute_tables))
+
+    def _compute_tables(self):
+        """ Kod düzenini ve tüm tamsayı tablolarını hesaplar (önbellek ıskasında çağrılır) """
+        self._compute_layout()
+        self._build_int_tables()
+        self._build_lut_tables()
+        return CodeTables(self.variant, self.k, {name: getattr(self, name) for name in self._shared_fields})
+
+    def _attach_tables(self, tables):
+        self.tables = tables
+        for name, value in tables.fields.items():
+            setattr(self, name, value)
+
+    def __reduce__(self):
+        # Yalnızca k gönderilir; alan süreçte tablolar önbellekten alınır
+        return type(self), (self.k,)
+
+    def _compute_layout(self):
+        """ Eşlik biti sayısını ve 1-indeksli eşlik/veri pozisyonlarını belirler """
+        # SEC için eşlik biti sayısını (p) hesapla
+        self.p_sec = 0
+        while (2**self.p_sec) < (self.k + self.p_sec + 1):
+            self.p_sec += 1
+            
+        self.num_parity_bits_sec = self.p_sec
+        self.num_parity_bits_ded = self.p_sec + 1 # Genel eşlik için 1 ekle
+        self.n = self.k + self.num_parity_bits_ded # Kod sözcüğündeki toplam bit sayısı
+
+        # Pozisyonları belirle (1-indeksli)
+        # SEC için eşlik bitleri 2'nin kuvvetlerindedir
+        self.parity_positions_sec = [2**i for i in range(self.p_sec)]
+        
+        # Veri biti pozisyonları k + p_sec'e kadar olan diğer tüm pozisyonlardır
+        parity_positions = set(self.parity_positions_sec)
+        self.data_positions = [i for i in range(1, self.k + self.p_sec + 1) if i not in parity_positions]
+
+        # Genel eşlik biti sonda, n pozisyonunda olacaktır
+        self.overall_parity_position = self.n
+
+    def _build_int_tables(self):
+        """
+        encode_int/decode_int için eşlik maskelerini ve bayt dilimli tabloları önceden hesaplar.
+        Tamsayı gösteriminde 1-indeksli p pozisyonu (n - p) numaralı bittir, yani
+        kod sözcüğü tamsayısı int("".join(kod_sozcugu), 2) değerine eşittir.
+        Veri tamsayısı da aynı şekilde int("".join(veri_bitleri), 2) değeridir.
+        """
+        n = self.n
+        self.codeword_mask = (1 << n) - 1
+        self.data_mask = (1 << self.k) - 1
+
+        # Her SEC eşlik kontrolünün kapsadığı pozisyonların maskesi (ilk n-1 bit)
+        self.parity_masks = []
+        for i in range(self.p_sec):
+            mask = 0
+            for bit_pos in range(1, n):
+                if (bit_pos >> i) & 1:
+                    mask |= 1 << (n - bit_pos)
+            self.parity_masks.append(mask)
+
+        # Her veri bitinin (LSB'den itibaren t) tek başına üreteceği kod sözcüğü.
+        # Veri biti kendi pozisyonunu, pozisyonunu kapsayan SEC eşlik bitlerini ve
+        # toplam ağırlık tekse genel eşlik bitini 1 yapar.
+        unit_codewords = []
+        for t in range(self.k):
+            pos = self.data_positions[self.k - 1 - t]
+            cw = 1 << (n - pos)
+            for i, p_pos in enumerate(self.parity_positions_sec):
+                if (pos >> i) & 1:
+                    cw |= 1 << (n - p_pos)
+            if _popcount(cw) & 1:
+                cw |= 1  # Genel eşlik biti (pozisyon n -> bit 0)
+            unit_codewords.append(cw)
+        # Artımlı güncelleme için veri listesi indeksine göre (i=0 ilk veri biti) aynı sütunlar
+        self.data_columns = unit_codewords[::-1]
+
+        # Kod sözcüğü bitinden veri bitine eşleme (veri pozisyonu değilse 0)
+        data_bit_of_cw_bit = [0] * n
+        for i, pos in enumerate(self.data_positions):
+            data_bit_of_cw_bit[n - pos] = 1 << (self.k - 1 - i)
+
+        # Her kod sözcüğü bitinin genişletilmiş sendroma katkısı: (sendrom << 1) | eşlik.
+        # p < n pozisyonundaki bir bit sendroma tam olarak p ekler (XOR);
+        # genel eşlik biti (bit 0) yalnızca eşlik kontrolünü değiştirir.
+        syndrome_of_cw_bit = [1] + [((n - c) << 1) | 1 for c in range(1, n)]
+        self.syndrome_columns = syndrome_of_cw_bit
+
+        # Kod doğrusal olduğundan encode(d) = XOR_j encode(bayt_j << 8j);
+        # sendrom ve veri çıkarma da kod sözcüğü baytları üzerinden aynı şekilde yapılır.
+        self.encode_tables = self._build_byte_tables(unit_codewords)
+        self.decode_tables = list(zip(self._build_byte_tables(syndrome_of_cw_bit),
+                                      self._build_byte_tables(data_bit_of_cw_bit)))
+
+    def _build_lut_tables(self):
+        """
+        decode_lut tabloları; yalnızca syndrome_columns ve data_positions'a dayandığından her düzende çalışır.
+        syndrome_positions[sendrom]: tek hatada düzeltilen 1-indeksli pozisyon (genel eşlik biti hariç).
+        lut_syndrome_masks: genişletilmiş sendromun her bitine (MSB önce) giren kod sözcüğü bitlerinin maskesi.
+        syndrome_lut[sendrom]: (durum kodu, düzeltilmiş veriye XOR'lanacak maske).
+        extract_runs: ardışık veri pozisyonu grupları için (kaydırma, maske) çiftleri (PEXT benzeri toplama).
+        """
+        n, k = self.n, self.k
+        width = max(self.syndrome_columns).bit_length()
+        self.lut_syndrome_masks = [sum(1 << c for c, column in enumerate(self.syndrome_columns) if (column >> j) & 1)
+                                   for j in reversed(range(width))]
+
+        overall_bit = None if self.overall_parity_position is None else n - self.overall_parity_position
+        data_bit_of_cw_bit = [0] * n
+        for i, pos in enumerate(self.data_positions):
+            data_bit_of_cw_bit[n - pos] = 1 << (k - 1 - i)
+        self.syndrome_lut = [(2, 0)] * (1 << width)
+        self.syndrome_lut[0] = (0, 0)
+        # decode_int/decode_batch'in döndürdüğü sendrom -> düzeltilen 1-indeksli pozisyon (ölçümleme için)
+        sec_shift = 0 if overall_bit is None else 1
+        self.syndrome_positions = [0] * (1 << (width - sec_shift))
+        for c, column in enumerate(self.syndrome_columns):
+            self.syndrome_lut[column] = (3 if c == overall_bit else 1, data_bit_of_cw_bit[c])
+            if c != overall_bit:
+                self.syndrome_positions[column >> sec_shift] = n - c
+
+        # Veri pozisyonları artan sıradadır; ardışık pozisyonlar tek kaydırma ve maskeyle toplanır
+        self.extract_runs = []
+        start = 0
+        for i in range(1, k + 1):
+            if i == k or self.data_positions[i] != self.data_positions[i - 1] + 1:
+                length = i - start
+                shift = (n - self.data_positions[i - 1]) - (k - i)
+                self.extract_runs.append((shift, ((1 << length) - 1) << (k - i)))
+                start = i
+
+    @staticmethod
+    def _build_byte_tables(unit_values):
+        """
+        unit_values[t], t numaralı giriş bitinin katkısıdır. Her giriş baytı için
+        256 girişli bir XOR tablosu üretir (son bayt yalnızca geçerli bitler kadar).
+        """
+        tables = []
+        for start in range(0, len(unit_values), 8):
+            units = unit_values[start:start + 8]
+            table = [0] * (1 << len(units))
+            for b in range(1, len(table)):
+                low_bit = (b & -b).bit_length() - 1
+                table[b] = table[b & (b - 1)] ^ units[low_bit]
+            tables.append(table)
+        return tables
+
+    @classmethod
+    def shortened(cls, n_total):
+        """
+        Kod sözcüğü uzunluğu tam olarak n_total olan kısaltılmış kodu döndürür.
+        Eşlik düzeni aynı kalır; veri pozisyonları n_total'a sığacak kadar kesilir (k = n_total - p_sec - 1).
+        """
+        for p_sec in range(2, max(n_total, 2)):
+            k = n_total - p_sec - 1
+            if k < 1:
+                break
+            if 2**p_sec >= n_total:
+                code = cls(k)
+                if code.n == n_total:
+                    return code
+                break
+        raise ValueError(f"{n_total} bitlik kod sözcüğü için kısaltılmış SEC-DED kodu yok.")
+
+    def corrected_position(self, error_status_code, syndrome_val):
+        """ decode_int/decode_batch sonucundan düzeltilen 1-indeksli pozisyon; düzeltme yoksa 0 """
+        if error_status_code == 3:
+            return self.overall_parity_position
+        return self.syndrome_positions[syndrome_val] if error_status_code == 1 else 0
+
+    def _record_batch_stage(self, metrics, stage, start, words):
+        """ Toplu motorda bir aşamanın süresini kaydeder; bir sonraki aşamanın başlangıç zamanını döndürür """
+        now = _perf_ns()
+        metrics.record_stage(self, "batch", stage, now - start, words)
+        return now
+
+    def corrected_positions(self, status, syndromes):
+        """ corrected_position'ın toplu karşılığı: decode_batch'in (durum, sendrom) dizilerinden pozisyon dizisi """
+        positions = self._get_numpy_tables()["positions"][syndromes]
+        if self.overall_parity_position is not None:
+            positions = np.where(status == 3, self.overall_parity_position, positions)
+        return np.where((status == 1) | (status == 3), positions, 0)
+
+    def _record_batch_status(self, metrics, status, syndromes):
+        """ Toplu çözme sonuçlarını ölçüm nesnesine ekler (durum sayıları ve düzeltilen pozisyon histogramı) """
+        positions = self.corrected_positions(status, syndromes)
+        positions = positions[positions > 0]
+        metrics.record_status_batch(self, np.bincount(status.reshape(-1), minlength=4),
+                                    np.bincount(positions.reshape(-1), minlength=self.n + 1))
+
+    def get_code_params_str(self):
+        return f"({self.n},{self.k})" # SEC-DED ana başlıkta olduğu için buradan kaldırıldı
+
+    def encode(self, data_bits_list):
+        """
+        k-bit veriyi Hamming SEC-DED kodu kullanarak kodlar.
+        data_bits_list: k bitlik liste [d_msb, ..., d_lsb].
+        Dönüş: n-bitlik kod sözcüğü listesi.
+        """
+        if len(data_bits_list) != self.k:
+            raise ValueError(f"Veri tam olarak {self.k} bit olmalıdır.")
+        metrics = _metrics
+        if metrics is not None:
+            start = _perf_ns()
+
+        # Kod sözcüğü dizisi (daha kolay matematik için 1-indeksli, bu yüzden boyut n+1)
+        codeword = [0] * (self.n + 1)
+
+        # 1. Veri bitlerini pozisyonlarına yerleştir
+        # data_bits_list'in [d_k-1, d_k-2, ..., d_0] olduğu varsayılıyor
+        # ve self.data_positions artan pozisyon numarasına göre sıralanmıştır
+        for i in range(self.k):
+            codeword[self.data_positions[i]] = data_bits_list[i]
+
+        # 2. SEC eşlik bitlerini hesapla (P1, P2, P4, P8, ...)
+        for i in range(self.p_sec):
+            p_pos = self.parity_positions_sec[i]
+            xor_sum = 0
+            for bit_pos in range(1, self.k + self.p_sec + 1):
+                # Eğer p_pos'uncu bit, bit_pos'un ikili gösteriminde ayarlanmışsa
+                # (bit_pos >> i) & 1, bit_pos'un i'inci bitinin 1 olup olmadığını kontrol eder
+                # bu da p_pos eşlik biti tarafından kapsanan pozisyonları kontrol etmeye karşılık gelir
+                if (bit_pos >> i) & 1:
+                    if bit_pos != p_pos: # Eşlik bitini henüz kendisiyle XOR'lama
+                        xor_sum ^= codeword[bit_pos]
+            codeword[p_pos] = xor_sum
+            
+        # 3. Genel eşlik bitini (P_overall) hesapla
+        # Bu, 1'den n-1'e kadar olan tüm bitleri kapsar (yani, k veri biti + p_sec eşlik biti)
+        overall_parity_val = 0
+        for i in range(1, self.n): # n-1'e kadar, P_overall'ın kendisinden önce
+            overall_parity_val ^= codeword[i]
+        codeword[self.overall_parity_position] = overall_parity_val
+
+        if metrics is not None:
+            metrics.record_stage(self, "list", "encode", _perf_ns() - start)
+        return codeword[1:] # 0-indeksli n bitlik liste döndür
+
+    def _calculate_syndrome_and_overall_parity_status(self, received_codeword_list):
+        """
+        Kod çözme için dahili yardımcı.
+        Dönüş: (sendrom_degeri, genel_eslik_dogru_mu)
+        sendrom_degeri: SEC bölümünde hata yoksa 0, aksi takdirde hata pozisyonu.
+        genel_eslik_dogru_mu: Genel eşlik eşleşiyorsa True, aksi takdirde False.
+        """
+        if len(received_codeword_list) != self.n:
+            raise ValueError(f"Alınan kod sözcüğü {self.n} bit olmalıdır.")
+        metrics = _metrics
+        if metrics is not None:
+            start = _perf_ns()
+
+        # Hesaplamalar için 1-indeksli dizi kullan
+        r = [0] + received_codeword_list 
+        syndrome_val = 0
+
+        # SEC bölümü için sendromu hesapla (ilk n-1 bit)
+        for i in range(self.p_sec):
+            p_check_pos = self.parity_positions_sec[i] # Bu 2**i'dir
+            xor_sum = 0
+            for bit_pos in range(1, self.n): # n-1'e kadar olan bitleri kontrol et (SEC bölümü + veri)
+                # Eğer bit_pos'un i'inci biti 1 ise (yani bit_pos P_2^i tarafından kapsanıyorsa)
+                if (bit_pos >> i) & 1:
+                    xor_sum ^= r[bit_pos]
+            if xor_sum != 0: # eğer bu eşlik kontrolü başarısız olursa
+                syndrome_val += p_check_pos # Sendroma 2'nin kuvvetini ekle
+
+        # Genel eşliği kontrol et
+        # İlk n-1 alınan bitten beklenen genel eşliği hesapla
+        calculated_overall_parity_of_first_n_minus_1_bits = 0
+        for i in range(1, self.n): # 1'den n-1'e kadar olan bitleri topla
+            calculated_overall_parity_of_first_n_minus_1_bits ^= r[i]
+        
+        # Bu hesaplanan genel eşliği alınan genel eşlik biti r[n] ile karşılaştır
+        overall_parity_matches = (calculated_overall_parity_of_first_n_minus_1_bits == r[self.overall_parity_position])
+
+        if metrics is not None:
+            metrics.record_stage(self, "list", "syndrome", _perf_ns() - start)
+        return syndrome_val, overall_parity_matches
+
+    def decode(self, received_codeword_list, structured=False):
+        """
+        Alınan n-bitlik kod sözcüğünü çöz ve hataları tespit et/düzelt.
+        Dönüş: (duzeltilmis_veri_bitleri, hata_durum_kodu, hata_bilgisi)
+        hata_durum_kodu: 0=hata yok, 1=tek hata düzeltildi, 2=çift hata tespit edildi (düzeltilemez), 3=genel eşlik bitindeki hata düzeltildi
+        hata_bilgisi: dize mesajı veya hata pozisyonu; structured=True ise mesaj oluşturulmaz,
+        yerine DecodeResult(durum, sendrom, düzeltilen_pozisyon) döner.
+        """
+        syndrome_val, overall_parity_matches = self._calculate_syndrome_and_overall_parity_status(received_codeword_list)
+        metrics = _metrics
+        if metrics is not None:
+            start = _perf_ns()
+
+        corrected_codeword = list(received_codeword_list) # Değiştirilebilir bir kopya oluştur
+        error_status_code = -1 
+        error_info = ""
+
+        if syndrome_val == 0:
+            if overall_parity_matches:
+                error_status_code = 0  # Hata yok
+                error_info = "Hata tespit edilmedi."
+            else: # S=0, P_o başarısız
+                error_status_code = 3  # Genel eşlik bitinde hata
+                error_info = "" if structured else f"Genel eşlik bitinde tek hata (pozisyon {self.overall_parity_position}, 0-indeksli: {self.overall_parity_position-1}) düzeltildi."
+                # Genel eşlik bitini düzelt
+                corrected_codeword[self.overall_parity_position - 1] = 1 - corrected_codeword[self.overall_parity_position - 1]
+        else: # syndrome_val != 0
+            if not overall_parity_matches: # S!=0, P_o başarısız -> veri/SEC_eslik bitlerinde tek hata
+                error_status_code = 1 # Veri/SEC_eslik bitlerinde tek hata
+                error_position = syndrome_val # Sendrom doğrudan 1-indeksli hata pozisyonunu gösterir
+                if 1 <= error_position <= (self.n -1) : # Hata pozisyonunun geçerli olduğundan emin ol (SEC bölümü içinde)
+                    error_info = "" if structured else f"Pozisyon {error_position}'de (0-indeksli: {error_position-1}) tek hata düzeltildi."
+                    corrected_codeword[error_position - 1] = 1 - corrected_codeword[error_position - 1]
+                else: # Mantık doğruysa SEC-DED için ilk n-1 bit için sendromla olmamalı
+                    error_status_code = 2 # Veya başka bir düzeltilemez hata durumu
+                    error_info = "" if structured else f"Düzeltilemez hata (sendrom {syndrome_val} SEC bölümü için aralık dışında veya P_o yanlışlığı genel P biti dışında hata olduğunu gösteriyor)."
+            else: # S!=0, P_o doğru -> çift hata
+                error_status_code = 2 # Çift hata tespit edildi
+                error_info = "" if structured else f"Çift hata tespit edildi (sendrom {syndrome_val}, genel eşlik TAMAM). Düzeltilemez."
+                # Veriye güvenilemez, (potansiyel olarak bozulmuş) alınandan orijinal veri bitlerini döndür
+
+        if metrics is not None:
+            now = _perf_ns()
+            metrics.record_stage(self, "list", "correction", now - start)
+            metrics.record_status(self, error_status_code, self.corrected_position(error_status_code, syndrome_val))
+            start = now
+
+        # (Potansiyel olarak) düzeltilmiş kod sözcüğünden veri bitlerini çıkar
+        extracted_data_bits = []
+        # self.data_positions'a göre çıkarma için 1-indeksli corrected_codeword kullan
+        temp_corrected_codeword_1_indexed = [0] + corrected_codeword
+        for pos in self.data_positions: # self.data_positions 1-indekslidir
+            extracted_data_bits.append(temp_corrected_codeword_1_indexed[pos])
+
+        if metrics is not None:
+            metrics.record_stage(self, "list", "extract", _perf_ns() - start)
+        if structured:
+            error_info = DecodeResult(error_status_code, syndrome_val,
+                                      self.corrected_position(error_status_code, syndrome_val))
+        return extracted_data_bits, error_status_code, error_info
+
+    def encode_int(self, data):
+        """
+        Liste tabanlı encode'un tamsayı karşılığı (bayt dilimli tablolarla).
+        data: k-bitlik veri tamsayısı (MSB ilk veri bitidir).
+        Dönüş: n-bitlik kod sözcüğü tamsayısı.
+        """
+        if not 0 <= data <= self.data_mask:
+            raise ValueError(f"Veri 0 ile {self.data_mask} arasında olmalıdır.")
+
+        metrics = _metrics
+        if metrics is not None:
+            start = _perf_ns()
+        codeword = 0
+        for table in self.encode_tables:
+            codeword ^= table[data & 0xFF]
+            data >>= 8
+        if metrics is not None:
+            metrics.record_stage(self, "int", "encode", _perf_ns() - start)
+        return codeword
+
+    def decode_int(self, codeword):
+        """
+        Liste tabanlı decode'un tamsayı karşılığı.
+        codeword: n-bitlik kod sözcüğü tamsayısı.
+        Dönüş: (duzeltilmis_veri, hata_durum_kodu, sendrom_degeri)
+        hata_durum_kodu decode ile aynıdır (0/1/2/3).
+        """
+        if not 0 <= codeword <= self.codeword_mask:
+            raise ValueError(f"Kod sözcüğü 0 ile {self.codeword_mask} arasında olmalıdır.")
+
+        metrics = _metrics
+        if metrics is not None:
+            start = _perf_ns()
+        # Sendrom ve veri bitleri, kod sözcüğünün her baytı için tek tablo aramasıyla toplanır
+        extended_syndrome = 0
+        data = 0
+        cw = codeword
+        for syndrome_table, extract_table in self.decode_tables:
+            byte = cw & 0xFF
+            extended_syndrome ^= syndrome_table[byte]
+            data ^= extract_table[byte]
+            cw >>= 8
+        syndrome_val = extended_syndrome >> 1
+        # Genel eşlik biti tüm kod sözcüğünü çift yapar
+        overall_parity_matches = not (extended_syndrome & 1)
+
+        if syndrome_val == 0:
+            # Genel eşlik bitindeki hata veri bitlerini etkilemez
+            error_status_code = 0 if overall_parity_matches else 3
+        elif not overall_parity_matches and syndrome_val <= self.n - 1:
+            error_status_code = 1
+            # Hatalı bit bir veri pozisyonundaysa çıkarılan veride de çevir
+            error_bit = self.n - syndrome_val
+            data ^= self.decode_tables[error_bit >> 3][1][1 << (error_bit & 7)]
+        else:
+            error_status_code = 2
+        if metrics is not None:
+            metrics.record_stage(self, "int", "decode", _perf_ns() - start)
+            metrics.record_status(self, error_status_code, self.corrected_position(error_status_code, syndrome_val))
+        return data, error_status_code, syndrome_val
+
+    def decode_lut(self, codeword):
+        """
+        Sendrom tablosuyla kod çözme: genişletilmiş sendromun her biti tek bir maske-popcount işlemiyle
+        (lut_syndrome_masks) hesaplanır; durum ve veri düzeltme maskesi dallanmadan tek syndrome_lut
+        aramasıyla bulunur. Veri, ardışık veri pozisyonu grupları başına bir kaydırma ve maskeyle (extract_runs)
+        çıkarılır. İşlem sayısı kod sözcüğü bayt sayısıyla değil, log2(n) ile (p_sec+1 maske, ~log2(n) grup) artar.
+        Dönüş ve durum kodları decode_int ile aynıdır: (duzeltilmis_veri, hata_durum_kodu, sendrom_degeri).
+        """
+        if not 0 <= codeword <= self.codeword_mask:
+            raise ValueError(f"Kod sözcüğü 0 ile {self.codeword_mask} arasında olmalıdır.")
+        metrics = _metrics
+        if metrics is not None:
+            start = _perf_ns()
+        extended_syndrome = 0
+        for mask in self.lut_syndrome_masks:
+            extended_syndrome = (extended_syndrome << 1) | (_popcount(codeword & mask) & 1)
+        error_status_code, data = self.syndrome_lut[extended_syndrome]
+        for shift, mask in self.extract_runs:
+            data ^= (codeword >> shift) & mask
+        if self.overall_parity_position is not None:
+            extended_syndrome >>= 1  # decode_int gibi yalnızca SEC sendromu döndürülür
+        if metrics is not None:
+            metrics.record_stage(self, "lut", "decode", _perf_ns() - start)
+            metrics.record_status(self, error_status_code, self.corrected_position(error_status_code, extended_syndrome))
+        return data, error_status_code, extended_syndrome
+
+    def compiled(self):
+        """
+        Bu kod için üretilmiş döngüsüz encode/syndrome/decode (bit listeleri) ve encode_int/decode_int
+        fonksiyonları (bkz. hamming_codegen). İlk çağrıda derlenir ve örnekte saklanır.
+        """
+        if getattr(self, "_compiled", None) is None:
+            from hamming_codegen import compile_codec
+            self._compiled = compile_codec(self)
+        return self._compiled
+
+    def matrices(self):
+        """
+        Bu kodun GF(2) üreteç (G) ve eşlik denetim (H) matrisleri, matris tabanlı toplu
+        encode/syndrome/decode ve metin/JSON/Verilog dışa aktarımı (bkz. hamming_matrix).
+        İlk çağrıda oluşturulur ve örnekte saklanır.
+        """
+        if getattr(self, "_matrices", None) is None:
+            from hamming_matrix import CodeMatrices
+            self._matrices = CodeMatrices(self)
+        return self._matrices
+
+    def update_int(self, codeword, changes):
+        """
+        Okuma-değiştirme-yazma için artımlı güncelleme: yeniden kodlamak yerine, değeri gerçekten değişen
+        her veri biti için o bitin sütununu (kendi pozisyonu, kapsayan SEC eşlik bitleri ve genel eşlik) XOR'lar.
+        changes: {veri_biti_indeksi: yeni_değer} sözlüğü veya (indeks, değer) çiftleri;
+                 indeks veri listesindeki sıradır (0 = ilk/MSB veri biti, pozisyonu data_positions[0]).
+        Geçerli bir kod sözcüğü için sonuç encode_int(yeni_veri) ile aynıdır; kod sözcüğünde zaten bir hata
+        varsa (sendrom doğrusal olduğundan) aynen korunur.
+        Dönüş: güncellenmiş kod sözcüğü tamsayısı.
+        """
+        if not 0 <= codeword <= self.codeword_mask:
+            raise ValueError(f"Kod sözcüğü 0 ile {self.codeword_mask} arasında olmalıdır.")
+        for index, value in (changes.items() if hasattr(changes, "items") else changes):
+            if not 0 <= index < self.k:
+                raise ValueError(f"Veri biti indeksi 0 ile {self.k - 1} arasında olmalıdır.")
+            if value not in (0, 1):
+                raise ValueError("Bit değerleri 0 veya 1 olmalıdır.")
+            if (codeword >> (self.n - self.data_positions[index])) & 1 != value:
+                codeword ^= self.data_columns[index]
+        return codeword
+
+    def update(self, codeword_list, changes):
+        """
+        update_int'in liste karşılığı. codeword_list: n-bitlik kod sözcüğü listesi.
+        Dönüş: güncellenmiş kod sözcüğü listesi.
+        """
+        if len(codeword_list) != self.n:
+            raise ValueError(f"Kod sözcüğü {self.n} bit olmalıdır.")
+        codeword = self.update_int(int("".join(str(b) for b in codeword_list), 2), changes)
+        return [(codeword >> (self.n - 1 - i)) & 1 for i in range(self.n)]
+
+    def _get_numpy_tables(self):
+        """
+        encode_batch/decode_batch için NumPy tablolarını ilk kullanımda oluşturur.
+        64 bitten geniş veri/kod sözcükleri uint64 şerit dizileri olarak işlenir (bkz. _uint_dtype).
+        Tablolar (salt okunur) paylaşılan CodeTables nesnesinde saklanır.
+        """
+        if getattr(self, "_np_tables", None) is None:
+            shared = self.tables.numpy_tables
+            if shared is None:
+                _require_numpy()
+                shared = self.tables._set_numpy_tables(*self._build_numpy_tables())
+            attrs, self._np_tables = shared
+            for name, value in attrs.items():
+                setattr(self, name, value)
+        return self._np_tables
+
+    def _build_numpy_tables(self):
+        """ Dönüş: (dtype/şerit öznitelikleri, NumPy tabloları) """
+        attrs = {
+            "data_dtype": _uint_dtype(self.k), "data_lanes": _num_lanes(self.k),
+            "codeword_dtype": _uint_dtype(self.n), "codeword_lanes": _num_lanes(self.n),
+            "syndrome_dtype": _uint_dtype(self.p_sec),
+        }
+
+        def table(values, dtype, lanes):
+            return np.array([_int_to_lanes(v, lanes) for v in values], dtype=dtype)
+
+        codeword_dtype, codeword_lanes = attrs["codeword_dtype"], attrs["codeword_lanes"]
+        # Sendrom -> düzeltilecek bit maskesi (yalnızca 1..n-1 geçerli tek hata pozisyonları)
+        correction = [0] * (1 << self.p_sec)
+        for syndrome_val in range(1, min(self.n, 1 << self.p_sec)):
+            correction[syndrome_val] = 1 << (self.n - syndrome_val)
+        tables = {
+            "encode": [table(t, codeword_dtype, codeword_lanes) for t in self.encode_tables],
+            "extract": [table(t, attrs["data_dtype"], attrs["data_lanes"]) for _, t in self.decode_tables],
+            "parity_masks": [table([m], codeword_dtype, codeword_lanes)[0] for m in self.parity_masks],
+            "correction": table(correction, codeword_dtype, codeword_lanes),
+            "data_columns": table(self.data_columns, codeword_dtype, codeword_lanes),
+            "data_shifts": np.array([self.n - p for p in self.data_positions], dtype=np.int64),
+            "positions": np.array(self.syndrome_positions, dtype=np.int64),
+        }
+        return attrs, tables
+
+    @staticmethod
+    def _byte_at(values, j, lanes):
+        """ Değer dizisinin j numaralı baytı (şeritli dizilerde son eksen şerittir) """
+        if not lanes:
+            return (values >> values.dtype.type(8 * j)) & 0xFF
+        return (values[..., j >> 3] >> np.uint64(8 * (j & 7))) & 0xFF
+
+    @staticmethod
+    def _parity_rows(values, lanes):
+        """ Her değerin (şeritli ise tüm şeritlerinin) bit eşliği """
+        if lanes:
+            values = np.bitwise_xor.reduce(values, axis=-1)
+        return _parity_np(values)
+
+    @staticmethod
+    def _check_words(values, num_bits, lanes, dtype, what):
+        values = np.asarray(values)
+        if values.dtype.kind != "u":
+            raise ValueError(f"{what} dizisi işaretsiz tamsayı tipinde olmalıdır.")
+        if lanes:
+            if values.ndim == 0 or values.shape[-1] != lanes:
+                raise ValueError(f"{num_bits} bitlik {what.lower()} dizisi (..., {lanes}) şekilli uint64 şeritlerinden oluşmalıdır.")
+            top = values[..., -1]
+            top_bits = num_bits - 64 * (lanes - 1)
+        else:
+            top, top_bits = values, num_bits
+        if top.size and top_bits < 64 and int(top.max()) >> top_bits:
+            raise ValueError(f"{what} değerleri {num_bits} bite sığmalıdır.")
+        return values.astype(dtype, copy=False)
+
+    def encode_batch(self, data_words):
+        """
+        Bir veri sözcüğü dizisini (uint8/uint16/uint32/uint64, eleman başına bir sözcük) toplu kodlar.
+        k > 64 için veri (N, şerit) şekilli uint64 dizisidir.
+        Dönüş: kod sözcüğü dizisi (n bit için en küçük işaretsiz tip veya uint64 şeritleri, encode_int ile aynı bitler).
+        """
+        tables = self._get_numpy_tables()
+        data = self._check_words(data_words, self.k, self.data_lanes, self.data_dtype, "Veri")
+        metrics = _metrics
+        if metrics is not None:
+            start = _perf_ns()
+
+        shape = data.shape[:-1] if self.data_lanes else data.shape
+        if self.codeword_lanes:
+            shape += (self.codeword_lanes,)
+        codewords = np.zeros(shape, dtype=self.codeword_dtype)
+        for j, table in enumerate(tables["encode"]):
+            codewords ^= table[self._byte_at(data, j, self.data_lanes)]
+        if metrics is not None:
+            metrics.record_stage(self, "batch", "encode", _perf_ns() - start, len(codewords))
+        return codewords
+
+    def decode_batch(self, codewords):
+        """
+        Bir kod sözcüğü dizisini toplu çözer; sendromlar maske-ve-eşlik işlemleriyle vektörel hesaplanır.
+        Dönüş: (duzeltilmis_veri, hata_durum_kodlari, sendromlar) dizileri.
+        Durum kodları decode ile aynıdır (0/1/2/3).
+        """
+        tables = self._get_numpy_tables()
+        cw = self._check_words(codewords, self.n, self.codeword_lanes, self.codeword_dtype, "Kod sözcüğü")
+        lanes = self.codeword_lanes
+        metrics = _metrics
+        if metrics is not None:
+            start = _perf_ns()
+
+        # SEC sendromu: her eşlik maskesiyle AND'lenmiş bitlerin eşliği
+        syndromes = np.zeros(cw.shape[:-1] if lanes else cw.shape, dtype=self.syndrome_dtype)
+        for i, mask in enumerate(tables["parity_masks"]):
+            syndromes |= (self._parity_rows(cw & mask, lanes).astype(self.syndrome_dtype) << self.syndrome_dtype.type(i))
+        # Genel eşlik: doğru bir kod sözcüğünün toplam eşliği çifttir
+        overall_parity_fails = self._parity_rows(cw, lanes).astype(bool)
+        if metrics is not None:
+            start = self._record_batch_stage(metrics, "syndrome", start, len(syndromes))
+
+        syndrome_zero = syndromes == 0
+        single_error = ~syndrome_zero & overall_parity_fails & (syndromes <= self.n - 1)
+        status = np.full(syndromes.shape, 2, dtype=np.uint8)
+        status[syndrome_zero & ~overall_parity_fails] = 0
+        status[syndrome_zero & overall_parity_fails] = 3
+        status[single_error] = 1
+
+        flips = tables["correction"][np.where(single_error, syndromes, 0)]
+        corrected = cw ^ flips
+        if metrics is not None:
+            start = self._record_batch_stage(metrics, "correction", start, len(syndromes))
+        shape = syndromes.shape + (self.data_lanes,) if self.data_lanes else syndromes.shape
+        data = np.zeros(shape, dtype=self.data_dtype)
+        for j, table in enumerate(tables["extract"]):
+            data ^= table[self._byte_at(corrected, j, lanes)]
+        if metrics is not None:
+            self._record_batch_stage(metrics, "extract", start, len(syndromes))
+            self._record_batch_status(metrics, status, syndromes)
+        return data, status, syndromes
+
+    def update_batch(self, codewords, word_indices, bit_indices, values):
+        """
+        update_int'in toplu karşılığı: her j için codewords[word_indices[j]] sözcüğünün bit_indices[j]
+        numaralı veri bitini values[j] yapar. Üç argüman birbirine yayınlanır (broadcast); örneğin tüm
+        sözcüklerde 3 numaralı biti 1 yapmak için update_batch(cw, np.arange(len(cw)), 3, 1).
+        Aynı (sözcük, bit) çifti birden fazla verilirse sonuncusu geçerlidir.
+        Dönüş: güncellenmiş kod sözcüğü dizisi (kopya; sonuç encode_batch(yeni_veri) ile aynıdır).
+        """
+        tables = self._get_numpy_tables()
+        lanes = self.codeword_lanes
+        cw = self._check_words(codewords, self.n, lanes, self.codeword_dtype, "Kod sözcüğü").copy()
+        if cw.ndim != (2 if lanes else 1):
+            raise ValueError("Kod sözcükleri tek boyutlu bir sözcük dizisi olmalıdır.")
+        words, bits, values = (a.reshape(-1) for a in np.broadcast_arrays(
+            np.asarray(word_indices, dtype=np.int64), np.asarray(bit_indices, dtype=np.int64), np.asarray(values)))
+        if bits.size and (bits.min() < 0 or bits.max() >= self.k):
+            raise ValueError(f"Veri biti indeksi 0 ile {self.k - 1} arasında olmalıdır.")
+        if words.size and (words.min() < 0 or words.max() >= len(cw)):
+            raise ValueError(f"Sözcük indeksi 0 ile {len(cw) - 1} arasında olmalıdır.")
+        if not np.isin(values, (0, 1)).all():
+            raise ValueError("Bit değerleri 0 veya 1 olmalıdır.")
+
+        # Son yazan kazanır: ters çevrilmiş dizide her anahtarın ilk görüldüğü yer
+        _, last = np.unique((words * self.k + bits)[::-1], return_index=True)
+        keep = len(words) - 1 - last
+        words, bits, values = words[keep], bits[keep], values[keep].astype(np.uint8)
+
+        shifts = tables["data_shifts"][bits]
+        if lanes:
+            current = (cw[words, shifts >> 6] >> (shifts & 63).astype(np.uint64)) & np.uint64(1)
+        else:
+            current = (cw[words] >> shifts.astype(self.codeword_dtype)) & self.codeword_dtype.type(1)
+        flip = current.astype(np.uint8) != values
+        # Anahtarlar tekil olsa da aynı sözcük birden çok kez görünebilir; at() birikimli XOR yapar
+        np.bitwise_xor.at(cw, words[flip], tables["data_columns"][bits[flip]])
+        return cw
+
+    @property
+    def codeword_bytes(self):
+        """ encode_into/decode_into'da (paketlenmemiş düzende) kod sözcüğü başına bayt sayısı """
+        return (self.n + 7) // 8
+
+    def _buffer_word_bytes(self):
+        if self.k % 8:
+            raise ValueError("Tampon API'si için veri bitleri 8'in katı olmalıdır.")
+        return self.k // 8
+
+    @staticmethod
+    def _write_buffer(out, payload, what):
+        dst = _byte_view(out, writable=True)
+        if len(dst) < payload.size:
+            raise ValueError(f"{what} tamponu çok küçük: {payload.size} bayt gerekli, {len(dst)} bayt var.")
+        dst[:payload.size] = payload.reshape(-1)
+
+    def encode_into(self, data, out, packed=False):
+        """
+        Tampon protokolünü destekleyen bir nesnedeki (bytes, bytearray, memoryview, mmap, ...) veriyi kodlar
+        ve kod sözcüklerini çağıranın verdiği yazılabilir out tamponunun başına yazar; Python listesi oluşturulmaz.
+        Veri sözcüğü başına k/8 bayt (büyük-endian). Her kod sözcüğü codeword_bytes bayta sağa hizalı,
+        büyük-endian yazılır; packed=True ise pack_codewords düzeninde boşluksuz paketlenir.
+        Dönüş: kodlanan sözcük sayısı.
+        """
+        word_bytes = self._buffer_word_bytes()
+        src = _byte_view(data)
+        if len(src) % word_bytes:
+            raise ValueError(f"Veri uzunluğu {word_bytes} baytın katı olmalıdır.")
+        count = len(src) // word_bytes
+        if not count:
+            return 0  # Boş girdi: tablolar/yeniden şekillendirme gerekmez, çıkışa dokunulmaz
+        codewords = self.encode_batch(_values_from_byte_rows(src.reshape(count, word_bytes), self.k))
+        if packed:
+            payload = _pack_codeword_bits(codewords, self.n)
+        else:
+            rows = _values_to_be_bytes(codewords)
+            payload = rows[:, rows.shape[1] - self.codeword_bytes:]
+        self._write_buffer(out, payload, "Çıkış")
+        return count
+
+    def decode_into(self, codewords, data_out, status_out=None, packed=False):
+        """
+        encode_into'nun tersi: codewords tamponundaki kod sözcüklerini çözer, düzeltilmiş veriyi data_out'a
+        (sözcük başına k/8 bayt) ve durum kodlarını (0/1/2/3, sözcük başına 1 bayt) status_out'a yerinde yazar.
+        Sonuçlar yazılmadan önce hesaplandığından data_out giriş tamponuyla örtüşebilir.
+        packed=True ise sözcük sayısı tampon uzunluğundan çıkarılır (tam sığan kod sözcükleri).
+        Dönüş: çözülen sözcük sayısı.
+        """
+        word_bytes = self._buffer_word_bytes()
+        src = _byte_view(codewords)
+        count = len(src) * 8 // self.n if packed else len(src) // self.codeword_bytes
+        if not packed and len(src) % self.codeword_bytes:
+            raise ValueError(f"Kod sözcüğü tamponu {self.codeword_bytes} baytın katı olmalıdır.")
+        if not count:
+            return 0
+        if packed:
+            bits = np.unpackbits(src, count=count * self.n).reshape(count, self.n)
+            received = _values_from_bit_rows(bits, self.n)
+        else:
+            received = _values_from_byte_rows(src.reshape(count, self.codeword_bytes), self.n)
+        data, status, _ = self.decode_batch(received)
+        rows = _values_to_be_bytes(data)
+        self._write_buffer(data_out, rows[:, rows.shape[1] - word_bytes:], "Veri")
+        if status_out is not None:
+            self._write_buffer(status_out, status, "Durum")
+        return count
+
+    def _check_bits(self):
+        """ Her kontrol biti için (ad, kod sözcüğü tamsayısındaki bit indeksi, kod çözücünün XOR'ladığı bit maskesi) """
+        checks = [(f"P{p}", self.n - p, mask) for p, mask in zip(self.parity_positions_sec, self.parity_masks)]
+        checks.append(("Po", 0, self.codeword_mask))  # Genel eşlik kontrolü tüm n biti kapsar
+        return checks
+
+    def xor_tree_report(self):
+        """
+        Her kontrol biti için 2 girişli XOR ağacı donanım maliyeti.
+        Kodlayıcı girişleri: kontrol bitini belirleyen veri bitleri; kod çözücü girişleri: kontrole giren tüm bitler.
+        Dönüş: [{"check", "encoder_inputs", "encoder_gates", "encoder_depth",
+                 "decoder_inputs", "decoder_gates", "decoder_depth"}, ...]
+        """
+        unit_codewords = [self.encode_int(1 << t) for t in range(self.k)]
+        report = []
+        for name, bit, decoder_mask in self._check_bits():
+            encoder_inputs = sum((cw >> bit) & 1 for cw in unit_codewords)
+            decoder_inputs = _popcount(decoder_mask)
+            report.append({
+                "check": name,
+                "encoder_inputs": encoder_inputs,
+                "encoder_gates": max(encoder_inputs - 1, 0),
+                "encoder_depth": max(encoder_inputs - 1, 0).bit_length(),
+                "decoder_inputs": decoder_inputs,
+                "decoder_gates": max(decoder_inputs - 1, 0),
+                "decoder_depth": max(decoder_inputs - 1, 0).bit_length(),
+            })
+        return report
+
+    def introduce_single_error(self, codeword_list, position=None):
+        """ Pozisyon 1-indekslidir """
+        if position is None:
+            position = random.randint(1, self.n) # Hata için 1-indeksli pozisyon
+        
+        if not (1 <= position <= self.n):
+            raise ValueError(f"Hata pozisyonu {position} [1, {self.n}] aralığının dışında")
+
+        corrupted = list(codeword_list)
+        corrupted[position - 1] = 1 - corrupted[position - 1] # 0-indeksli pozisyondaki biti çevir
+        return corrupted, position
+
+    def introduce_double_error(self, codeword_list, pos1=None, pos2=None):
+        """ pos1 ve pos2 1-indekslidir """
+        if pos1 is None or pos2 is None: # Rastgele farklı pozisyonlar seç
+            indices = random.sample(range(self.n), 2) # 0-indeksli indeksler
+            p1_idx, p2_idx = indices[0], indices[1]
+        else: # pozisyonlar 1-tabanlıdır
+            if not (1 <= pos1 <= self.n and 1 <= pos2 <= self.n and pos1 != pos2):
+                raise ValueError(f"Hata pozisyonları ({pos1},{pos2}) [1, {self.n}] aralığı için geçersiz veya aynı")
+            p1_idx = pos1 - 1
+            p2_idx = pos2 - 1
+
+        corrupted = list(codeword_list)
+        corrupted[p1_idx] = 1 - corrupted[p1_idx]
+        corrupted[p2_idx] = 1 - corrupted[p2_idx]
+        return corrupted, (p1_idx + 1, p2_idx + 1) # 1-indeksli pozisyonları döndür
+
+
+# --- İkili dosya/akış koruma (HSD1 akış biçimi) ---
+
+STREAM_MAGIC = b"HSD1"
+INTERLEAVED_STREAM_MAGIC = b"HSI1"  # Serpiştirilmiş akış (bkz. hamming_interleave)
+# Akış başlığı k'yı tek baytta tutar; 8'in katı olan en büyük değer
+MAX_STREAM_DATA_BITS = 248
+DEFAULT_CHUNK_SIZE = 1 << 20  # 1 MiB
+
+
+def words_from_bytes(chunk, k):
+    """ Bayt dizisini k-bitlik büyük-endian veri sözcüklerine böler (son sözcük sıfırla doldurulur) """
+    _require_numpy()
+    word_bytes = k // 8
+    remainder = len(chunk) % word_bytes
+    if remainder:
+        chunk = bytes(chunk) + b"\0" * (word_bytes - remainder)
+    rows = np.frombuffer(chunk, dtype=np.uint8).reshape(-1, word_bytes)
+    return _values_from_byte_rows(rows, k)
+
+
+def bytes_from_words(words, k, num_bytes):
+    """ words_from_bytes'ın tersi; yalnızca ilk num_bytes baytı döndürür """
+    _require_numpy()
+    rows = _values_to_be_bytes(words)
+    return rows[:, rows.shape[1] - k // 8:].tobytes()[:num_bytes]
+
+
+def _pack_codeword_bits(codewords, n):
+    bits = np.unpackbits(_values_to_be_bytes(codewords), axis=1)
+    return np.packbits(bits[:, bits.shape[1] - n:])
+
+
+def pack_codewords(codewords, n):
+    """ n-bitlik kod sözcüklerini aralarında boşluk olmadan bit akışına paketler """
+    _require_numpy()
+    return _pack_codeword_bits(codewords, n).tobytes()
+
+
+def unpack_codewords(buf, n, count):
+    """ pack_codewords'ün tersi: paketlenmiş akıştan count adet kod sözcüğü çıkarır """
+    _require_numpy()
+    bits = np.unpackbits(np.frombuffer(buf, dtype=np.uint8), count=count * n).reshape(count, n)
+    return _values_from_bit_rows(bits, n)
+
+
+def _read_exact(stream, size):
+    """ Akıştan tam olarak size bayt okur (dosya sonunda daha az dönebilir) """
+    parts = []
+    while size > 0:
+        part = stream.read(size)
+        if not part:
+            break
+        parts.append(part)
+        size -= len(part)
+    return b"".join(parts)
+
+
+def encode_stream(hamming, src, dst, chunk_size=DEFAULT_CHUNK_SIZE, interleaver=None):
+    """
+    src akışını chunk_size baytlık parçalar halinde okuyup kodlar ve dst'ye yazar.
+    Biçim: STREAM_MAGIC + k (1 bayt), ardından her parça için
+    [veri bayt sayısı (4 bayt, büyük-endian)][paketlenmiş kod sözcükleri].
+    interleaver verilirse (bkz. hamming_interleave) başlık INTERLEAVED_STREAM_MAGIC + k + serpiştirme
+    parametreleridir ve her parçanın kod sözcükleri kendi içinde serpiştirilir.
+    Dönüş: kodlanan sözcük sayısı.
+    """
+    if hamming.k % 8:
+        raise ValueError("Akış kodlama için veri bitleri 8'in katı olmalıdır.")
+    if hamming.k > MAX_STREAM_DATA_BITS:
+        raise ValueError(f"Akış başlığı en fazla {MAX_STREAM_DATA_BITS} veri bitini destekler; "
+                         "daha geniş sözcükler için kapsayıcı biçimini kullanın.")
+    word_bytes = hamming.k // 8
+    chunk_size = max(word_bytes, chunk_size - chunk_size % word_bytes)
+
+    if interleaver is None:
+        dst.write(STREAM_MAGIC + bytes([hamming.k]))
+    else:
+        from hamming_interleave import interleave_codewords, interleaver_header
+        dst.write(INTERLEAVED_STREAM_MAGIC + bytes([hamming.k]) + interleaver_header(interleaver))
+    total_words = 0
+    while True:
+        chunk = src.read(chunk_size)
+        if not chunk:
+            break
+        codewords = hamming.encode_batch(words_from_bytes(chunk, hamming.k))
+        dst.write(len(chunk).to_bytes(4, "big"))
+        if interleaver is None:
+            dst.write(pack_codewords(codewords, hamming.n))
+        else:
+            dst.write(interleave_codewords(codewords, hamming.n, interleaver))
+        total_words += len(codewords)
+    return total_words
+
+
+def iter_stream_codewords(src):
+    """
+    encode_stream çıktısının (serpiştirilmiş olsa da) kod sözcüklerini parça parça okur; çözmez.
+    İlk olarak HammingSECDED örneğini, ardından her parça için (veri bayt sayısı, kod sözcüğü dizisi) üretir.
+    """
+    header = _read_exact(src, len(STREAM_MAGIC) + 1)
+    magic = header[:len(STREAM_MAGIC)]
+    if len(header) != len(STREAM_MAGIC) + 1 or magic not in (STREAM_MAGIC, INTERLEAVED_STREAM_MAGIC):
+        raise ValueError("Geçersiz akış başlığı (Hamming SEC-DED akışı değil).")
+    hamming = HammingSECDED(header[-1])
+    hamming._get_numpy_tables()
+    interleaver = None
+    if magic != STREAM_MAGIC:
+        # Serpiştirilmiş akış (INTERLEAVED_STREAM_MAGIC)
+        from hamming_interleave import INTERLEAVE_HEADER, deinterleave_codewords, interleaver_from_header
+        interleaver_bytes = _read_exact(src, INTERLEAVE_HEADER.size)
+        if len(interleaver_bytes) != INTERLEAVE_HEADER.size:
+            raise ValueError("Akış beklenmedik şekilde sona erdi (serpiştirme başlığı eksik).")
+        interleaver = interleaver_from_header(interleaver_bytes, hamming.n)
+    word_bytes = hamming.k // 8
+    yield hamming
+
+    while True:
+        frame_header = _read_exact(src, 4)
+        if not frame_header:
+            break
+        if len(frame_header) != 4:
+            raise ValueError("Akış beklenmedik şekilde sona erdi (parça başlığı eksik).")
+        num_bytes = int.from_bytes(frame_header, "big")
+        count = -(-num_bytes // word_bytes)
+        payload_bits = count * hamming.n if interleaver is None else interleaver.channel_length(count)
+        payload = _read_exact(src, -(-payload_bits // 8))
+        if len(payload) * 8 < payload_bits:
+            raise ValueError("Akış beklenmedik şekilde sona erdi (kod sözcükleri eksik).")
+
+        if interleaver is None:
+            yield num_bytes, unpack_codewords(payload, hamming.n, count)
+        else:
+            yield num_bytes, deinterleave_codewords(payload, hamming.n, count, interleaver)
+
+
+def decode_stream(src, dst, max_offsets=1000, location_stats=None):
+    """
+    encode_stream çıktısını (serpiştirilmiş olsa da) çözer, tek hataları düzeltir ve veriyi dst'ye yazar
+    (dst None ise yalnızca doğrulanır).
+    location_stats: verilirse (bkz. hamming_stats.ErrorLocationStats) her parçanın sonuçları eklenir.
+    Dönüş: {"k", "words", "status_counts" (durum kodu 0..3 başına), "uncorrectable",
+            "uncorrectable_offsets" (düzeltilemez sözcüklerin orijinal veri bayt ofsetleri, en fazla max_offsets)}
+    """
+    frames = iter_stream_codewords(src)
+    hamming = next(frames)
+    word_bytes = hamming.k // 8
+
+    stats = {"k": hamming.k, "words": 0, "status_counts": [0, 0, 0, 0],
+             "uncorrectable": 0, "uncorrectable_offsets": []}
+    for num_bytes, codewords in frames:
+        count = len(codewords)
+        data, status, syndromes = hamming.decode_batch(codewords)
+        if dst is not None:
+            dst.write(bytes_from_words(data, hamming.k, num_bytes))
+        if location_stats is not None:
+            location_stats.add_batch(hamming, status, syndromes)
+
+        counts = np.bincount(status, minlength=4)
+        for code in range(4):
+            stats["status_counts"][code] += int(counts[code])
+        bad = np.flatnonzero(status == 2)
+        stats["uncorrectable"] += len(bad)
+        room = max_offsets - len(stats["uncorrectable_offsets"])
+        if room > 0:
+            stats["uncorrectable_offsets"].extend(
+                int(stats["words"] + i) * word_bytes for i in bad[:room])
+        stats["words"] += count
+    return stats
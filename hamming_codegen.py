@@ -0,0 +1,162 @@
+"""
+Kod boyutuna özel, döngüsüz (straight-line) kodlayıcı/kod çözücü üreteci.
+
+Belirli bir k için her eşlik bitinin kapsadığı pozisyonlar sabittir. generate_source bu kapsama
+kümelerinden açık XOR ifadeleri içeren bit listesi fonksiyonları ve bayt dilimli tablo aramaları
+açık yazılmış tamsayı fonksiyonları üretir; compile_codec bunu compile/exec ile bir kez derler.
+Üretim yalnızca data_columns, syndrome_columns, data_positions, syndrome_lut ve bayt tablolarına
+dayandığından Hamming ve Hsiao düzenlerinin ikisinde de çalışır. Üretilen fonksiyonlar genel
+yolla bit bit aynı sonucu verir (bkz. hamming_verify.verify_compiled) ancak ölçümleme kaydetmez.
+
+    fast = HammingSECDED(8).compiled()   # örnekte saklanır
+    codeword = fast.encode([1, 0, 1, 1, 0, 0, 1, 0])
+    data, status, syndrome = fast.decode(codeword)
+    print(fast.source)
+"""
+
+__all__ = ["CompiledCodec", "generate_source", "compile_codec"]
+
+# Üretilen fonksiyonların adları
+FUNCTIONS = ("encode", "syndrome", "decode", "encode_int", "decode_int")
+
+
+class CompiledCodec:
+    """ Üretilmiş fonksiyonlar: encode, syndrome, decode (bit listeleri), encode_int, decode_int """
+
+    def __init__(self, code, source, namespace):
+        self.variant = code.variant
+        self.k = code.k
+        self.n = code.n
+        self.source = source
+        for name in FUNCTIONS:
+            setattr(self, name, namespace[name])
+
+    def __repr__(self):
+        return f"<CompiledCodec {self.variant}({self.n},{self.k})>"
+
+
+def _xor_expr(names):
+    return " ^ ".join(names) if names else "0"
+
+
+def _shift(amount):
+    return f" << {amount}" if amount else ""
+
+
+def _unpack(names, source_name):
+    # Tek elemanlı listede "a, = bits" biçimi gerekir
+    return f"{', '.join(names)}{',' if len(names) == 1 else ''} = {source_name}"
+
+
+def generate_source(code):
+    """
+    code için encode/syndrome/decode (bit listeleri) ve encode_int/decode_int (tamsayılar) kaynak kodu.
+    Liste fonksiyonları her biti yerel bir değişkene açar ve her eşlik/sendrom bitini kapsadığı bitlerin
+    XOR'u olarak yazar; tamsayı fonksiyonları kod sözcüğünün her baytı için tek tablo araması yapar.
+    """
+    n, k = code.n, code.k
+    sec_shift = 0 if code.overall_parity_position is None else 1
+    width = max(code.syndrome_columns).bit_length()
+    data_names = [f"d{i}" for i in range(k)]
+    cw_names = [f"c{p}" for p in range(1, n + 1)]
+
+    # Kod sözcüğü tamsayısının b biti (1-indeksli pozisyon n - b) hangi veri bitlerinden oluşur
+    cover = [[data_names[i] for i in range(k) if (code.data_columns[i] >> b) & 1] for b in range(n)]
+    # Genişletilmiş sendromun j biti hangi kod sözcüğü bitlerini kapsar
+    syndrome_terms = [[cw_names[p - 1] for p in range(1, n + 1) if (code.syndrome_columns[n - p] >> j) & 1]
+                      for j in range(width)]
+    data_cw_names = [cw_names[p - 1] for p in code.data_positions]
+
+    lines = [f"# {code.variant}({n},{k}) için üretildi; elle düzenlemeyin", ""]
+
+    lines.append("def encode(data_bits):")
+    lines.append(f"    if len(data_bits) != {k}:")
+    lines.append(f"        raise ValueError('Veri biti listesinin uzunluğu {k} olmalıdır.')")
+    lines.append(f"    {_unpack(data_names, 'data_bits')}")
+    lines.append("    return [")
+    for p in range(1, n + 1):
+        lines.append(f"        {_xor_expr(cover[n - p])},")
+    lines.append("    ]")
+    lines.append("")
+
+    syndrome_bits = [f"s{j}" for j in range(width)]
+    syndrome_body = [f"    {_unpack(cw_names, 'received')}"]
+    syndrome_body += [f"    {name} = {_xor_expr(terms)}" for name, terms in zip(syndrome_bits, syndrome_terms)]
+    ext_expr = " | ".join(name if j == 0 else f"{name} << {j}" for j, name in enumerate(syndrome_bits))
+    check = [f"    if len(received) != {n}:",
+             f"        raise ValueError('Alınan kod sözcüğünün uzunluğu {n} olmalıdır.')"]
+
+    lines.append("def syndrome(received):")
+    lines.append("    \"\"\" Dönüş: (sendrom_degeri, genel_eslik_dogru_mu) \"\"\"")
+    lines += check + syndrome_body
+    if sec_shift:
+        sec_expr = " | ".join(f"{name} << {j - 1}" if j > 1 else name for j, name in enumerate(syndrome_bits) if j)
+        lines.append(f"    return {sec_expr or '0'}, not s0")
+    else:
+        lines.append(f"    return {ext_expr}, not ({_xor_expr(syndrome_bits)})")
+    lines.append("")
+
+    lines.append("def decode(received):")
+    lines.append("    \"\"\" Dönüş: (duzeltilmis_veri_bitleri, hata_durum_kodu, sendrom_degeri) \"\"\"")
+    lines += check + syndrome_body
+    lines.append(f"    ext = {ext_expr}")
+    lines.append(f"    data = [{', '.join(data_cw_names)}]")
+    lines.append("    flip = FLIP[ext]")
+    lines.append("    if flip >= 0:")
+    lines.append("        data[flip] ^= 1")
+    lines.append(f"    return data, STATUS[ext], ext{f' >> {sec_shift}' if sec_shift else ''}")
+    lines.append("")
+
+    # Tamsayı fonksiyonları encode_int/decode_int'in bayt dilimli tablo döngüsünü açık yazar:
+    # her bayt için tek arama, döngü ve öznitelik erişimi yok (tablolar E/S/X adlarıyla bağlanır)
+    def byte_of(name, i, count):
+        if i == 0:
+            return f"{name} & 0xff" if count > 1 else name
+        return f"({name} >> {8 * i}) & 0xff" if i < count - 1 else f"{name} >> {8 * i}"
+
+    count = len(code.encode_tables)
+    lines.append("def encode_int(data):")
+    lines.append(f"    if not 0 <= data <= {code.data_mask:#x}:")
+    lines.append(f"        raise ValueError('Veri 0 ile {code.data_mask} arasında olmalıdır.')")
+    lines.append("    return (" + "\n            ^ ".join(f"E{i}[{byte_of('data', i, count)}]" for i in range(count)) + ")")
+    lines.append("")
+
+    count = len(code.decode_tables)
+    lines.append("def decode_int(codeword):")
+    lines.append("    \"\"\" Dönüş: (duzeltilmis_veri, hata_durum_kodu, sendrom_degeri) \"\"\"")
+    lines.append(f"    if not 0 <= codeword <= {code.codeword_mask:#x}:")
+    lines.append(f"        raise ValueError('Kod sözcüğü 0 ile {code.codeword_mask} arasında olmalıdır.')")
+    for i in range(count):
+        op = " ^=" if i else " ="
+        lines.append(f"    b = {byte_of('codeword', i, count)}")
+        lines.append(f"    ext{op} S{i}[b]")
+        lines.append(f"    data{op} X{i}[b]")
+    lines.append("    status, fix = LUT[ext]")
+    lines.append(f"    return data ^ fix, status, ext{f' >> {sec_shift}' if sec_shift else ''}")
+    lines.append("")
+    return "\n".join(lines)
+
+
+def _decode_tables(code):
+    """ Genişletilmiş sendrom -> durum kodu ve düzeltilecek veri biti indeksi (-1: yok) """
+    status = [entry[0] for entry in code.syndrome_lut]
+    flip = [-1] * len(code.syndrome_lut)
+    index_of_bit = {1 << (code.k - 1 - i): i for i in range(code.k)}
+    for ext, (_, data_fix) in enumerate(code.syndrome_lut):
+        if data_fix:
+            flip[ext] = index_of_bit[data_fix]
+    return tuple(status), tuple(flip)
+
+
+def compile_codec(code):
+    """ generate_source çıktısını derler; HammingSECDED.compiled() sonucu örnekte saklar """
+    source = generate_source(code)
+    status, flip = _decode_tables(code)
+    namespace = {"STATUS": status, "FLIP": flip, "LUT": tuple(code.syndrome_lut)}
+    for i, table in enumerate(code.encode_tables):
+        namespace[f"E{i}"] = tuple(table)
+    for i, (syndrome_table, extract_table) in enumerate(code.decode_tables):
+        namespace[f"S{i}"] = tuple(syndrome_table)
+        namespace[f"X{i}"] = tuple(extract_table)
+    exec(compile(source, f"<hamming_codegen {code.variant}({code.n},{code.k})>", "exec"), namespace)
+    return CompiledCodec(code, source, namespace)
@@ -0,0 +1,325 @@
+"""
+Hamming SEC-DED paketlenmiş kod sözcüğü kapsayıcı biçimi (HSCF).
+
+Kod sözcükleri aralarında boşluk olmadan paketlenir (örneğin (13,8) için sözcük başına 13 bit).
+Dosya düzeni (tüm tamsayılar büyük-endian):
+    Başlık:  HEADER_STRUCT alanları + eşlik düzeni (p_sec SEC eşlik pozisyonu,
+             k veri pozisyonu ve genel eşlik pozisyonu, her biri 2 bayt), 8 bayta hizalı
+    Bloklar: her blok block_words kod sözcüğü içerir ve bir bayt sınırında başlar
+    İndeks:  blok başına bir adet 8 baytlık dosya ofseti
+Okuma tarafı dosyayı mmap ile açar; herhangi bir sözcük tüm dosya okunmadan çözülebilir.
+"""
+
+import mmap
+import struct
+from collections import OrderedDict
+
+import numpy as np
+
+from hamming import HammingSECDED, bytes_from_words, pack_codewords, unpack_codewords, words_from_bytes
+
+CONTAINER_MAGIC = b"HSCF"
+CONTAINER_VERSION = 1
+DEFAULT_BLOCK_WORDS = 4096
+
+# magic, sürüm, k, n, p_sec, blok başına sözcük, sözcük sayısı, veri bayt sayısı, indeks ofseti, blok sayısı
+HEADER_STRUCT = struct.Struct(">4sBHHBIQQQI")
+
+
+def _header_size(hamming):
+    size = HEADER_STRUCT.size + 2 * (hamming.p_sec + hamming.k + 1)
+    return (size + 7) // 8 * 8
+
+
+def _layout(hamming):
+    return [*hamming.parity_positions_sec, *hamming.data_positions, hamming.overall_parity_position]
+
+
+class ContainerWriter:
+    """
+    Veriyi HSCF kapsayıcısına yazar. Bellekte en fazla bir blokluk veri tutulur.
+    Kullanım:
+        with ContainerWriter("goruntu.hscf", 32) as writer:
+            writer.write(parca)
+    """
+
+    def __init__(self, path, k_data_bits, block_words=DEFAULT_BLOCK_WORDS):
+        if block_words <= 0:
+            raise ValueError("Blok başına sözcük sayısı pozitif olmalıdır.")
+        self.hamming = HammingSECDED(k_data_bits)
+        if self.hamming.k % 8:
+            raise ValueError("Kapsayıcı için veri bitleri 8'in katı olmalıdır.")
+        self.block_words = block_words
+        self.block_bytes = block_words * (self.hamming.k // 8)
+        self.num_words = 0
+        self.data_bytes = 0
+        self.block_offsets = []
+        self._pending = bytearray()
+        self._file = open(path, "wb")
+        self._file.write(b"\0" * _header_size(self.hamming))  # Başlık close() sırasında yazılır
+
+    def write(self, data):
+        """ Bayt benzeri veriyi ekler; dolan bloklar hemen kodlanıp diske yazılır """
+        self._pending += data
+        self.data_bytes += len(data)
+        full = len(self._pending) - len(self._pending) % self.block_bytes
+        for start in range(0, full, self.block_bytes):
+            self._write_block(self._pending[start:start + self.block_bytes])
+        del self._pending[:full]
+
+    def _write_block(self, chunk):
+        codewords = self.hamming.encode_batch(words_from_bytes(bytes(chunk), self.hamming.k))
+        self.block_offsets.append(self._file.tell())
+        self._file.write(pack_codewords(codewords, self.hamming.n))
+        self.num_words += len(codewords)
+
+    def close(self):
+        if self._file.closed:
+            return
+        if self._pending:
+            self._write_block(self._pending)
+            self._pending = bytearray()
+        index_offset = self._file.tell()
+        self._file.write(np.array(self.block_offsets, dtype=">u8").tobytes())
+
+        h = self.hamming
+        self._file.seek(0)
+        self._file.write(HEADER_STRUCT.pack(CONTAINER_MAGIC, CONTAINER_VERSION, h.k, h.n, h.p_sec,
+                                            self.block_words, self.num_words, self.data_bytes,
+                                            index_offset, len(self.block_offsets)))
+        self._file.write(struct.pack(f">{len(_layout(h))}H", *_layout(h)))
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def write_container(path, src, k_data_bits, block_words=DEFAULT_BLOCK_WORDS, chunk_size=1 << 20):
+    """ src akışının tamamını HSCF kapsayıcısına yazar. Dönüş: kodlanan sözcük sayısı. """
+    with ContainerWriter(path, k_data_bits, block_words) as writer:
+        while True:
+            chunk = src.read(chunk_size)
+            if not chunk:
+                break
+            writer.write(chunk)
+    return writer.num_words
+
+
+class CodewordContainer:
+    """
+    HSCF kapsayıcısını mmap üzerinden açar (kopyalamadan).
+    writable=True ile scrub(correct=True) düzeltilmiş kod sözcüklerini dosyaya geri yazar.
+    """
+
+    def __init__(self, path, writable=False):
+        self._file = open(path, "r+b" if writable else "rb")
+        try:
+            self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_WRITE if writable else mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError("Dosya HSCF başlığı için çok kısa.") from None
+        try:
+            self._parse_header()
+        except Exception:
+            self.close()
+            raise
+
+    def _parse_header(self):
+        """ Başlığı, eşlik düzenini ve blok indeksini okur; bozuk veya kesik dosyalarda ValueError verir """
+        size = len(self._mm)
+        if size < HEADER_STRUCT.size:
+            raise ValueError("Dosya HSCF başlığı için çok kısa.")
+        (magic, version, k, n, p_sec, self.block_words, self.num_words, self.data_bytes,
+         index_offset, num_blocks) = HEADER_STRUCT.unpack_from(self._mm, 0)
+        if magic != CONTAINER_MAGIC:
+            raise ValueError("Geçersiz kapsayıcı başlığı (HSCF dosyası değil).")
+        if version != CONTAINER_VERSION:
+            raise ValueError(f"Desteklenmeyen kapsayıcı sürümü: {version}")
+        if k < 8 or k % 8:
+            raise ValueError(f"Kapsayıcı başlığındaki veri biti sayısı geçersiz: {k}")
+        # Düzen tablosu dosyaya sığmalıdır (k, tablolar kurulmadan önce dosya boyutuyla sınırlanır)
+        header_size = (HEADER_STRUCT.size + 2 * (p_sec + k + 1) + 7) // 8 * 8
+        if header_size > size:
+            raise ValueError("Kapsayıcı başlığı kesik (eşlik düzeni dosya sınırlarının dışında).")
+
+        self.hamming = HammingSECDED(k)
+        if (n, p_sec) != (self.hamming.n, self.hamming.p_sec):
+            raise ValueError("Kapsayıcıdaki eşlik düzeni bu kod çözücü ile uyumlu değil.")
+        layout = list(struct.unpack_from(f">{p_sec + k + 1}H", self._mm, HEADER_STRUCT.size))
+        if layout != _layout(self.hamming):
+            raise ValueError("Kapsayıcıdaki eşlik düzeni bu kod çözücü ile uyumlu değil.")
+        self.word_bytes = k // 8
+
+        # Sayıların birbiriyle tutarlılığı
+        if self.block_words < 1:
+            raise ValueError("Kapsayıcı başlığında blok başına sözcük sayısı geçersiz.")
+        if self.num_words != -(-self.data_bytes // self.word_bytes):
+            raise ValueError("Kapsayıcı başlığı tutarsız: sözcük sayısı veri bayt sayısıyla uyuşmuyor.")
+        if num_blocks != -(-self.num_words // self.block_words):
+            raise ValueError("Kapsayıcı başlığı tutarsız: blok sayısı sözcük sayısıyla uyuşmuyor.")
+        if index_offset < header_size or index_offset + 8 * num_blocks > size:
+            raise ValueError("Kapsayıcı indeksi dosya sınırlarının dışında.")
+
+        self.hamming._get_numpy_tables()
+        # İndeks küçüktür (blok başına 8 bayt); mmap'e referans tutmamak için kopyalanır
+        self.block_offsets = np.frombuffer(self._mm, dtype=">u8", count=num_blocks, offset=index_offset).astype(np.uint64)
+        if num_blocks:
+            # Her bloğun kod sözcükleri başlık ile indeks arasında kalmalıdır
+            counts = np.full(num_blocks, self.block_words, dtype=np.uint64)
+            counts[-1] = self.num_words - (num_blocks - 1) * self.block_words
+            ends = self.block_offsets + (counts * np.uint64(self.hamming.n) + np.uint64(7)) // np.uint64(8)
+            if int(self.block_offsets.min()) < header_size or int(ends.max()) > index_offset:
+                raise ValueError("Kapsayıcı bloğu dosya sınırlarının dışında (kesik veya bozuk dosya).")
+
+    @property
+    def num_blocks(self):
+        return len(self.block_offsets)
+
+    def __len__(self):
+        return self.num_words
+
+    def block_range(self, block):
+        """ Dönüş: (ilk sözcük indeksi, bloktaki sözcük sayısı) """
+        start = block * self.block_words
+        return start, min(self.block_words, self.num_words - start)
+
+    def codeword(self, index):
+        """ index numaralı kod sözcüğünü tamsayı olarak döndürür (yalnızca ilgili baytlar okunur) """
+        if not 0 <= index < self.num_words:
+            raise IndexError(f"Sözcük indeksi {index} [0, {self.num_words}) aralığının dışında")
+        n = self.hamming.n
+        block, within = divmod(index, self.block_words)
+        bit_offset = int(self.block_offsets[block]) * 8 + within * n
+        start = bit_offset >> 3
+        num_bytes = ((bit_offset & 7) + n + 7) >> 3
+        value = int.from_bytes(self._mm[start:start + num_bytes], "big")
+        return (value >> (num_bytes * 8 - (bit_offset & 7) - n)) & self.hamming.codeword_mask
+
+    def decode_word(self, index):
+        """ Dönüş: decode_int ile aynı (veri, durum_kodu, sendrom) """
+        return self.hamming.decode_int(self.codeword(index))
+
+    def read_block(self, block):
+        """ Bir bloğun kod sözcüklerini NumPy dizisi olarak döndürür """
+        _, count = self.block_range(block)
+        offset = int(self.block_offsets[block])
+        num_bytes = -(-count * self.hamming.n // 8)
+        with memoryview(self._mm)[offset:offset + num_bytes] as payload:
+            return unpack_codewords(payload, self.hamming.n, count)
+
+    def decode_block(self, block):
+        """ Dönüş: decode_batch ile aynı (veri, durum_kodları, sendromlar) dizileri """
+        return self.hamming.decode_batch(self.read_block(block))
+
+    def _write_block(self, block, codewords):
+        offset = int(self.block_offsets[block])
+        packed = pack_codewords(codewords, self.hamming.n)
+        self._mm[offset:offset + len(packed)] = packed
+
+    def scrub(self, correct=False, dst=None, max_offsets=1000, location_stats=None, blocks=None):
+        """
+        Tüm blokları (veya blocks aralığını) sırayla çözer.
+        correct=True: tek hataları (durum 1 ve 3) yeniden kodlayarak dosyada yerinde düzeltir.
+        dst: verilirse düzeltilmiş orijinal veri bu akışa yazılır (aralığın ilk bloğunun verisinden başlayarak).
+        location_stats: verilirse (bkz. hamming_stats.ErrorLocationStats) her bloğun sonuçları eklenir.
+        blocks: işlenecek blok indeksleri (range); paralel taramada dosya bloklara bölünür.
+        Dönüş: main.decode_stream ile aynı alanlara sahip istatistik sözlüğü.
+        """
+        stats = {"k": self.hamming.k, "words": 0, "status_counts": [0, 0, 0, 0],
+                 "uncorrectable": 0, "uncorrectable_offsets": []}
+        if blocks is None:
+            blocks = range(self.num_blocks)
+        remaining_bytes = self.data_bytes - (self.block_range(blocks[0])[0] * self.word_bytes if blocks else 0)
+        if hasattr(self._mm, "madvise") and hasattr(mmap, "MADV_SEQUENTIAL"):
+            self._mm.madvise(mmap.MADV_SEQUENTIAL)  # Çekirdek önden okumayı büyütür
+        for block in blocks:
+            start, _ = self.block_range(block)
+            codewords = self.read_block(block)
+            data, status, syndromes = self.hamming.decode_batch(codewords)
+            if location_stats is not None:
+                location_stats.add_batch(self.hamming, status, syndromes)
+
+            counts = np.bincount(status, minlength=4)
+            for code in range(4):
+                stats["status_counts"][code] += int(counts[code])
+            bad = np.flatnonzero(status == 2)
+            stats["uncorrectable"] += len(bad)
+            room = max_offsets - len(stats["uncorrectable_offsets"])
+            if room > 0:
+                stats["uncorrectable_offsets"].extend(int(start + i) * self.word_bytes for i in bad[:room])
+            stats["words"] += len(codewords)
+
+            if correct and (counts[1] or counts[3]):
+                fixable = (status == 1) | (status == 3)
+                if codewords.ndim == 2:  # Şeritli (64 bitten geniş) kod sözcükleri
+                    fixable = fixable[:, None]
+                self._write_block(block, np.where(fixable, self.hamming.encode_batch(data), codewords))
+            if dst is not None:
+                num_bytes = min(remaining_bytes, len(data) * self.word_bytes)
+                dst.write(bytes_from_words(data, self.hamming.k, num_bytes))
+                remaining_bytes -= num_bytes
+        if correct:
+            self._mm.flush()
+        return stats
+
+    def close(self):
+        if not self._mm.closed:
+            self._mm.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+class ContainerRows:
+    """
+    Kapsayıcının kod sözcüklerine satır indeksiyle tembel erişim (GUI'deki sanallaştırılmış görünüm için).
+    rows[i] i numaralı kod sözcüğünü (read_block satırı), rows.status[i] durum kodunu verir; yalnızca
+    istenen satırların blokları okunup çözülür ve son cache_blocks blok saklanır. Kapsayıcı açık kalmalıdır.
+    """
+
+    def __init__(self, container, cache_blocks=8):
+        self.container = container
+        self.cache_blocks = cache_blocks
+        self._cache = OrderedDict()
+        self.status = _StatusRows(self)
+
+    def block(self, block):
+        """ Dönüş: (kod sözcükleri, durum kodları); en son kullanılan bloklar önbellekte tutulur """
+        entry = self._cache.get(block)
+        if entry is None:
+            codewords = self.container.read_block(block)
+            _, status, _ = self.container.hamming.decode_batch(codewords)
+            entry = self._cache[block] = (codewords, status)
+            if len(self._cache) > self.cache_blocks:
+                self._cache.popitem(last=False)
+        else:
+            self._cache.move_to_end(block)
+        return entry
+
+    def __len__(self):
+        return len(self.container)
+
+    def __getitem__(self, index):
+        if not 0 <= index < len(self.container):
+            raise IndexError(f"Sözcük indeksi {index} [0, {len(self.container)}) aralığının dışında")
+        block, within = divmod(index, self.container.block_words)
+        return self.block(block)[0][within]
+
+
+class _StatusRows:
+    def __init__(self, rows):
+        self._rows = rows
+
+    def __len__(self):
+        return len(self._rows)
+
+    def __getitem__(self, index):
+        block, within = divmod(index, self._rows.container.block_words)
+        return self._rows.block(block)[1][within]
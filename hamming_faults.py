@@ -0,0 +1,154 @@
+"""
+Toplu ve tekrarlanabilir hata deseni (hata maskesi) üreteci.
+
+introduce_single_error/introduce_double_error tek bir bit listesi üzerinde çalışır. ErrorMaskGenerator
+ise bir kodun kod sözcüğü biçiminde (encode_batch çıktısıyla aynı tip: n <= 64 için tek boyutlu
+işaretsiz dizi, daha geniş kodlar için (N, şerit) uint64) XOR maskeleri üretir; maskeler tek bir
+vektör işlemiyle uygulanır:
+
+    faults = ErrorMaskGenerator(code, seed=1)
+    received = codewords ^ faults.exact_weight(len(codewords), 2)
+
+Modeller:
+    exact_weight  her maskede tam olarak t farklı pozisyon (düzgün dağılımlı),
+    bernoulli     her bit bağımsız olarak ber olasılıkla çevrilir,
+    burst         her maskede kod sözcüğü içinde kalan ardışık bir patlama,
+    targeted      verilen pozisyonlar (örneğin takılı hücreler) her maskede veya olasılıkla çevrilir.
+Rastgelelik yalnızca verilen tohumla (seed) oluşturulan numpy.random.Generator'dan gelir; aynı tohum
+ve aynı çağrı sırası aynı maskeleri verir. Pozisyonlar 1-indekslidir; maskeler pozisyon -> bit
+tablosundan dizin ile seçilip XOR ile birleştirilir (pozisyon 0 "çevirme yok" anlamına gelir).
+"""
+
+import math
+
+import numpy as np
+
+from hamming import _int_to_lanes
+
+__all__ = ["ErrorMaskGenerator", "mask_weights"]
+
+
+class ErrorMaskGenerator:
+    def __init__(self, code, seed=None):
+        """ code: HammingSECDED (veya alt sınıfı) örneği; seed: tamsayı, SeedSequence veya Generator """
+        code._get_numpy_tables()
+        self.n = code.n
+        self.dtype = code.codeword_dtype
+        self.lanes = code.codeword_lanes
+        self.rng = seed if isinstance(seed, np.random.Generator) else np.random.default_rng(seed)
+        # Satır p: 1-indeksli p pozisyonunun maskesi; satır 0 boş maske
+        self.position_masks = np.array([_int_to_lanes(0, self.lanes)] +
+                                       [_int_to_lanes(1 << (self.n - p), self.lanes) for p in range(1, self.n + 1)],
+                                       dtype=self.dtype)
+        self._pair_masks = None
+
+    def _empty(self, count):
+        return np.zeros((count, self.lanes) if self.lanes else count, dtype=self.dtype)
+
+    def masks_from_positions(self, positions):
+        """ (N, t) boyutlu 1-indeksli pozisyon dizisinden maskeler; 0 olan girdiler atlanır """
+        positions = np.asarray(positions)
+        if positions.ndim == 1:
+            positions = positions.reshape(-1, 1)
+        if positions.size and (positions.min() < 0 or positions.max() > self.n):
+            raise ValueError(f"Hata pozisyonları [1, {self.n}] aralığında olmalıdır.")
+        if positions.shape[1] == 0:
+            return self._empty(len(positions))
+        masks = self.position_masks[positions[:, 0]]
+        for column in positions.T[1:]:
+            masks ^= self.position_masks[column]
+        return masks
+
+    def random_positions(self, count, t):
+        """ (count, t) boyutlu, her satırı t farklı 1-indeksli pozisyon olan düzgün dağılımlı örnek """
+        if not 0 <= t <= self.n:
+            raise ValueError(f"Hata ağırlığı t 0 ile {self.n} arasında olmalıdır.")
+        chosen = np.empty((count, t), dtype=np.intp)
+        for i in range(t):
+            # Kalan n-i pozisyon içinden sıra seçilir ve daha önce seçilenlerin üzerinden kaydırılır
+            position = self.rng.integers(1, self.n - i + 1, size=count)
+            previous = chosen[:, :i] if i < 2 else np.sort(chosen[:, :i], axis=1)
+            for used in previous.T:
+                position += position >= used
+            chosen[:, i] = position
+        return chosen
+
+    def exact_weight(self, count, t):
+        """ Her biri tam olarak t bit çeviren count adet maske """
+        if t == 1:
+            return self.position_masks[self.rng.integers(1, self.n, size=count, endpoint=True)]
+        if t == 2:
+            # n(n-1)/2 çiftin maskeleri bir kez hesaplanır; her maske tek bir dizin seçimidir
+            if self._pair_masks is None:
+                first, second = np.triu_indices(self.n, 1)
+                self._pair_masks = self.position_masks[first + 1] ^ self.position_masks[second + 1]
+            return self._pair_masks[self.rng.integers(0, len(self._pair_masks), size=count)]
+        return self.masks_from_positions(self.random_positions(count, t))
+
+    def with_weights(self, weights):
+        """ weights[i] adet farklı bit çeviren maskeler; aynı ağırlıktaki satırlar birlikte üretilir """
+        weights = np.asarray(weights)
+        masks = self._empty(len(weights))
+        for t in np.unique(weights):
+            if t:
+                rows = np.flatnonzero(weights == t)
+                masks[rows] = self.exact_weight(len(rows), int(t))
+        return masks
+
+    def bernoulli(self, count, ber):
+        """
+        Her bit bağımsız olarak ber olasılıkla çevrilir. Sözcük başına hata sayısı Binom(n, ber) dağılımından
+        ters CDF ile çekilir (yalnızca hatalı sözcükler aranır; düşük ber'de çoğu maske boştur), ardından
+        maskeler with_weights ile üretilir.
+        """
+        if not 0 <= ber <= 1:
+            raise ValueError("Bit hata oranı (ber) 0 ile 1 arasında olmalıdır.")
+        cdf = np.cumsum([math.comb(self.n, t) * ber ** t * (1 - ber) ** (self.n - t) for t in range(self.n + 1)])
+        u = self.rng.random(count)
+        masks = self._empty(count)
+        errored = np.flatnonzero(u >= cdf[0])
+        masks[errored] = self.with_weights(np.minimum(np.searchsorted(cdf, u[errored], side="right"), self.n))
+        return masks
+
+    def burst(self, count, length):
+        """
+        Her maskede kod sözcüğü içinde kalan ardışık bir patlama. length tamsayı veya
+        (en_az, en_çok) çifti olabilir; ikinci durumda uzunluk bu aralıkta düzgün dağılımlıdır.
+        """
+        low, high = length if isinstance(length, tuple) else (length, length)
+        if not 1 <= low <= high <= self.n:
+            raise ValueError(f"Patlama uzunluğu 1 ile {self.n} arasında olmalıdır.")
+        if low == high:
+            lengths = low
+            starts = self.rng.integers(1, self.n - low + 1, size=count, endpoint=True)
+        else:
+            lengths = self.rng.integers(low, high, size=count, endpoint=True)
+            starts = self.rng.integers(1, self.n - lengths + 1, endpoint=True)
+        return self._burst_table(high)[lengths, starts]
+
+    def _burst_table(self, max_length):
+        """ [uzunluk, başlangıç] -> patlama maskesi tablosu (kod sözcüğünü aşan girdiler kullanılmaz) """
+        table = np.zeros((max_length + 1, self.n + 1) + ((self.lanes,) if self.lanes else ()), dtype=self.dtype)
+        for length in range(1, max_length + 1):
+            table[length] = table[length - 1]
+            table[length, 1:self.n - length + 2] ^= self.position_masks[length:self.n + 1]
+        return table
+
+    def targeted(self, count, positions, probability=1.0):
+        """
+        Verilen 1-indeksli pozisyonlar her maskede (probability=1) ya da her biri bağımsız olarak
+        probability olasılıkla çevrilir. Takılı bitleri veya belirli bir hücre grubunu modellemek içindir.
+        """
+        positions = np.asarray(positions, dtype=np.intp).reshape(1, -1)
+        if not 0 <= probability <= 1:
+            raise ValueError("Olasılık 0 ile 1 arasında olmalıdır.")
+        selected = np.broadcast_to(positions, (count, positions.shape[1]))
+        if probability < 1:
+            selected = np.where(self.rng.random(selected.shape) < probability, selected, 0)
+        return self.masks_from_positions(selected)
+
+
+def mask_weights(masks):
+    """ Maske başına çevrilen bit sayısı (şeritli dizilerde şeritler toplanır) """
+    bits = np.unpackbits(np.ascontiguousarray(masks).view(np.uint8).reshape(len(masks), -1), axis=1)
+    return bits.sum(axis=1)
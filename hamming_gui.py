@@ -0,0 +1,860 @@
+"""
+Hamming SEC-DED eğitim simülatörünün Tkinter arayüzü.
+Yalnızca GUI istendiğinde içe aktarılır; kod çözücü çekirdeği hamming.py içindedir.
+"""
+
+import os
+import queue
+import threading
+import tkinter as tk
+from tkinter import ttk, messagebox, scrolledtext, filedialog
+
+from hamming import HammingSECDED, STANDARD_DATA_SIZES, iter_stream_codewords
+
+
+# Bit türü renkleri: (tür satırı, değer satırı)
+BIT_TYPE_COLORS = {"Po": ('#FFB6C1', '#FFE4E1'), "Ps": ('#FFFACD', '#FFFFE0'), "D": ('#90EE90', '#E0FFE0'), "": ("white", "white")}
+# Satır etiketlerinde durum kodu renkleri (0/1/2/3)
+STATUS_COLORS = {0: "black", 1: "#d35400", 2: "#c0392b", 3: "#d35400"}
+
+# Arka plan testleri: görünen ad -> hamming_testrun.TEST_MODES anahtarı
+BACKGROUND_TEST_MODES = {
+    "Rastgele tek hata": "random_single",
+    "Rastgele çift hata": "random_double",
+    "Kapsamlı tek hata (tüm pozisyonlar)": "exhaustive_single",
+    "Kapsamlı çift hata (tüm çiftler)": "exhaustive_double",
+}
+TEST_POLL_MS = 50
+TEST_POLL_MAX_MESSAGES = 200  # Bir yoklamada işlenen en fazla ileti; arayüz tepki vermeye devam eder
+MAX_TEST_OUTPUT_LINES = 2000  # Sonuç kutusunda tutulan en fazla satır; eski satırlar silinir
+
+
+class CodewordCanvas(tk.Frame):
+    """
+    Tek bir Canvas üzerinde sanallaştırılmış kod sözcüğü görünümü.
+    Üstte sabit "Poz"/"Tür" başlık satırları, altında her kod sözcüğü için bir "Değ" satırı bulunur.
+    Yalnızca görünen sütun ve satırlar için dikdörtgen/metin öğeleri oluşturulur; kaydırmada ve yeni
+    veri gösterildiğinde öğeler yeniden oluşturulmaz, yalnızca metin ve renkleri güncellenir.
+    Bu sayede 137 bitlik sözcükler ve dosyadan okunan binlerce sözcük akıcı biçimde kaydırılabilir.
+    """
+
+    CELL_WIDTH = 24
+    CELL_HEIGHT = 20
+    LABEL_WIDTH = 64
+    HEADER_ROWS = 2
+
+    def __init__(self, parent, max_visible_rows=1):
+        super().__init__(parent)
+        self.max_visible_rows = max_visible_rows
+        self.canvas = tk.Canvas(self, bg="white", highlightthickness=0,
+                                height=(self.HEADER_ROWS + max_visible_rows) * self.CELL_HEIGHT + 2)
+        self.xbar = tk.Scrollbar(self, orient="horizontal", command=self.xview)
+        self.ybar = tk.Scrollbar(self, orient="vertical", command=self.yview)
+        self.canvas.grid(row=0, column=0, sticky="nsew")
+        self.ybar.grid(row=0, column=1, sticky="ns")
+        self.xbar.grid(row=1, column=0, sticky="ew")
+        self.columnconfigure(0, weight=1)
+        self.rowconfigure(0, weight=1)
+
+        self.hamming = None
+        self.codewords = []
+        self.row_labels = None
+        self.row_status = None
+        self.first_col = 0
+        self.first_row = 0
+        self._bit_types = []
+        self._pool = None          # (görünen sütun, görünen satır) -> öğe kimlikleri
+        self._pool_shape = (0, 0)
+
+        self.canvas.bind("<Configure>", lambda e: self._layout())
+        for widget in (self.canvas, self):
+            widget.bind("<MouseWheel>", self._on_wheel)
+            widget.bind("<Shift-MouseWheel>", lambda e: self._scroll_cols(-1 if e.delta > 0 else 1))
+            widget.bind("<Button-4>", lambda e: self._scroll_rows(-1))
+            widget.bind("<Button-5>", lambda e: self._scroll_rows(1))
+            widget.bind("<Shift-Button-4>", lambda e: self._scroll_cols(-1))
+            widget.bind("<Shift-Button-5>", lambda e: self._scroll_cols(1))
+
+    def show(self, hamming, codewords, row_labels=None, row_status=None):
+        """
+        codewords: bit listeleri, kod sözcüğü tamsayıları veya encode_batch/unpack_codewords dizisi
+        (şeritli diziler dahil). row_labels: satır etiketleri (varsayılan: tek sözcükte "Değ:", aksi halde
+        sözcük indeksi). row_status: satır etiketini renklendirmek için durum kodları (isteğe bağlı).
+        """
+        if hamming is not self.hamming:
+            self.hamming = hamming
+            self._bit_types = self.bit_types(hamming)
+            self.first_col = 0
+        self.codewords = codewords
+        self.row_labels = row_labels
+        self.row_status = row_status
+        self.first_row = 0
+        self._layout()
+
+    def clear(self):
+        self.hamming = None
+        self.codewords = []
+        self._bit_types = []
+        self._layout()
+
+    @staticmethod
+    def bit_types(hamming):
+        """ 1-indeksli pozisyon sırasıyla bit türleri ("Ps", "D", "Po") """
+        sec_parity = set(hamming.parity_positions_sec)
+        data = set(hamming.data_positions)
+        types = []
+        for pos in range(1, hamming.n + 1):
+            if pos == hamming.overall_parity_position:
+                types.append("Po")
+            elif pos in sec_parity:
+                types.append("Ps")
+            elif pos in data:
+                types.append("D")
+            else:
+                types.append("")
+        return types
+
+    def bit(self, row, col):
+        """ row numaralı kod sözcüğünün 0-indeksli col bitinin değeri (MSB = pozisyon 1) """
+        word = self.codewords[row]
+        if isinstance(word, list):
+            return word[col]
+        shift = self.hamming.n - 1 - col
+        if getattr(word, "ndim", 0):  # uint64 şeritleri, şerit 0 en düşük 64 bit
+            return (int(word[shift >> 6]) >> (shift & 63)) & 1
+        return (int(word) >> shift) & 1
+
+    def row_label(self, row):
+        if self.row_labels is not None:
+            return str(self.row_labels[row])
+        return "Değ:" if len(self.codewords) == 1 else str(row)
+
+    def visible_shape(self):
+        """ Kanvasa sığan (sütun, satır) sayısı; veri boyutuyla sınırlıdır """
+        width = max(self.canvas.winfo_width(), 1) - self.LABEL_WIDTH
+        height = max(self.canvas.winfo_height(), 1) - self.HEADER_ROWS * self.CELL_HEIGHT
+        cols = min(len(self._bit_types), max(1, -(-width // self.CELL_WIDTH)))
+        rows = min(len(self.codewords), max(1, -(-height // self.CELL_HEIGHT)))
+        return cols, rows
+
+    def _clamp(self):
+        cols, rows = self._pool_shape
+        self.first_col = max(0, min(self.first_col, len(self._bit_types) - cols))
+        self.first_row = max(0, min(self.first_row, len(self.codewords) - rows))
+
+    def _layout(self):
+        """ Görünen alan değiştiyse öğe havuzunu yeniden boyutlandırır, ardından yeniden çizer """
+        if not self._bit_types or not len(self.codewords):
+            self.canvas.delete("all")
+            self._pool, self._pool_shape = None, (0, 0)
+            self.xbar.set(0, 1)
+            self.ybar.set(0, 1)
+            return
+        shape = self.visible_shape()
+        if shape != self._pool_shape:
+            self._build_pool(*shape)
+        self._redraw()
+
+    def _build_pool(self, cols, rows):
+        """ Yalnızca görünen hücreler için öğeleri bir kez oluşturur """
+        c = self.canvas
+        c.delete("all")
+        w, h, left = self.CELL_WIDTH, self.CELL_HEIGHT, self.LABEL_WIDTH
+        header_font = ('Courier', 8, 'bold')
+        pool = {"labels": [], "cells": []}
+        for r in range(self.HEADER_ROWS + rows):
+            y = r * h
+            if r >= self.HEADER_ROWS:
+                font = ('Courier', 10, 'bold')
+            else:
+                font = ('Courier', 8) if r == 0 else header_font
+            pool["labels"].append(c.create_text(left - 4, y + h // 2, anchor="e", font=header_font))
+            row_items = []
+            for col in range(cols):
+                x = left + col * w
+                rect = c.create_rectangle(x, y, x + w, y + h, outline="black")
+                text = c.create_text(x + w // 2, y + h // 2, font=font)
+                row_items.append((rect, text))
+            pool["cells"].append(row_items)
+        c.itemconfigure(pool["labels"][0], text="Poz:")
+        c.itemconfigure(pool["labels"][1], text="Tür:")
+        self._pool, self._pool_shape = pool, (cols, rows)
+
+    def _redraw(self):
+        self._clamp()
+        c = self.canvas
+        cols, rows = self._pool_shape
+        pos_row, type_row = self._pool["cells"][0], self._pool["cells"][1]
+        for i in range(cols):
+            col = self.first_col + i
+            bit_type = self._bit_types[col]
+            c.itemconfigure(pos_row[i][1], text=str(col + 1))
+            c.itemconfigure(type_row[i][0], fill=BIT_TYPE_COLORS[bit_type][0])
+            c.itemconfigure(type_row[i][1], text=bit_type)
+        for j in range(rows):
+            row = self.first_row + j
+            label = self._pool["labels"][self.HEADER_ROWS + j]
+            status = None if self.row_status is None else int(self.row_status[row])
+            c.itemconfigure(label, text=self.row_label(row), fill=STATUS_COLORS.get(status, "black"))
+            for i, (rect, text) in enumerate(self._pool["cells"][self.HEADER_ROWS + j]):
+                col = self.first_col + i
+                c.itemconfigure(rect, fill=BIT_TYPE_COLORS[self._bit_types[col]][1])
+                c.itemconfigure(text, text=str(self.bit(row, col)))
+        total_cols, total_rows = len(self._bit_types), len(self.codewords)
+        self.xbar.set(self.first_col / total_cols, (self.first_col + cols) / total_cols)
+        self.ybar.set(self.first_row / total_rows, (self.first_row + rows) / total_rows)
+
+    @staticmethod
+    def _scroll_target(first, visible, total, args):
+        """ Scrollbar komutunu ("moveto", f) / ("scroll", n, "units"|"pages") yeni ilk indekse çevirir """
+        if args[0] == "moveto":
+            return int(round(float(args[1]) * total))
+        step = int(args[1]) * (visible if args[2] == "pages" else 1)
+        return first + step
+
+    def xview(self, *args):
+        if self._pool is not None:
+            self.first_col = self._scroll_target(self.first_col, self._pool_shape[0], len(self._bit_types), args)
+            self._redraw()
+
+    def yview(self, *args):
+        if self._pool is not None:
+            self.first_row = self._scroll_target(self.first_row, self._pool_shape[1], len(self.codewords), args)
+            self._redraw()
+
+    def _scroll_cols(self, units):
+        self.xview("scroll", units, "units")
+
+    def _scroll_rows(self, units):
+        if len(self.codewords) > 1:
+            self.yview("scroll", units, "units")
+        else:
+            self._scroll_cols(units)
+
+    def _on_wheel(self, event):
+        self._scroll_rows(-1 if event.delta > 0 else 1)
+
+
+class HammingGUI:
+    def __init__(self, root):
+        self.root = root
+        self.root.title("BLM230 - Hamming SEC-DED Kod Simülatörü")
+        self.root.geometry("850x750") 
+        self.root.configure(bg='#f0f0f0')
+        
+        self.current_data_size = tk.IntVar(value=8)
+        self.hamming = HammingSECDED(self.current_data_size.get())
+        self.current_encoded = None # Son kodlanan kod sözcüğünü saklamak için
+        self.test_queue = queue.Queue()
+        self.test_cancel = None  # Çalışan arka plan testinin iptal olayı (threading.Event)
+        self.loaded_container = None  # Görünümün tembel okuduğu açık HSCF kapsayıcısı
+        
+        self.setup_ui()
+        self.update_for_data_size() 
+        
+    def setup_ui(self):
+        control_frame = tk.Frame(self.root, bg='#f0f0f0')
+        control_frame.pack(pady=5, fill='x')
+
+        tk.Label(control_frame, text="Veri Bit Uzunluğunu Seçin:", bg='#f0f0f0', font=('Arial', 10)).pack(side='left', padx=(10,5))
+        
+        data_size_options = STANDARD_DATA_SIZES
+        self.data_size_selector = ttk.Combobox(control_frame, textvariable=self.current_data_size, 
+                                               values=data_size_options, state="readonly", width=5)
+        self.data_size_selector.pack(side='left', padx=5)
+        self.data_size_selector.bind("<<ComboboxSelected>>", self.on_data_size_change)
+
+        title_frame = tk.Frame(self.root, bg='#f0f0f0')
+        title_frame.pack(pady=5)
+        
+        self.main_title_label = tk.Label(title_frame, text=f"Hamming {self.hamming.get_code_params_str()} SEC-DED Kod Simülatörü", 
+                              font=('Arial', 16, 'bold'), bg='#f0f0f0', fg='#2c3e50')
+        self.main_title_label.pack()
+        
+        subtitle_label = tk.Label(title_frame, text="BLM230 Bilgisayar Mimarisi - Proje Ödevi", 
+                                 font=('Arial', 10), bg='#f0f0f0', fg='#7f8c8d')
+        subtitle_label.pack()
+        
+        self.notebook = ttk.Notebook(self.root)
+        self.notebook.pack(fill='both', expand=True, padx=10, pady=10)
+        
+        self.encoder_frame = ttk.Frame(self.notebook)
+        self.notebook.add(self.encoder_frame, text="Kodlayıcı")
+        self.setup_encoder_tab()
+        
+        self.decoder_frame = ttk.Frame(self.notebook)
+        self.notebook.add(self.decoder_frame, text="Kod Çözücü")
+        self.setup_decoder_tab()
+        
+        self.testing_frame = ttk.Frame(self.notebook)
+        self.notebook.add(self.testing_frame, text="Hata Testi")
+        self.setup_testing_tab()
+        
+        self.info_frame = ttk.Frame(self.notebook)
+        self.notebook.add(self.info_frame, text="Bilgi")
+        self.setup_info_tab()
+
+    def on_data_size_change(self, event=None):
+        new_size = self.current_data_size.get()
+        try:
+            self.hamming = HammingSECDED(new_size)
+            self.current_encoded = None 
+            self.update_for_data_size()
+            messagebox.showinfo("Veri Boyutu Değiştirildi", f"Simülatör şimdi {new_size} veri biti için Hamming {self.hamming.get_code_params_str()} SEC-DED kodu kullanacak şekilde yapılandırıldı.")
+        except ValueError as e:
+            messagebox.showerror("Hata", str(e))
+            # İsteğe bağlı olarak varsayılan veya önceki geçerli bir boyuta geri dön
+            self.current_data_size.set(self.hamming.k) # Eski k'ye geri dön
+
+    def update_for_data_size(self):
+        k = self.hamming.k
+        n = self.hamming.n
+        
+        self.main_title_label.config(text=f"Hamming {self.hamming.get_code_params_str()} SEC-DED Kod Simülatörü")
+
+        self.data_entry_label.config(text=f"{k}-bit veri girin (örneğin, {'10110010'[:k]}):")
+        self.data_entry.config(width=max(k + 5, 15)) # Minimum genişliği sağla
+        self.data_entry.delete(0, tk.END)
+        self.data_entry.insert(0, '1' * k) 
+        if hasattr(self, 'codeword_view_encoder'):
+            self.codeword_title_encoder.config(text="")
+            self.codeword_view_encoder.clear()
+        if hasattr(self, 'encode_result'): self.encode_result.config(state=tk.NORMAL); self.encode_result.delete(1.0, tk.END); self.encode_result.config(state=tk.DISABLED)
+
+        self.received_entry_label.config(text=f"{n}-bit alınan kod sözcüğü girin:")
+        self.received_entry.config(width=max(n + 5, 20)) # Minimum genişliği sağla
+        self.received_entry.delete(0, tk.END)
+        if hasattr(self, 'codeword_view_decoder'):
+            self.codeword_title_decoder.config(text="")
+            self.codeword_view_decoder.clear()
+            self.close_loaded_file()
+        if hasattr(self, 'decode_result'): self.decode_result.config(state=tk.NORMAL); self.decode_result.delete(1.0, tk.END); self.decode_result.config(state=tk.DISABLED)
+
+        self.test_data_entry_label.config(text=f"Test Verisi ({k} bit):")
+        self.test_data_entry.config(width=max(k + 5, 15))
+        self.test_data_entry.delete(0, tk.END)
+        self.test_data_entry.insert(0, '1' * k)
+        self.cancel_background_test()
+        if hasattr(self, 'test_result'): self.test_result.config(state=tk.NORMAL); self.test_result.delete(1.0, tk.END); self.test_result.config(state=tk.DISABLED)
+
+        self.update_info_tab_text()
+
+    def setup_encoder_tab(self):
+        input_frame = ttk.LabelFrame(self.encoder_frame, text="Veri Girişi", padding=10)
+        input_frame.pack(fill='x', padx=10, pady=5)
+        
+        self.data_entry_label = tk.Label(input_frame, text=f"{self.hamming.k}-bit veri girin:")
+        self.data_entry_label.pack(anchor='w')
+        
+        self.data_entry = tk.Entry(input_frame, font=('Courier', 12))
+        self.data_entry.pack(pady=5, fill='x', expand=True)
+        
+        button_frame = tk.Frame(input_frame)
+        button_frame.pack(pady=5)
+        tk.Button(button_frame, text="Kodla", command=self.encode_data, bg='#3498db', fg='white', font=('Arial', 10, 'bold')).pack(side='left', padx=5)
+        tk.Button(button_frame, text="Temizle", command=lambda: self.data_entry.delete(0, 'end'), bg='#95a5a6', fg='white', font=('Arial', 10)).pack(side='left', padx=5)
+        
+        output_frame = ttk.LabelFrame(self.encoder_frame, text="Kodlanmış Sonuç", padding=10)
+        output_frame.pack(fill='both', expand=True, padx=10, pady=5)
+        
+        self.codeword_title_encoder = tk.Label(output_frame, text="", font=('Arial', 12, 'bold'))
+        self.codeword_title_encoder.pack(pady=(10, 5))
+        self.codeword_view_encoder = CodewordCanvas(output_frame)
+        self.codeword_view_encoder.pack(fill='x', pady=(0, 10))
+        
+        self.encode_result = scrolledtext.ScrolledText(output_frame, height=10, width=80, font=('Courier', 10), wrap=tk.WORD, state=tk.DISABLED)
+        self.encode_result.pack(fill='both', expand=True)
+    
+    def setup_decoder_tab(self):
+        input_frame = ttk.LabelFrame(self.decoder_frame, text="Alınan Kod Sözcüğü", padding=10)
+        input_frame.pack(fill='x', padx=10, pady=5)
+        
+        self.received_entry_label = tk.Label(input_frame, text=f"{self.hamming.n}-bit alınan kod sözcüğü girin:")
+        self.received_entry_label.pack(anchor='w')
+        
+        self.received_entry = tk.Entry(input_frame, font=('Courier', 12))
+        self.received_entry.pack(pady=5, fill='x', expand=True)
+        
+        button_frame = tk.Frame(input_frame)
+        button_frame.pack(pady=5)
+        tk.Button(button_frame, text="Kodu Çöz", command=self.decode_data, bg='#e74c3c', fg='white', font=('Arial', 10, 'bold')).pack(side='left', padx=5)
+        tk.Button(button_frame, text="Son Kodlananı Kullan", command=self.use_last_encoded, bg='#f39c12', fg='white', font=('Arial', 10)).pack(side='left', padx=5)
+        tk.Button(button_frame, text="Dosyadan Yükle", command=self.load_codeword_file, bg='#8e44ad', fg='white', font=('Arial', 10)).pack(side='left', padx=5)
+        
+        output_frame = ttk.LabelFrame(self.decoder_frame, text="Kod Çözme Sonucu", padding=10)
+        output_frame.pack(fill='both', expand=True, padx=10, pady=5)
+        
+        self.codeword_title_decoder = tk.Label(output_frame, text="", font=('Arial', 12, 'bold'))
+        self.codeword_title_decoder.pack(pady=(0, 5))
+        self.codeword_view_decoder = CodewordCanvas(output_frame, max_visible_rows=8)
+        self.codeword_view_decoder.pack(fill='x', pady=(0, 10))
+        
+        self.decode_result = scrolledtext.ScrolledText(output_frame, height=15, width=80, font=('Courier', 10), wrap=tk.WORD, state=tk.DISABLED)
+        self.decode_result.pack(fill='both', expand=True)
+
+    def setup_testing_tab(self):
+        control_frame = ttk.LabelFrame(self.testing_frame, text="Hata Testi Kontrolleri", padding=10)
+        control_frame.pack(fill='x', padx=10, pady=5)
+        
+        self.test_data_entry_label = tk.Label(control_frame, text=f"Test Verisi ({self.hamming.k} bit):")
+        self.test_data_entry_label.pack(anchor='w')
+        self.test_data_entry = tk.Entry(control_frame, font=('Courier', 12))
+        self.test_data_entry.pack(pady=2, fill='x', expand=True)
+        
+        button_frame = tk.Frame(control_frame)
+        button_frame.pack(pady=10)
+        tk.Button(button_frame, text="Hatasız Test Et", command=self.test_no_errors, bg='#27ae60', fg='white', font=('Arial', 9)).pack(side='left', padx=3)
+        tk.Button(button_frame, text="Tek Hata Test Et", command=self.test_single_error, bg='#e67e22', fg='white', font=('Arial', 9)).pack(side='left', padx=3)
+        tk.Button(button_frame, text="Çift Hata Test Et", command=self.test_double_error, bg='#c0392b', fg='white', font=('Arial', 9)).pack(side='left', padx=3)
+        tk.Button(button_frame, text="Tüm Durumları Test Et", command=self.test_all_cases, bg='#8e44ad', fg='white', font=('Arial', 9)).pack(side='left', padx=3)
+        
+        background_frame = ttk.LabelFrame(self.testing_frame, text="Toplu Test (Arka Planda)", padding=10)
+        background_frame.pack(fill='x', padx=10, pady=5)
+        options_frame = tk.Frame(background_frame)
+        options_frame.pack(fill='x')
+        tk.Label(options_frame, text="Mod:").pack(side='left')
+        self.test_mode_var = tk.StringVar(value=next(iter(BACKGROUND_TEST_MODES)))
+        ttk.Combobox(options_frame, textvariable=self.test_mode_var, values=list(BACKGROUND_TEST_MODES),
+                     state="readonly", width=34).pack(side='left', padx=5)
+        tk.Label(options_frame, text="Deneme sayısı:").pack(side='left', padx=(10, 0))
+        self.test_trials_entry = tk.Entry(options_frame, width=10)
+        self.test_trials_entry.insert(0, "100000")
+        self.test_trials_entry.pack(side='left', padx=5)
+        self.test_start_button = tk.Button(options_frame, text="Başlat", command=self.start_background_test, bg='#2980b9', fg='white', font=('Arial', 9))
+        self.test_start_button.pack(side='left', padx=3)
+        self.test_cancel_button = tk.Button(options_frame, text="İptal", command=self.cancel_background_test, bg='#95a5a6', fg='white', font=('Arial', 9), state=tk.DISABLED)
+        self.test_cancel_button.pack(side='left', padx=3)
+        self.test_progress = ttk.Progressbar(background_frame, mode='determinate')
+        self.test_progress.pack(fill='x', pady=(8, 2))
+        self.test_status_label = tk.Label(background_frame, text="", anchor='w')
+        self.test_status_label.pack(fill='x')
+        
+        results_frame = ttk.LabelFrame(self.testing_frame, text="Test Sonuçları", padding=10)
+        results_frame.pack(fill='both', expand=True, padx=10, pady=5)
+        
+        self.test_result = scrolledtext.ScrolledText(results_frame, height=15, width=80, font=('Courier', 10), wrap=tk.WORD, state=tk.DISABLED)
+        self.test_result.pack(fill='both', expand=True)
+
+    def update_info_tab_text(self):
+        k = self.hamming.k
+        n = self.hamming.n
+        p_sec = self.hamming.num_parity_bits_sec
+        p_ded = self.hamming.num_parity_bits_ded
+
+        info_text = f"""
+BLM230 Bilgisayar Mimarisi - Hamming SEC-DED Kod Uygulaması
+
+MEVCUT YAPILANDIRMA:
+Veri bitleri (k): {k}
+SEC Eşlik bitleri (p_sec): {p_sec}
+Genel DED Eşlik biti: 1
+Toplam Eşlik bitleri (p_ded = p_sec + 1): {p_ded}
+Toplam Kod Sözcüğü bitleri (n = k + p_ded): {n}
+Kod Türü: Hamming ({n},{k}) SEC-DED (Genişletilmiş Hamming Kodu)
+
+HAMMING SEC-DED KODLARI HAKKINDA:
+• Tek Hata Düzelten (SEC): Tek bitlik hataları tespit edip düzeltebilir.
+• Çift Hata Tespit Eden (DED): Çift bitlik hataları tespit edebilir (ancak düzeltemez).
+  Bu, standart bir Hamming SEC koduna genel bir eşlik biti eklenerek elde edilir.
+
+BİT POZİSYONLARI (1-indeksli, kod sözcüğü için soldan sağa MSB'den LSB'ye konsepti):
+• SEC Eşlik bitleri (Ps): 2'nin kuvvetleri olan pozisyonlarda (örneğin, 1, 2, 4, ..., 2^({p_sec-1})).
+  Bunlar belirli veri ve diğer eşlik bitleri üzerinden hesaplanır.
+• Veri bitleri (D): k + p_sec'e kadar olan kalan pozisyonlar.
+• Genel DED Eşlik biti (Po): Pozisyon {n} (son bit). Kendinden önceki tüm {n-1} bit için eşlik sağlar.
+
+HATA TESPİT/DÜZELTME MANTIĞI (S = SEC Sendromu, P_o_durumu = Genel Eşlik Kontrolü):
+1. İlk {n-1} biti (veri + SEC eşlik bitleri) kullanarak SEC sendromunu (S) hesaplayın.
+2. İlk {n-1} bitin beklenen eşliğini alınan genel eşlik biti ({n}. bit) ile karşılaştırarak genel eşlik durumunu (P_o_durumu) kontrol edin.
+
+   - Eğer S=0 ve P_o_durumu doğruysa: Hata yok.
+   - Eğer S!=0 ve P_o_durumu yanlışsa: İlk {n-1} bit içinde S pozisyonunda (1-indeksli) tek hata. Düzeltilebilir.
+   - Eğer S!=0 ve P_o_durumu doğruysa: Çift hata tespit edildi. Bu kodla düzeltilemez.
+   - Eğer S=0 ve P_o_durumu yanlışsa: Genel eşlik bitinde (Po, {n} pozisyonunda) tek hata. Düzeltilebilir.
+
+NASIL KULLANILIR:
+1. Üst kısımdan Veri Bit Uzunluğunu (8, 16, 32, 64 veya 128) seçin. Simülatör ayarlanacaktır.
+2. KODLAYICI SEKMESİ: {k}-bit veri (ikili dize) girin ve "Kodla"ya tıklayın. {n}-bitlik kod sözcüğü ve ayrıntılar görüntülenecektir.
+3. KOD ÇÖZÜCÜ SEKMESİ: {n}-bitlik alınan bir kod sözcüğü (ikili dize) girin ve "Kodu Çöz"e tıklayın. Sonuç sendromu, hata durumunu ve çözülmüş veriyi gösterecektir.
+   Son oluşturulan kod sözcüğünü hızlıca yüklemek için "Son Kodlananı Kullan"ı kullanın.
+4. HATA TESTİ SEKMESİ: {k}-bit test verisi girin. Simüle etmek için düğmelere tıklayın:
+   - Hata yok.
+   - Kod sözcüğünde rastgele tek bitlik bir hata.
+   - Kod sözcüğünde rastgele çift bitlik bir hata.
+   - Yukarıdaki tüm senaryolar.
+   Sonuçlar, hataların SEC-DED tarafından beklendiği gibi işlenip işlenmediğini gösterecektir.
+
+Bu uygulama 8, 16, 32, 64 ((72,64) ECC DIMM düzeni) ve 128-bit ((137,128)) veri girişlerini destekler.
+Kod parametreleri seçiminize göre dinamik olarak ayarlanır.
+Kod sözcüğünün görsel gösterimi, yapısını anlamanıza yardımcı olur.
+        """
+        if hasattr(self, 'info_scroll'):
+            self.info_scroll.config(state=tk.NORMAL)
+            self.info_scroll.delete(1.0, tk.END)
+            self.info_scroll.insert(tk.END, info_text)
+            self.info_scroll.config(state=tk.DISABLED)
+
+    def setup_info_tab(self):
+        self.info_scroll = scrolledtext.ScrolledText(self.info_frame, wrap=tk.WORD,
+                                                font=('Courier', 9), bg='white', fg='#2c3e50',
+                                                padx=10, pady=10, state=tk.DISABLED)
+        self.info_scroll.pack(fill='both', expand=True, padx=10, pady=10)
+        self.update_info_tab_text() 
+
+
+    def _display_text_result(self, widget, text):
+        widget.config(state=tk.NORMAL)
+        widget.delete(1.0, tk.END)
+        widget.insert(1.0, text)
+        widget.config(state=tk.DISABLED)
+
+    def encode_data(self):
+        try:
+            data_str = self.data_entry.get().strip()
+            if len(data_str) != self.hamming.k or not all(c in '01' for c in data_str):
+                messagebox.showerror("Giriş Hatası", f"Lütfen tam olarak {self.hamming.k} bit (0 ve 1) girin.")
+                return
+            
+            data_bits_list = [int(c) for c in data_str]
+            encoded_list = self.hamming.encode(data_bits_list)
+            self.current_encoded = list(encoded_list) # "Son Kodlananı Kullan" için sakla
+            
+            self.codeword_title_encoder.config(text=f"Kodlanmış Hamming {self.hamming.get_code_params_str()} SEC-DED Kod Sözcüğü ({self.hamming.n} bit)")
+            self.codeword_view_encoder.show(self.hamming, [encoded_list])
+            
+            encoded_str = "".join(map(str, encoded_list))
+            result_text = f"{self.hamming.k}-bit veri için KODLAMA SONUCU:\n"
+            result_text += f"Giriş verisi ({self.hamming.k} bit): {data_str}\n"
+            try:
+                 result_text += f"Girişin onluk değeri: {int(data_str, 2)}\n\n"
+            except ValueError:
+                 result_text += "Girişin onluk değeri: Yok (boş dize veya geçersiz format)\n\n"
+
+            result_text += f"Kodlanmış kod sözcüğü ({self.hamming.n} bit): {encoded_str}\n\n"
+            result_text += f"Bit Türü Açıklaması: Ps=SEC Eşlik, D=Veri, Po=Genel Eşlik\n"
+            result_text += f"SEC Eşlik Pozisyonları (1-indeksli): {list(self.hamming.parity_positions_sec)}\n"
+            result_text += f"Veri Pozisyonları (1-indeksli): {list(self.hamming.data_positions)}\n" # Bunlar giriş verisinden sırayla doldurulur
+            result_text += f"Genel DED Eşlik Pozisyonu (1-indeksli): {self.hamming.overall_parity_position}\n"
+
+            self._display_text_result(self.encode_result, result_text)
+            
+        except Exception as e:
+            messagebox.showerror("Kodlama Hatası", f"Kodlama başarısız: {str(e)}")
+            self._display_text_result(self.encode_result, f"Hata: {str(e)}")
+    
+    def decode_data(self):
+        try:
+            received_str = self.received_entry.get().strip()
+            if len(received_str) != self.hamming.n or not all(c in '01' for c in received_str):
+                messagebox.showerror("Giriş Hatası", f"Lütfen tam olarak {self.hamming.n} bit (0 ve 1) girin.")
+                return
+            
+            received_list = [int(c) for c in received_str]
+            decoded_data_list, status_code, error_info_msg = self.hamming.decode(list(received_list)) # Bir kopya ilet
+            self.codeword_title_decoder.config(text=f"Alınan Kod Sözcüğü ({self.hamming.n} bit)")
+            self.codeword_view_decoder.show(self.hamming, [received_list], row_status=[status_code])
+            self.close_loaded_file()
+            
+            # Görüntüleme amacıyla, sendromu ve genel eşlik durumunu tekrar al
+            syndrome_val, overall_parity_ok = self.hamming._calculate_syndrome_and_overall_parity_status(list(received_list))
+
+            status_messages = { # Bu sözlük doğrudan kullanılmıyor, error_info_msg daha açıklayıcı
+                0: "Hata tespit edilmedi.",
+                1: "Tek hata düzeltildi.", 
+                2: "Çift hata tespit edildi (düzeltilemez).", 
+                3: "Genel eşlik bitindeki hata düzeltildi."
+            }
+            
+            decoded_data_str = "".join(map(str, decoded_data_list))
+            result_text = f"{self.hamming.n}-bit alınan kod sözcüğü için KOD ÇÖZME SONUCU:\n"
+            result_text += f"Alınan kod sözcüğü: {received_str}\n\n"
+            result_text += f"SEC Sendrom değeri (S): {syndrome_val} (ikili: {syndrome_val:0{self.hamming.p_sec}b})\n"
+            result_text += f"Genel Eşlik Durumu (P_o_durumu): {'Doğru' if overall_parity_ok else 'Yanlış'}\n"
+            result_text += f"Durum Kodu: {status_code}\n"
+            result_text += f"Yorum: {error_info_msg}\n\n" # decode() fonksiyonundan gelen error_info_msg daha açıklayıcı
+            
+            result_text += f"Çözülmüş Veri ({self.hamming.k} bit): {decoded_data_str}\n"
+            if decoded_data_str:
+                 try:
+                     result_text += f"Çözülmüş verinin onluk değeri: {int(decoded_data_str, 2)}\n"
+                 except ValueError:
+                     result_text += "Çözülmüş verinin onluk değeri: Yok\n"
+            else:
+                result_text += "Veri çıkarılamadı (muhtemelen düzeltilemez hata durumu veya boş liste nedeniyle).\n"
+
+            self._display_text_result(self.decode_result, result_text)
+            
+        except Exception as e:
+            messagebox.showerror("Kod Çözme Hatası", f"Kod çözme başarısız: {str(e)}")
+            self._display_text_result(self.decode_result, f"Hata: {str(e)}")
+
+    def use_last_encoded(self):
+        if self.current_encoded:
+            encoded_str = ''.join(map(str, self.current_encoded))
+            self.received_entry.delete(0, tk.END)
+            self.received_entry.insert(0, encoded_str)
+            messagebox.showinfo("Yükleme Başarılı", "Son kodlanan kod sözcüğü kod çözücü girişine yüklendi.")
+        else:
+            messagebox.showwarning("Veri Yok", "Kullanılabilir kodlanmış veri yok. Lütfen önce Kodlayıcı sekmesinde veri kodlayın.")
+
+    def close_loaded_file(self):
+        if self.loaded_container is not None:
+            self.loaded_container.close()
+            self.loaded_container = None
+
+    def load_codeword_file(self):
+        """
+        encode/pack komutlarının çıktısını (HSD1/HSI1 akışı veya HSCF kapsayıcısı) gösterir.
+        Kapsayıcılar açık tutulur ve görünüm yalnızca görünen satırların bloklarını okur (ContainerRows);
+        özet sayılar blok blok scrub ile toplanır. Akışlar indekssiz olduğundan tümüyle okunur.
+        """
+        path = filedialog.askopenfilename(title="Kod Sözcüğü Dosyası Seç",
+                                          filetypes=[("Hamming dosyaları", "*.hsd *.hscf"), ("Tüm dosyalar", "*")])
+        if not path:
+            return
+        container = None
+        try:
+            import numpy as np
+            from hamming_container import CONTAINER_MAGIC, CodewordContainer, ContainerRows
+
+            with open(path, "rb") as f:
+                magic = f.read(len(CONTAINER_MAGIC))
+                f.seek(0)
+                if magic == CONTAINER_MAGIC:
+                    # Başlık, düzen ve blok indeksi açılışta doğrulanır; bozuk dosyalar ValueError verir
+                    container = CodewordContainer(path)
+                    code = container.hamming
+                    codewords = ContainerRows(container)
+                    status = codewords.status
+                else:
+                    frames = iter_stream_codewords(f)
+                    code = next(frames)
+                    blocks = [codewords for _, codewords in frames]
+                    codewords = np.concatenate(blocks) if blocks else []
+                    status = code.decode_batch(codewords)[1] if blocks else []
+            if not len(codewords):
+                if container is not None:
+                    container.close()
+                messagebox.showwarning("Veri Yok", "Dosyada kod sözcüğü bulunamadı.")
+                return
+            if container is not None:  # Sayılar blok blok toplanır; dosya bellekte birleştirilmez
+                counts = np.array(container.scrub()["status_counts"])
+            else:
+                counts = np.bincount(status, minlength=4)
+        except (OSError, ValueError) as e:
+            if container is not None:
+                container.close()
+            messagebox.showerror("Dosya Hatası", f"Dosya okunamadı: {str(e)}")
+            return
+
+        self.close_loaded_file()
+        self.loaded_container = container
+        self.codeword_title_decoder.config(text=f"{os.path.basename(path)}: {len(codewords)} kod sözcüğü, Hamming {code.get_code_params_str()}")
+        self.codeword_view_decoder.show(code, codewords, row_status=status)
+        result_text = f"Dosya: {path}\n"
+        result_text += f"Kod: Hamming {code.get_code_params_str()} SEC-DED, {len(codewords)} kod sözcüğü\n\n"
+        result_text += f"Hatasız: {counts[0]}\nTek hata düzeltildi: {counts[1]}\n"
+        result_text += f"Çift hata tespit edildi: {counts[2]}\nGenel eşlik biti düzeltildi: {counts[3]}\n\n"
+        result_text += "Satır etiketleri sözcük indeksidir; turuncu = düzeltildi, kırmızı = düzeltilemez."
+        self._display_text_result(self.decode_result, result_text)
+    
+    def test_no_errors(self): self.run_test_scenario("no_error")
+    def test_single_error(self): self.run_test_scenario("single_error")
+    def test_double_error(self): self.run_test_scenario("double_error")
+    def test_all_cases(self): self.run_test_scenario("all")
+    
+    def run_test_scenario(self, scenario):
+        try:
+            data_str = self.test_data_entry.get().strip()
+            if len(data_str) != self.hamming.k or not all(c in '01' for c in data_str):
+                messagebox.showerror("Giriş Hatası", f"Lütfen test verisi için tam olarak {self.hamming.k} bit (0 ve 1) girin.")
+                return
+            
+            data_bits_orig = [int(c) for c in data_str]
+            encoded_orig = self.hamming.encode(list(data_bits_orig))
+            
+            result_text = f"Hamming {self.hamming.get_code_params_str()} SEC-DED için HATA TESTİ SONUÇLARI\n"
+            result_text += f"{'='*70}\n"
+            result_text += f"Orijinal Test Verisi ({self.hamming.k} bit): {data_str}\n"
+            result_text += f"Kodlanmış Kod Sözcüğü ({self.hamming.n} bit): {''.join(map(str,encoded_orig))}\n\n"
+            
+            all_tests_passed = True
+
+            if scenario in ["no_error", "all"]:
+                result_text += "TEST 1: Hata Yok\n" + "-"*40 + "\n"
+                decoded_data, status, info = self.hamming.decode(list(encoded_orig))
+                is_pass = (status == 0 and decoded_data == data_bits_orig)
+                if not is_pass: all_tests_passed = False
+                result_text += f"  Kod Çözücü Bilgisi: {info}\n"
+                result_text += f"  Durum: {status} -> {'BAŞARILI (Hata Tespit Edilmedi, Veri TAMAM)' if is_pass else 'BAŞARISIZ'}\n"
+                result_text += f"  Veri Eşleşmesi: {'EVET' if decoded_data == data_bits_orig else 'HAYIR'}\n\n"
+            
+            if scenario in ["single_error", "all"]:
+                result_text += "TEST 2: Tek Hata (rastgele pozisyon)\n" + "-"*40 + "\n"
+                corrupted_cw, actual_err_pos = self.hamming.introduce_single_error(list(encoded_orig))
+                decoded_data, status, info = self.hamming.decode(list(corrupted_cw))
+                # Tek hata durum 1 (veri/sec_eşlikte düzeltildi) veya 3 (genel_eşlikte düzeltildi) olmalıdır
+                is_pass = ((status == 1 or status == 3) and decoded_data == data_bits_orig)
+                if not is_pass: all_tests_passed = False
+                result_text += f"  Hata eklenen 1-indeksli poz: {actual_err_pos}\n"
+                result_text += f"  Bozuk KS: {''.join(map(str,corrupted_cw))}\n"
+                result_text += f"  Kod Çözücü Bilgisi: {info}\n"
+                result_text += f"  Durum: {status} -> {'BAŞARILI (Düzeltildi, Veri TAMAM)' if is_pass else 'BAŞARISIZ'}\n"
+                result_text += f"  Veri Eşleşmesi: {'EVET' if decoded_data == data_bits_orig else 'HAYIR'}\n\n"
+            
+            if scenario in ["double_error", "all"]:
+                result_text += "TEST 3: Çift Hata (rastgele pozisyonlar)\n" + "-"*40 + "\n"
+                # n'nin çift hata için yeterince büyük olduğundan emin ol
+                if self.hamming.n < 2:
+                    result_text += "  Atlandı: Kod sözcüğü uzunluğu çift hata için çok kısa.\n\n"
+                else:
+                    corrupted_cw, (p1, p2) = self.hamming.introduce_double_error(list(encoded_orig))
+                    decoded_data, status, info = self.hamming.decode(list(corrupted_cw))
+                    # Çift hata durum 2 (tespit edildi, düzeltilemez) olmalıdır. Veri muhtemelen eşleşmeyecektir.
+                    is_pass = (status == 2) 
+                    if not is_pass: all_tests_passed = False
+                    result_text += f"  Hata eklenen 1-indeksli poz: {p1}, {p2}\n"
+                    result_text += f"  Bozuk KS: {''.join(map(str,corrupted_cw))}\n"
+                    result_text += f"  Kod Çözücü Bilgisi: {info}\n"
+                    result_text += f"  Durum: {status} -> {'BAŞARILI (Düzeltilemez Olarak Tespit Edildi)' if is_pass else 'BAŞARISIZ (Gözden Kaçırıldı veya Yanlış Düzeltildi)'}\n"
+                    result_text += f"  Veri Eşleşmesi: {'HAYIR (düzeltilemez çift hata için bekleniyor)' if decoded_data != data_bits_orig and status==2 else ('HAYIR (beklenmedik)' if decoded_data != data_bits_orig else 'EVET (beklenmedik, SEC-DED için tek veya hiç hata gibi görünen belirli bir çift hata olabilir)')}\n\n"
+
+            result_text += "="*70 + "\n"
+            if scenario == "all":
+                result_text += f"Genel Test Sonucu: {'TÜM SENARYOLAR BAŞARILI' if all_tests_passed else 'BİR VEYA DAHA FAZLA SENARYO BAŞARISIZ OLDU'}\n"
+            else:
+                 result_text += "Belirli test senaryosu tamamlandı.\n"
+            self._display_text_result(self.test_result, result_text)
+            
+        except Exception as e:
+            messagebox.showerror("Test Hatası", f"Test başarısız: {str(e)}")
+            self._display_text_result(self.test_result, f"Hata: {str(e)}")
+
+
+    # --- Arka plan testleri ---
+    # İşçi iş parçacığı yalnızca kuyruğa yazar; Tk widget'larına yalnızca ana döngüdeki
+    # _poll_test_queue dokunur. Her iş bir belirteçle (token) işaretlenir; iptal edilmiş veya
+    # veri boyutu değiştiği için geçersizleşmiş bir işin geç gelen iletileri yok sayılır.
+
+    def start_background_test(self):
+        if self.test_cancel is not None:
+            return
+        data_str = self.test_data_entry.get().strip()
+        if len(data_str) != self.hamming.k or not all(c in '01' for c in data_str):
+            messagebox.showerror("Giriş Hatası", f"Lütfen test verisi için tam olarak {self.hamming.k} bit (0 ve 1) girin.")
+            return
+        try:
+            trials = int(self.test_trials_entry.get())
+            if trials < 1:
+                raise ValueError
+        except ValueError:
+            messagebox.showerror("Giriş Hatası", "Deneme sayısı pozitif bir tamsayı olmalıdır.")
+            return
+        try:
+            from hamming_testrun import iter_test_batches, test_mode_trials
+        except ImportError as e:
+            messagebox.showerror("Test Hatası", f"Toplu test için NumPy gereklidir: {str(e)}")
+            return
+
+        label = self.test_mode_var.get()
+        mode = BACKGROUND_TEST_MODES[label]
+        code = self.hamming
+        total = test_mode_trials(code.n, mode, trials)
+        cancel = threading.Event()
+        self.test_cancel = cancel
+        self.test_start_button.config(state=tk.DISABLED)
+        self.test_cancel_button.config(state=tk.NORMAL)
+        self.test_progress.config(maximum=total, value=0)
+        self.test_status_label.config(text=f"Çalışıyor: 0/{total}")
+        self._display_text_result(self.test_result,
+                                  f"Hamming {code.get_code_params_str()} SEC-DED için TOPLU TEST: {label}\n"
+                                  f"Test Verisi ({code.k} bit): {data_str}, {total} deneme\n{'=' * 70}\n")
+
+        def worker():
+            try:
+                for summary in iter_test_batches(code, int(data_str, 2), mode, trials):
+                    if cancel.is_set():
+                        break
+                    self.test_queue.put((cancel, "batch", summary))
+                self.test_queue.put((cancel, "done", cancel.is_set()))
+            except Exception as e:  # İşçi hatası ana döngüde gösterilir
+                self.test_queue.put((cancel, "error", str(e)))
+
+        self._test_totals = {"status_counts": [0, 0, 0, 0], "failed": 0, "done": 0, "total": total}
+        threading.Thread(target=worker, daemon=True).start()
+        self.root.after(TEST_POLL_MS, self._poll_test_queue)
+
+    def cancel_background_test(self):
+        if self.test_cancel is not None:
+            self.test_cancel.set()
+            self._finish_background_test("İptal edildi")
+
+    def _finish_background_test(self, message):
+        self.test_cancel = None
+        self.test_start_button.config(state=tk.NORMAL)
+        self.test_cancel_button.config(state=tk.DISABLED)
+        totals = self._test_totals
+        counts = totals["status_counts"]
+        self.test_status_label.config(text=f"{message}: {totals['done']}/{totals['total']} deneme, {totals['failed']} başarısız")
+        self._append_test_output(f"{'=' * 70}\n{message}. {totals['done']}/{totals['total']} deneme, "
+                                 f"{totals['failed']} başarısız. Durumlar: 0={counts[0]}, 1={counts[1]}, "
+                                 f"2={counts[2]}, 3={counts[3]}\n")
+
+    def _poll_test_queue(self):
+        lines = []
+        finished = None
+        for _ in range(TEST_POLL_MAX_MESSAGES):
+            try:
+                token, kind, payload = self.test_queue.get_nowait()
+            except queue.Empty:
+                break
+            if token is not self.test_cancel:
+                continue  # İptal edilmiş bir işten kalan ileti
+            totals = self._test_totals
+            if kind == "batch":
+                totals["done"] = payload["done"]
+                totals["failed"] += payload["failed"]
+                totals["status_counts"] = [a + b for a, b in zip(totals["status_counts"], payload["status_counts"])]
+                counts = payload["status_counts"]
+                lines.append(f"[{payload['done']:>9}/{payload['total']}] durum 0={counts[0]} 1={counts[1]} "
+                             f"2={counts[2]} 3={counts[3]}, başarısız: {payload['failed']}")
+                for positions, status in payload["failures"]:
+                    lines.append(f"    BAŞARISIZ: hata pozisyonları {', '.join(map(str, positions))} -> durum {status}")
+            elif kind == "done":
+                finished = "İptal edildi" if payload else ("TÜM DENEMELER BAŞARILI" if not totals["failed"] else "BAŞARISIZ DENEMELER VAR")
+            else:
+                lines.append(f"Hata: {payload}")
+                finished = "Hata nedeniyle durduruldu"
+            if finished:
+                break
+
+        if self.test_cancel is None:
+            return  # İptal edildi; sonuç zaten yazıldı
+        if lines:
+            self._append_test_output("\n".join(lines) + "\n")
+            self.test_progress.config(value=self._test_totals["done"])
+            self.test_status_label.config(text=f"Çalışıyor: {self._test_totals['done']}/{self._test_totals['total']}")
+        if finished:
+            self._finish_background_test(finished)
+        else:
+            self.root.after(TEST_POLL_MS, self._poll_test_queue)
+
+    def _append_test_output(self, text):
+        """ Metni sona ekler ve yalnızca son MAX_TEST_OUTPUT_LINES satırı tutar """
+        widget = self.test_result
+        widget.config(state=tk.NORMAL)
+        widget.insert(tk.END, text)
+        excess = int(widget.index('end-1c').split('.')[0]) - MAX_TEST_OUTPUT_LINES
+        if excess > 0:
+            widget.delete("1.0", f"{excess + 1}.0")
+        widget.config(state=tk.DISABLED)
+        widget.see(tk.END)
+
+
+def run_gui():
+    root = tk.Tk()
+    app = HammingGUI(root)
+    try:
+        root.mainloop()
+    finally:
+        app.close_loaded_file()
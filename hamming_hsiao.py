@@ -0,0 +1,292 @@
+"""
+Hsiao (tek ağırlıklı sütunlu) SEC-DED kodu.
+
+Eşlik denetim matrisi H'nin her sütunu tek ağırlıklıdır: kontrol bitleri birim sütunlar,
+veri bitleri ağırlığı 3, 5, ... olan farklı sütunlardır. Sütunlar satır ağırlıkları dengeli
+olacak şekilde seçilir; bu da daha sığ XOR ağaçları demektir. Tek hatalar tek ağırlıklı,
+çift hatalar çift ağırlıklı sendrom üretir, bu yüzden ayrı bir genel eşlik geçişine gerek yoktur.
+
+Kod sözcüğü düzeni sistematiktir: pozisyon 1..k veri bitleri, k+1..n kontrol bitleri (C0, C1, ...).
+API ve durum kodları HammingSECDED ile aynıdır; tek hatalar (veri veya kontrol biti) durum 1 ile
+düzeltilir, ayrı bir genel eşlik biti olmadığından durum 3 üretilmez.
+"""
+
+import time
+
+import numpy as np
+
+import hamming
+from hamming import DecodeResult, HammingSECDED, _int_to_lanes, _perf_ns, _popcount, _uint_dtype
+
+
+class HsiaoSECDED(HammingSECDED):
+    variant = "hsiao"
+    _shared_fields = HammingSECDED._shared_fields + ("r", "check_positions", "columns", "status_table",
+                                                     "correction_table", "data_correction_table")
+
+    def _compute_layout(self):
+        """
+        Kontrol biti sayısı r, 2^(r-1) - r >= k olan en küçük değerdir
+        (8, 16, 32, 64, 128 için Hamming ile aynı uzunluklar: (13,8), (22,16), (39,32), (72,64), (137,128)).
+        """
+        self.r = 3
+        while 2**(self.r - 1) - self.r < self.k:
+            self.r += 1
+
+        # HammingSECDED ile uyumlu alanlar
+        self.p_sec = self.r - 1
+        self.num_parity_bits_sec = self.r - 1
+        self.num_parity_bits_ded = self.r
+        self.n = self.k + self.r
+        self.data_positions = list(range(1, self.k + 1))
+        self.check_positions = list(range(self.k + 1, self.n + 1))
+        self.parity_positions_sec = self.check_positions
+        self.overall_parity_position = None
+        self.columns = self._select_columns()
+
+    def _select_columns(self):
+        """
+        Veri bitleri için H sütunlarını seçer: önce ağırlık 3, yetmezse 5, ... sütunları.
+        Her adımda en yüklü satırı en az artıran sütun seçilir (satır ağırlıkları dengelenir).
+        Sütunun j numaralı biti, j numaralı kontrol bitine (Cj) karşılık gelir.
+        """
+        row_weights = [0] * self.r
+        columns = []
+        for weight in range(3, self.r + 1, 2):
+            candidates = [c for c in range(1 << self.r) if _popcount(c) == weight]
+            while candidates and len(columns) < self.k:
+                def cost(c):
+                    rows = [j for j in range(self.r) if (c >> j) & 1]
+                    return max(row_weights[j] for j in rows), sum(row_weights[j] for j in rows), c
+                best = min(candidates, key=cost)
+                candidates.remove(best)
+                columns.append(best)
+                for j in range(self.r):
+                    row_weights[j] += (best >> j) & 1
+            if len(columns) == self.k:
+                break
+        return columns
+
+    def _build_int_tables(self):
+        """
+        encode_int/decode_int tabloları. Tamsayı gösteriminde veri üst k bit, kontrol biti Cj ise
+        (r - 1 - j) numaralı bittir; yani kod sözcüğü = (veri << r) | kontrol_bitleri.
+        """
+        k, r, n = self.k, self.r, self.n
+        self.codeword_mask = (1 << n) - 1
+        self.data_mask = (1 << k) - 1
+
+        # Kod sözcüğü tamsayısının her biti için H sütunu
+        column_of_cw_bit = [1 << (r - 1 - c) for c in range(r)] + \
+                           [self.columns[k - 1 - t] for t in range(k)]
+        # Kod çözücüde her kontrol satırının XOR'ladığı bitler
+        self.parity_masks = [sum(1 << c for c in range(n) if (column_of_cw_bit[c] >> j) & 1) for j in range(r)]
+
+        unit_codewords = []
+        for t in range(k):
+            cw = 1 << (r + t)
+            for j in range(r):
+                if (self.columns[k - 1 - t] >> j) & 1:
+                    cw |= 1 << (r - 1 - j)
+            unit_codewords.append(cw)
+        self.data_columns = unit_codewords[::-1]
+        data_bit_of_cw_bit = [0] * r + [1 << t for t in range(k)]
+        self.syndrome_columns = column_of_cw_bit
+
+        self.encode_tables = self._build_byte_tables(unit_codewords)
+        self.decode_tables = list(zip(self._build_byte_tables(column_of_cw_bit),
+                                      self._build_byte_tables(data_bit_of_cw_bit)))
+
+        # Sendrom -> (durum, kod sözcüğü düzeltme maskesi, veri düzeltme maskesi)
+        self.status_table = [2] * (1 << r)
+        self.correction_table = [0] * (1 << r)
+        self.data_correction_table = [0] * (1 << r)
+        self.status_table[0] = 0
+        for c, column in enumerate(column_of_cw_bit):
+            self.status_table[column] = 1
+            self.correction_table[column] = 1 << c
+            self.data_correction_table[column] = data_bit_of_cw_bit[c]
+
+    def get_code_params_str(self):
+        return f"({self.n},{self.k})"
+
+    def _bits_to_int(self, bits, length, what):
+        if len(bits) != length:
+            raise ValueError(f"{what} tam olarak {length} bit olmalıdır.")
+        value = 0
+        for b in bits:
+            value = (value << 1) | b
+        return value
+
+    def encode(self, data_bits_list):
+        """
+        k-bit veriyi Hsiao SEC-DED kodu ile kodlar.
+        data_bits_list: k bitlik liste [d_msb, ..., d_lsb].
+        Dönüş: n-bitlik kod sözcüğü listesi (önce veri, sonra kontrol bitleri).
+        """
+        codeword = self.encode_int(self._bits_to_int(data_bits_list, self.k, "Veri"))
+        return [(codeword >> (self.n - 1 - i)) & 1 for i in range(self.n)]
+
+    def _calculate_syndrome_and_overall_parity_status(self, received_codeword_list):
+        """
+        Dönüş: (sendrom_degeri, genel_eslik_dogru_mu)
+        Hsiao kodunda genel eşlik, sendrom ağırlığının çift olmasına karşılık gelir.
+        """
+        if len(received_codeword_list) != self.n:
+            raise ValueError(f"Alınan kod sözcüğü {self.n} bit olmalıdır.")
+        codeword = self._bits_to_int(received_codeword_list, self.n, "Kod sözcüğü")
+        metrics = hamming._metrics
+        if metrics is not None:
+            start = _perf_ns()
+        syndrome_val = 0
+        for mask in self.lut_syndrome_masks:
+            syndrome_val = (syndrome_val << 1) | (_popcount(codeword & mask) & 1)
+        if metrics is not None:
+            metrics.record_stage(self, "list", "syndrome", _perf_ns() - start)
+        return syndrome_val, not (_popcount(syndrome_val) & 1)
+
+    def decode(self, received_codeword_list, structured=False):
+        """
+        Alınan n-bitlik kod sözcüğünü çöz ve hataları tespit et/düzelt.
+        Dönüş: (duzeltilmis_veri_bitleri, hata_durum_kodu, hata_bilgisi)
+        structured=True ise hata_bilgisi mesaj yerine DecodeResult(durum, sendrom, düzeltilen_pozisyon) olur.
+        """
+        codeword = self._bits_to_int(received_codeword_list, self.n, "Alınan kod sözcüğü")
+        data, error_status_code, syndrome_val = self.decode_int(codeword)
+        if structured:
+            error_info = DecodeResult(error_status_code, syndrome_val,
+                                      self.corrected_position(error_status_code, syndrome_val))
+        elif error_status_code == 0:
+            error_info = "Hata tespit edilmedi."
+        elif error_status_code == 1:
+            error_position = self.n - self.correction_table[syndrome_val].bit_length() + 1
+            error_info = f"Pozisyon {error_position}'de (0-indeksli: {error_position-1}) tek hata düzeltildi."
+        elif _popcount(syndrome_val) & 1:
+            error_info = f"Düzeltilemez hata (sendrom {syndrome_val} tek ağırlıklı ama H'nin bir sütunu değil)."
+        else:
+            error_info = f"Çift hata tespit edildi (sendrom {syndrome_val}, çift ağırlıklı). Düzeltilemez."
+        return [(data >> (self.k - 1 - i)) & 1 for i in range(self.k)], error_status_code, error_info
+
+    def decode_int(self, codeword):
+        """
+        Dönüş: (duzeltilmis_veri, hata_durum_kodu, sendrom_degeri); sendrom r bitliktir.
+        """
+        if not 0 <= codeword <= self.codeword_mask:
+            raise ValueError(f"Kod sözcüğü 0 ile {self.codeword_mask} arasında olmalıdır.")
+        metrics = hamming._metrics
+        if metrics is not None:
+            start = _perf_ns()
+        syndrome_val = 0
+        data = 0
+        cw = codeword
+        for syndrome_table, extract_table in self.decode_tables:
+            byte = cw & 0xFF
+            syndrome_val ^= syndrome_table[byte]
+            data ^= extract_table[byte]
+            cw >>= 8
+        error_status_code = self.status_table[syndrome_val]
+        if metrics is not None:
+            metrics.record_stage(self, "int", "decode", _perf_ns() - start)
+            metrics.record_status(self, error_status_code, self.corrected_position(error_status_code, syndrome_val))
+        return data ^ self.data_correction_table[syndrome_val], error_status_code, syndrome_val
+
+    def _build_numpy_tables(self):
+        attrs, tables = super()._build_numpy_tables()
+        attrs["syndrome_dtype"] = _uint_dtype(self.r)
+        tables["status"] = np.array(self.status_table, dtype=np.uint8)
+        tables["correction"] = np.array([_int_to_lanes(c, attrs["codeword_lanes"]) for c in self.correction_table],
+                                        dtype=attrs["codeword_dtype"])
+        return attrs, tables
+
+    def decode_batch(self, codewords):
+        """
+        Bir kod sözcüğü dizisini toplu çözer (sendrom: kontrol satırı maskeleriyle vektörel eşlik).
+        Dönüş: (duzeltilmis_veri, hata_durum_kodlari, sendromlar) dizileri.
+        """
+        tables = self._get_numpy_tables()
+        cw = self._check_words(codewords, self.n, self.codeword_lanes, self.codeword_dtype, "Kod sözcüğü")
+        lanes = self.codeword_lanes
+        metrics = hamming._metrics
+        if metrics is not None:
+            start = _perf_ns()
+
+        syndromes = np.zeros(cw.shape[:-1] if lanes else cw.shape, dtype=self.syndrome_dtype)
+        for j, mask in enumerate(tables["parity_masks"]):
+            syndromes |= (self._parity_rows(cw & mask, lanes).astype(self.syndrome_dtype) << self.syndrome_dtype.type(j))
+        if metrics is not None:
+            start = self._record_batch_stage(metrics, "syndrome", start, len(syndromes))
+
+        corrected = cw ^ tables["correction"][syndromes]
+        if metrics is not None:
+            start = self._record_batch_stage(metrics, "correction", start, len(syndromes))
+        shape = syndromes.shape + (self.data_lanes,) if self.data_lanes else syndromes.shape
+        data = np.zeros(shape, dtype=self.data_dtype)
+        for j, table in enumerate(tables["extract"]):
+            data ^= table[self._byte_at(corrected, j, lanes)]
+        status = tables["status"][syndromes]
+        if metrics is not None:
+            self._record_batch_stage(metrics, "extract", start, len(syndromes))
+            self._record_batch_status(metrics, status, syndromes)
+        return data, status, syndromes
+
+    def _check_bits(self):
+        return [(f"C{j}", self.r - 1 - j, mask) for j, mask in enumerate(self.parity_masks)]
+
+
+def _summarize_tree(report):
+    return {
+        "encoder_gates": sum(row["encoder_gates"] for row in report),
+        "encoder_depth": max(row["encoder_depth"] for row in report),
+        "decoder_gates": sum(row["decoder_gates"] for row in report),
+        "decoder_depth": max(row["decoder_depth"] for row in report),
+    }
+
+
+def _time_per_word(func, count, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best / count
+
+
+def compare_layouts(k_values=(8, 16, 32, 64), words=1 << 16, seed=0):
+    """
+    Her k için standart (genişletilmiş Hamming) ve Hsiao düzenlerini karşılaştırır:
+    XOR kapısı sayıları, mantık derinlikleri ve yazılım kod çözme süreleri.
+    Dönüş: satır sözlüklerinin listesi.
+    """
+    rng = np.random.default_rng(seed)
+    rows = []
+    for k in k_values:
+        for layout, cls in (("Hamming", HammingSECDED), ("Hsiao", HsiaoSECDED)):
+            code = cls(k)
+            code._get_numpy_tables()
+            data = rng.integers(0, 2**min(k, 64), size=(words, code.data_lanes) if code.data_lanes else words,
+                                dtype=np.uint64).astype(code.data_dtype)
+            codewords = code.encode_batch(data)
+            scalar = [code.encode_int(w) for w in range(min(code.data_mask + 1, 1000))]
+            rows.append({
+                "layout": layout, "k": k, "n": code.n, "checks": code.xor_tree_report(),
+                **_summarize_tree(code.xor_tree_report()),
+                "decode_batch_ns": _time_per_word(lambda: code.decode_batch(codewords), words) * 1e9,
+                "decode_int_ns": _time_per_word(lambda: [code.decode_int(cw) for cw in scalar], len(scalar)) * 1e9,
+            })
+    return rows
+
+
+def format_comparison(rows, per_check=False):
+    lines = [f"{'Düzen':<8}{'Kod':>10}{'Kod. kapı':>11}{'Kod. der.':>11}{'Çöz. kapı':>11}{'Çöz. der.':>11}"
+             f"{'batch ns/sözcük':>17}{'int ns/sözcük':>15}"]
+    for row in rows:
+        lines.append(f"{row['layout']:<8}{'(%d,%d)' % (row['n'], row['k']):>10}{row['encoder_gates']:>11}"
+                     f"{row['encoder_depth']:>11}{row['decoder_gates']:>11}{row['decoder_depth']:>11}"
+                     f"{row['decode_batch_ns']:>17.1f}{row['decode_int_ns']:>15.1f}")
+        if per_check:
+            for check in row["checks"]:
+                lines.append(f"    {check['check']:<6} kodlayıcı: {check['encoder_inputs']:>3} giriş, "
+                             f"{check['encoder_gates']:>3} kapı, derinlik {check['encoder_depth']}; "
+                             f"kod çözücü: {check['decoder_inputs']:>3} giriş, {check['decoder_gates']:>3} kapı, "
+                             f"derinlik {check['decoder_depth']}")
+    return "\n".join(lines)
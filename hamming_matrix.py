@@ -0,0 +1,277 @@
+"""
+GF(2) üreteç (G) ve eşlik denetim (H) matrisleri, matris tabanlı toplu motor ve dışa aktarım.
+
+Kodun yapısı hamming.py'de tablolara dağılmış hâldedir (parity_positions_sec, data_positions,
+syndrome_columns, ...). CodeMatrices bunları açık matrislere çevirir:
+    G (k x n): i. satır, i. veri bitinin (MSB önce) tek başına ürettiği kod sözcüğü (data_columns[i]),
+    H (s x n): j. satır, genişletilmiş sendromun j. bitine giren kod sözcüğü bitleri.
+Satırlar kod sözcüğü tamsayısı düzeninde (1-indeksli p pozisyonu n - p numaralı bit) uint64
+şeritlerine paketlenir; şerit 0 en düşük anlamlı 64 bittir. Matrisler yalnızca paylaşılan
+tablolardan türetildiği için standart, Hsiao ve kısaltılmış kodların hepsinde aynı şekilde çalışır.
+
+    m = HammingSECDED(64).matrices()     # örnekte saklanır
+    codewords = m.encode(data)           # veri · G, encode_batch ile aynı bitler
+    syndromes = m.syndrome(codewords)    # H · cwᵀ (genişletilmiş sendrom)
+    data, status, syndromes = m.decode(codewords)
+    print(m.to_verilog())
+
+Dışa aktarımda kod sözcüğü pozisyonları c1..cn (1-indeksli), veri bitleri d0..d(k-1) (MSB önce)
+olarak adlandırılır; Verilog çıktısında c[n-p] = cp ve d[k-1-i] = di'dir (tamsayı API'siyle aynı).
+"""
+
+import json
+
+from hamming import _int_to_lanes, _num_lanes, _parity_np, _require_numpy, _uint_dtype
+
+__all__ = ["CodeMatrices"]
+
+
+class CodeMatrices:
+    def __init__(self, code):
+        """ code: HammingSECDED (veya alt sınıfı) örneği """
+        self.code = code
+        self.variant = code.variant
+        self.k, self.n = code.k, code.n
+        n = self.n
+        width = max(code.syndrome_columns).bit_length()
+        # Tamsayı satırlar: G[i] ve H[j] kod sözcüğü tamsayısı düzeninde
+        self.generator_rows = list(code.data_columns)
+        self.parity_check_rows = [sum(1 << c for c, column in enumerate(code.syndrome_columns) if (column >> j) & 1)
+                                  for j in range(width)]
+        self.sec_shift = 0 if code.overall_parity_position is None else 1
+
+        # Pozisyon adları: veri bitleri di, kontrol bitleri _check_bits adlarıyla (P1, Po, C0, ...)
+        self.position_names = {p: f"c{p}" for p in range(1, n + 1)}
+        for i, p in enumerate(code.data_positions):
+            self.position_names[p] = f"d{i}"
+        check_names = {}
+        for name, bit, mask in code._check_bits():
+            self.position_names[n - bit] = name
+            check_names[mask] = name
+        # H satırı adı: aynı bitleri XOR'layan kontrolün adı (yoksa sendrom biti Sj)
+        self.syndrome_names = [check_names.get(row, f"S{j}") for j, row in enumerate(self.parity_check_rows)]
+        self.check_positions = [p for p in range(1, n + 1) if p not in set(code.data_positions)]
+        self._packed = None
+
+    @property
+    def r(self):
+        """ H'nin satır sayısı (genişletilmiş sendrom genişliği) """
+        return len(self.parity_check_rows)
+
+    def __repr__(self):
+        return f"<CodeMatrices {self.variant}({self.n},{self.k}) G={self.k}x{self.n} H={self.r}x{self.n}>"
+
+    # --- Paketli matrisler ve toplu çekirdekler ---
+
+    def _get_packed(self):
+        """
+        G, H (uint64 şerit satırları) ve çekirdek tabloları; ilk toplu çağrıda oluşturulur.
+        Gᵀ'nin kontrol pozisyonlarına ait satırları (veri şeritlerinde) kodlayıcının eşlik maskeleridir;
+        veri pozisyonlarındaki birim sütunlar extract_runs (kaydırma, maske) gruplarıyla taşınır.
+        """
+        if self._packed is None:
+            np = _require_numpy()
+            code = self.code
+            code._get_numpy_tables()
+            words, data_words = max(_num_lanes(self.n), 1), max(_num_lanes(self.k), 1)
+            flips = [0] * (1 << self.r)
+            status = [entry[0] for entry in code.syndrome_lut]
+            for c, column in enumerate(code.syndrome_columns):
+                flips[column] = 1 << c
+            check_columns = [sum(1 << (self.k - 1 - i) for i in inputs) for _, _, inputs in self.encoder_equations()]
+            self._packed = {
+                "G": np.array([_int_to_lanes(row, words) for row in self.generator_rows], dtype=np.uint64),
+                "H": np.array([_int_to_lanes(row, words) for row in self.parity_check_rows], dtype=np.uint64),
+                "check_columns": np.array([_int_to_lanes(c, data_words) for c in check_columns], dtype=np.uint64),
+                "check_bits": [self.n - p for p in self.check_positions],
+                "runs": [(shift, np.array(_int_to_lanes(mask, data_words), dtype=np.uint64))
+                         for shift, mask in code.extract_runs],
+                "flip": np.array([_int_to_lanes(f, words) for f in flips], dtype=np.uint64),
+                "status": np.array(status, dtype=np.uint8),
+            }
+        return self._packed
+
+    @staticmethod
+    def _to_lane_matrix(values, lanes):
+        """ Tek boyutlu değerleri veya (N, şerit) dizisini (N, max(şerit, 1)) uint64 matrisine çevirir """
+        np = _require_numpy()
+        if lanes:
+            return values.astype(np.uint64, copy=False)
+        return values.astype(np.uint64).reshape(-1, 1)
+
+    @staticmethod
+    def _from_lane_matrix(matrix, dtype, lanes):
+        return matrix if lanes else matrix[:, 0].astype(dtype)
+
+    @staticmethod
+    def _shift_lanes(values, shift, words):
+        """ Şerit matrisini shift kadar sola (negatifse sağa) kaydırır; sonuç words şeritlidir """
+        np = _require_numpy()
+        out = np.zeros((len(values), words), dtype=np.uint64)
+        lanes = values.shape[1]
+        q, s = divmod(abs(shift), 64)
+        step = -1 if shift >= 0 else 1
+        for w in range(words):
+            src = w - q if shift >= 0 else w + q
+            if 0 <= src < lanes:
+                out[:, w] |= values[:, src] << np.uint64(s) if shift >= 0 else values[:, src] >> np.uint64(s)
+            # Komşu şeritten taşan bitler
+            if s and 0 <= src + step < lanes:
+                carry = values[:, src + step]
+                out[:, w] |= carry >> np.uint64(64 - s) if shift >= 0 else carry << np.uint64(64 - s)
+        return out
+
+    @staticmethod
+    def _parity_lanes(values):
+        """ (N, şerit) matrisinin satır başına bit eşliği: şeritler XOR ile katlanır, sonra popcount & 1 """
+        np = _require_numpy()
+        folded = np.bitwise_xor.reduce(values, axis=1) if values.shape[1] > 1 else values[:, 0]
+        return _parity_np(folded)
+
+    def encode(self, data_words):
+        """
+        Toplu kodlama: kod sözcüğü = veri · G. G sistematik olduğundan (veri pozisyonlarında birim sütunlar)
+        veri bitleri ardışık gruplar hâlinde kaydırılarak yerleştirilir; her kontrol biti, veri ile Gᵀ'nin
+        ilgili satırının AND'inin eşliğidir (kontrol biti başına bir popcount geçişi).
+        Girdi/çıktı tipleri encode_batch ile aynıdır.
+        """
+        np = _require_numpy()
+        code = self.code
+        packed = self._get_packed()
+        data = self._to_lane_matrix(code._check_words(data_words, self.k, code.data_lanes, code.data_dtype, "Veri"),
+                                    code.data_lanes)
+        words = packed["G"].shape[1]
+        codewords = np.zeros((len(data), words), dtype=np.uint64)
+        for shift, mask in packed["runs"]:
+            codewords |= self._shift_lanes(data & mask, shift, words)
+        for bit, column in zip(packed["check_bits"], packed["check_columns"]):
+            codewords[:, bit >> 6] |= self._parity_lanes(data & column).astype(np.uint64) << np.uint64(bit & 63)
+        return self._from_lane_matrix(codewords, code.codeword_dtype, code.codeword_lanes)
+
+    def _syndrome_lanes(self, codewords):
+        packed = self._get_packed()
+        syndrome_dtype = _uint_dtype(self.r)
+        syndromes = _require_numpy().zeros(len(codewords), dtype=syndrome_dtype)
+        for j, row in enumerate(packed["H"]):
+            syndromes |= self._parity_lanes(codewords & row).astype(syndrome_dtype) << syndrome_dtype.type(j)
+        return syndromes
+
+    def syndrome(self, codewords):
+        """
+        Toplu genişletilmiş sendrom: H · cwᵀ. Her H satırı için AND ve eşlik (popcount & 1) hesaplanır;
+        şeritli kodlarda şeritler önce XOR ile katlanır. Sonuç syndrome_lut dizinidir.
+        """
+        code = self.code
+        cw = code._check_words(codewords, self.n, code.codeword_lanes, code.codeword_dtype, "Kod sözcüğü")
+        return self._syndrome_lanes(self._to_lane_matrix(cw, code.codeword_lanes))
+
+    def decode(self, codewords):
+        """
+        Matris motoruyla toplu çözme. Dönüş decode_batch ile aynıdır:
+        (duzeltilmis_veri, hata_durum_kodlari, sendromlar); sendrom, genel eşlik biti olan düzende
+        genişletilmiş sendromun bir sağa kaydırılmış hâlidir.
+        """
+        np = _require_numpy()
+        code = self.code
+        packed = self._get_packed()
+        cw = code._check_words(codewords, self.n, code.codeword_lanes, code.codeword_dtype, "Kod sözcüğü")
+        cw = self._to_lane_matrix(cw, code.codeword_lanes)
+        ext = self._syndrome_lanes(cw)
+        corrected = cw ^ packed["flip"][ext]
+        data_words = max(code.data_lanes, 1)
+        data = np.zeros((len(cw), data_words), dtype=np.uint64)
+        for shift, mask in packed["runs"]:
+            data |= self._shift_lanes(corrected, -shift, data_words) & mask
+        syndromes = (ext >> ext.dtype.type(self.sec_shift)).astype(code.syndrome_dtype)
+        return self._from_lane_matrix(data, code.data_dtype, code.data_lanes), packed["status"][ext], syndromes
+
+    # --- Denklemler ve dışa aktarım ---
+
+    def encoder_equations(self):
+        """ Her kontrol pozisyonu için (ad, pozisyon, XOR'lanan veri biti indeksleri) """
+        equations = []
+        for p in self.check_positions:
+            bit = self.n - p
+            inputs = [i for i, row in enumerate(self.generator_rows) if (row >> bit) & 1]
+            equations.append((self.position_names[p], p, inputs))
+        return equations
+
+    def syndrome_equations(self):
+        """ Her sendrom biti için (ad, sendrom biti, XOR'lanan 1-indeksli kod sözcüğü pozisyonları) """
+        return [(name, j, [p for p in range(1, self.n + 1) if (row >> (self.n - p)) & 1])
+                for j, (name, row) in enumerate(zip(self.syndrome_names, self.parity_check_rows))]
+
+    def to_dict(self):
+        """ JSON'a uygun betimleme: matrisler bit dizeleri (pozisyon 1..n soldan sağa) ve onaltılık satırlar """
+        return {
+            "variant": self.variant,
+            "code": self.code.get_code_params_str(),
+            "n": self.n,
+            "k": self.k,
+            "data_positions": list(self.code.data_positions),
+            "check_positions": {self.position_names[p]: p for p in self.check_positions},
+            "generator": [format(row, f"0{self.n}b") for row in self.generator_rows],
+            "generator_hex": [f"{row:#x}" for row in self.generator_rows],
+            "parity_check": [format(row, f"0{self.n}b") for row in self.parity_check_rows],
+            "parity_check_hex": [f"{row:#x}" for row in self.parity_check_rows],
+            "syndrome_bits": self.syndrome_names,
+            "encoder_equations": {name: [f"d{i}" for i in inputs] for name, _, inputs in self.encoder_equations()},
+            "syndrome_equations": {name: [f"c{p}" for p in positions]
+                                   for name, _, positions in self.syndrome_equations()},
+        }
+
+    def to_json(self, indent=2):
+        return json.dumps(self.to_dict(), indent=indent, ensure_ascii=False)
+
+    def to_text(self):
+        """ İnsan tarafından okunabilir matrisler ve XOR denklemleri """
+        n = self.n
+        label = max(len(name) for name in [f"d{self.k - 1}"] + self.syndrome_names)
+        lines = [f"{self.variant} {self.code.get_code_params_str()} SEC-DED matrisleri",
+                 f"Pozisyonlar 1..{n} soldan sağa; veri bitleri: " +
+                 ", ".join(f"d{i}=c{p}" for i, p in enumerate(self.code.data_positions)), "",
+                 f"G ({self.k} x {n}):"]
+        lines += [f"  {f'd{i}':>{label}}  {format(row, f'0{n}b')}" for i, row in enumerate(self.generator_rows)]
+        lines += ["", f"H ({self.r} x {n}):"]
+        lines += [f"  {name:>{label}}  {format(row, f'0{n}b')}"
+                  for name, row in zip(self.syndrome_names, self.parity_check_rows)]
+        lines += ["", "Kodlayıcı denklemleri:"]
+        lines += [f"  {name} (c{p}) = {' ^ '.join(f'd{i}' for i in inputs) or '0'}"
+                  for name, p, inputs in self.encoder_equations()]
+        lines += ["", "Sendrom denklemleri:"]
+        lines += [f"  {name} = {' ^ '.join(f'c{p}' for p in positions) or '0'}"
+                  for name, _, positions in self.syndrome_equations()]
+        return "\n".join(lines)
+
+    def to_verilog(self, module_prefix=None):
+        """
+        Verilog-2001 kodlayıcı ve sendrom modülleri (yalnızca assign ifadeleri).
+        c[n-p] = cp, d[k-1-i] = di; sendrom biti j, syndrome_lut dizininin j. bitidir.
+        """
+        n, k = self.n, self.k
+        prefix = module_prefix or f"{self.variant}_secded_{n}_{k}"
+        data_index = {p: i for i, p in enumerate(self.code.data_positions)}
+        lines = [f"// {self.variant} {self.code.get_code_params_str()} SEC-DED; hamming_matrix tarafından üretildi",
+                 "// c[n-p] = 1-indeksli p pozisyonu, d[k-1-i] = i. veri biti (MSB önce)", "",
+                 f"module {prefix}_encoder (",
+                 f"    input  wire [{k - 1}:0] d,",
+                 f"    output wire [{n - 1}:0] c",
+                 ");"]
+        equations = {p: inputs for _, p, inputs in self.encoder_equations()}
+        for p in range(1, n + 1):
+            if p in data_index:
+                lines.append(f"    assign c[{n - p}] = d[{k - 1 - data_index[p]}];")
+            else:
+                expr = " ^ ".join(f"d[{k - 1 - i}]" for i in equations[p]) or "1'b0"
+                lines.append(f"    assign c[{n - p}] = {expr};  // {self.position_names[p]}")
+        lines += ["endmodule", "",
+                  f"module {prefix}_syndrome (",
+                  f"    input  wire [{n - 1}:0] c,",
+                  f"    output wire [{self.r - 1}:0] s",
+                  ");"]
+        for name, j, positions in self.syndrome_equations():
+            expr = " ^ ".join(f"c[{n - p}]" for p in positions) or "1'b0"
+            lines.append(f"    assign s[{j}] = {expr};  // {name}")
+        lines.append("endmodule")
+        return "\n".join(lines) + "\n"
+
@@ -0,0 +1,152 @@
+"""
+SEC-DED korumalı büyük bir RAM modeli için bellek temizleme (scrubbing) simülatörü.
+
+Bellek, kod sözcüklerinden oluşan paketli bir NumPy dizisidir (sözcük başına en küçük işaretsiz tip,
+64 bitten genişse uint64 şeritleri). Yumuşak hatalar (soft error), bit başına sabit bir bozulma oranıyla
+Poisson süreci olarak eklenir. Arka plan temizleyicisi diziyi sabit hızla dilim dilim dolaşır; her dilim
+tek bir decode_batch çağrısıyla çözülür, tek hatalar yerinde düzeltilir, düzeltilemezler kaydedilir.
+Zaman birimi saniyedir.
+"""
+
+import math
+
+import numpy as np
+
+from hamming import HammingSECDED
+
+DEFAULT_SLICE_WORDS = 1 << 16
+
+
+class ECCMemory:
+    """
+    code: encode_batch/decode_batch API'sine sahip bir kod (HammingSECDED, HsiaoSECDED, ...).
+    keep_reference=True ise orijinal veri saklanır ve yanlış düzeltmeler (sessiz veri bozulması) sayılır.
+    """
+
+    def __init__(self, code, num_words, seed=0, keep_reference=True):
+        self.code = code
+        code._get_numpy_tables()
+        self.num_words = num_words
+        self.rng = np.random.default_rng(seed)
+        if code.data_lanes:
+            data = self.rng.integers(0, np.iinfo(np.uint64).max, size=(num_words, code.data_lanes),
+                                     endpoint=True, dtype=np.uint64)
+            data[:, -1] &= np.uint64((1 << (code.k - 64 * (code.data_lanes - 1))) - 1)
+        else:
+            data = self.rng.integers(0, code.data_mask, size=num_words, endpoint=True,
+                                     dtype=np.uint64).astype(code.data_dtype)
+        self.reference = data if keep_reference else None
+        self.codewords = code.encode_batch(data)
+        self.events = []  # (zaman, sözcük indeksi) düzeltilemez hata kaydı
+
+    def inject_upsets(self, upset_rate, duration):
+        """
+        duration saniye boyunca bit başına upset_rate (1/s) oranıyla Poisson yumuşak hataları ekler.
+        Dönüş: eklenen bit çevirme sayısı.
+        """
+        expected = upset_rate * self.num_words * self.code.n * duration
+        count = int(self.rng.poisson(expected))
+        if count:
+            words = self.rng.integers(0, self.num_words, size=count)
+            bits = self.rng.integers(0, self.code.n, size=count)
+            if self.code.codeword_lanes:
+                np.bitwise_xor.at(self.codewords, (words, bits >> 6),
+                                  np.left_shift(np.uint64(1), (bits & 63).astype(np.uint64)))
+            else:
+                dtype = self.code.codeword_dtype
+                np.bitwise_xor.at(self.codewords, words,
+                                  np.left_shift(dtype.type(1), bits.astype(dtype)))
+        return count
+
+    def _rewrite(self, start, indices, data):
+        """ Verilen sözcükleri (dilim içi indeksler) data ile yeniden kodlayıp yazar """
+        if len(indices):
+            self.codewords[start + indices] = self.code.encode_batch(data[indices])
+
+    def scrub_slice(self, start, count, now=0.0, max_events=10000):
+        """
+        [start, start+count) aralığını toplu çözer; tek hataları yerinde düzeltir.
+        Düzeltilemez sözcükler kaydedilir ve (işletim sisteminin sayfayı geri yüklemesi gibi)
+        referans veriyle yeniden yazılır. Dönüş: {"corrected", "uncorrectable", "miscorrected", "silent"}
+        """
+        data, status, _ = self.code.decode_batch(self.codewords[start:start + count])
+        fixed = np.flatnonzero((status == 1) | (status == 3))
+        bad = np.flatnonzero(status == 2)
+        miscorrected = silent = 0
+        if self.reference is not None:
+            reference = self.reference[start:start + count]
+            wrong = data != reference
+            if wrong.ndim == 2:
+                wrong = wrong.any(axis=1)
+            miscorrected = int(np.count_nonzero(wrong[fixed]))
+            undetected = np.flatnonzero(wrong & (status == 0))
+            silent = len(undetected)
+            self._rewrite(start, fixed, reference)
+            self._rewrite(start, bad, reference)
+            self._rewrite(start, undetected, reference)
+        else:
+            self._rewrite(start, fixed, data)
+            self._rewrite(start, bad, data)
+        room = max_events - len(self.events)
+        if room > 0:
+            self.events.extend((now, int(start + i)) for i in bad[:room])
+        return {"corrected": len(fixed) - miscorrected, "uncorrectable": len(bad),
+                "miscorrected": miscorrected, "silent": silent}
+
+
+def simulate_scrubbing(code, num_words, upset_rate, scrub_interval, duration,
+                       slice_words=DEFAULT_SLICE_WORDS, seed=0):
+    """
+    Temizleyici tüm diziyi her scrub_interval saniyede bir dolaşırken duration saniyelik çalışmayı simüle eder.
+    Dönüş: {"scrub_interval", "duration", "upsets", "corrected", "uncorrectable", "miscorrected", "silent",
+            "uncorrectable_rate" (1/s), "mttf" (s, herhangi bir veri kaybına kadar),
+            "analytic_rate" (1/s, yaklaşık), "events"}
+    """
+    if scrub_interval <= 0 or duration <= 0:
+        raise ValueError("Temizleme aralığı ve süre pozitif olmalıdır.")
+    memory = ECCMemory(code, num_words, seed=seed)
+    slice_words = min(slice_words, num_words)
+
+    totals = {"upsets": 0, "corrected": 0, "uncorrectable": 0, "miscorrected": 0, "silent": 0}
+    now = 0.0
+    position = 0
+    while now < duration:
+        count = min(slice_words, num_words - position)
+        # Dilimin süresi sözcük sayısıyla orantılıdır; geçişin kısa son dilimi de daha kısa sürer,
+        # böylece bir tam geçiş tam olarak scrub_interval sürer
+        dt = min(scrub_interval * count / num_words, duration - now)
+        totals["upsets"] += memory.inject_upsets(upset_rate, dt)
+        now += dt
+        for key, value in memory.scrub_slice(position, count, now).items():
+            totals[key] += value
+        position = (position + count) % num_words
+
+    # Yaklaşık analitik oran: bir sözcük temizlemeler arasında (T süresinde) 2+ hata alırsa düzeltilemez
+    per_word = upset_rate * code.n * scrub_interval
+    p_multi = -math.expm1(-per_word) - per_word * math.exp(-per_word)
+    failures = totals["uncorrectable"] + totals["miscorrected"] + totals["silent"]
+    return {
+        "scrub_interval": scrub_interval, "duration": duration, **totals,
+        "uncorrectable_rate": totals["uncorrectable"] / duration,
+        "mttf": duration / failures if failures else math.inf,
+        "analytic_rate": num_words * p_multi / scrub_interval,
+        "events": memory.events,
+    }
+
+
+def scrub_interval_sweep(k, num_words, upset_rate, intervals, duration, code_cls=HammingSECDED, **kwargs):
+    """ Her temizleme aralığı için simulate_scrubbing sonuçlarının listesi """
+    return [simulate_scrubbing(code_cls(k), num_words, upset_rate, interval, duration, **kwargs)
+            for interval in intervals]
+
+
+def format_sweep(results):
+    """ Tarama sonuçlarını saat başına oranlarla tablo olarak biçimlendirir """
+    lines = [f"{'Aralık (s)':>12}{'Upset':>12}{'Düzeltilen':>12}{'Düzeltilemez':>14}{'Yanlış düz.':>13}"
+             f"{'Sessiz':>8}{'Oran (1/sa)':>14}{'Analitik (1/sa)':>17}{'MTTF (sa)':>12}"]
+    for r in results:
+        mttf = "sonsuz" if math.isinf(r["mttf"]) else f"{r['mttf'] / 3600:.3g}"
+        lines.append(f"{r['scrub_interval']:>12g}{r['upsets']:>12}{r['corrected']:>12}{r['uncorrectable']:>14}"
+                     f"{r['miscorrected']:>13}{r['silent']:>8}{r['uncorrectable_rate'] * 3600:>14.3g}"
+                     f"{r['analytic_rate'] * 3600:>17.3g}{mttf:>12}")
+    return "\n".join(lines)
@@ -0,0 +1,157 @@
+"""
+Kodlayıcı/çözücü için isteğe bağlı ölçümleme (instrumentation).
+
+hamming.enable_metrics() çağrılana kadar sıcak noktalardaki tek maliyet bir `is not None` karşılaştırmasıdır.
+Etkinleştirildiğinde şunlar toplanır:
+  - durum koduna (0..3) göre çözülen sözcük sayıları,
+  - düzeltilen bitlerin 1-indeksli pozisyon histogramı (tek bir pozisyonda yığılma takılı bir hücreye işaret eder),
+  - (motor, aşama) başına çağrı/sözcük sayısı ve toplam süre: encode, syndrome, correction, extract, decode.
+Hepsi kod başına ("hamming(13,8)" gibi) ayrı tutulur. Anlık görüntü JSON olarak veya Prometheus metin biçiminde
+(node_exporter textfile toplayıcısı için) dışa aktarılır. Sayaçlar süreç başınadır; süreç havuzlarında her işçi
+kendi sayaçlarını tutar.
+
+    from hamming import HammingSECDED, enable_metrics
+    metrics = enable_metrics()
+    ...
+    metrics.write_prometheus("/var/lib/node_exporter/hamming.prom")
+"""
+
+import json
+import os
+import threading
+import time
+
+__all__ = ["CodecMetrics", "STAGES"]
+
+# Bilinen aşama adları (motorlar ayrıca "list", "int", "lut", "batch" olarak ayrılır)
+STAGES = ("encode", "syndrome", "correction", "extract", "decode")
+
+
+def _code_label(code):
+    return f"{code.variant}{code.get_code_params_str()}"
+
+
+class CodecMetrics:
+    """ İş parçacığı güvenli sayaçlar; hamming modülündeki sıcak noktalar tarafından doldurulur """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.started = time.time()
+            self._codes = {}   # etiket -> {"variant", "n", "k", "status_counts", "positions"}
+            self._stages = {}  # (etiket, motor, aşama) -> [çağrı, sözcük, toplam_ns, en_uzun_ns]
+
+    def _code_entry(self, code):
+        label = _code_label(code)
+        entry = self._codes.get(label)
+        if entry is None:
+            entry = self._codes[label] = {"variant": code.variant, "n": code.n, "k": code.k,
+                                          "status_counts": [0, 0, 0, 0], "positions": [0] * (code.n + 1)}
+        return entry
+
+    def record_stage(self, code, engine, stage, elapsed_ns, words=1):
+        """ Bir aşamanın tek çağrısını kaydeder (toplu motorlarda words sözcük sayısıdır) """
+        key = (_code_label(code), engine, stage)
+        with self._lock:
+            self._code_entry(code)
+            entry = self._stages.get(key)
+            if entry is None:
+                entry = self._stages[key] = [0, 0, 0, 0]
+            entry[0] += 1
+            entry[1] += words
+            entry[2] += elapsed_ns
+            entry[3] = max(entry[3], elapsed_ns)
+
+    def record_status(self, code, status, position=None):
+        """ Tek sözcüğün durum kodu ve (düzeltildiyse) 1-indeksli düzeltilen pozisyon """
+        with self._lock:
+            entry = self._code_entry(code)
+            entry["status_counts"][status] += 1
+            if position:
+                entry["positions"][position] += 1
+
+    def record_status_batch(self, code, status_counts, position_counts=None):
+        """ Toplu sonuçlar: durum kodu başına sayılar (4) ve pozisyon başına sayılar (n+1, indeks 0 kullanılmaz) """
+        with self._lock:
+            entry = self._code_entry(code)
+            for status, count in enumerate(status_counts):
+                entry["status_counts"][status] += int(count)
+            if position_counts is not None:
+                positions = entry["positions"]
+                for position, count in enumerate(position_counts):
+                    if count:
+                        positions[position] += int(count)
+
+    def snapshot(self):
+        """
+        Dönüş: {"started", "timestamp", "codes": {etiket: {"variant", "n", "k", "status_counts",
+                 "corrected_positions": {pozisyon: sayı}}}, "stages": [{"code", "engine", "stage", "calls",
+                 "words", "seconds", "max_seconds", "ns_per_word"}, ...]}
+        """
+        with self._lock:
+            codes = {label: {"variant": entry["variant"], "n": entry["n"], "k": entry["k"],
+                             "status_counts": list(entry["status_counts"]),
+                             "corrected_positions": {p: c for p, c in enumerate(entry["positions"]) if c}}
+                     for label, entry in self._codes.items()}
+            stages = [{"code": label, "engine": engine, "stage": stage, "calls": calls, "words": words,
+                       "seconds": total_ns / 1e9, "max_seconds": max_ns / 1e9,
+                       "ns_per_word": total_ns / words if words else 0.0}
+                      for (label, engine, stage), (calls, words, total_ns, max_ns) in sorted(self._stages.items())]
+        return {"started": self.started, "timestamp": time.time(), "codes": codes, "stages": stages}
+
+    def to_json(self, indent=2):
+        return json.dumps(self.snapshot(), indent=indent, ensure_ascii=False)
+
+    def to_prometheus(self):
+        """ Prometheus metin biçimi (sürüm 0.0.4) """
+        snapshot = self.snapshot()
+        lines = []
+
+        def family(name, kind, help_text, samples):
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            for labels, value in samples:
+                label_text = ",".join(f'{key}="{val}"' for key, val in labels)
+                lines.append(f"{name}{{{label_text}}} {value}")
+
+        def code_labels(label, entry):
+            return (("code", label), ("variant", entry["variant"]), ("n", entry["n"]), ("k", entry["k"]))
+
+        codes = snapshot["codes"]
+        family("hamming_decoded_words_total", "counter", "Durum koduna göre çözülen sözcükler (0/1/2/3)",
+               [(code_labels(label, entry) + (("status", status),), count)
+                for label, entry in codes.items() for status, count in enumerate(entry["status_counts"])])
+        family("hamming_corrected_position_total", "counter", "1-indeksli pozisyona göre düzeltilen bitler",
+               [(code_labels(label, entry) + (("position", position),), count)
+                for label, entry in codes.items() for position, count in entry["corrected_positions"].items()])
+        for name, field, help_text in (
+                ("hamming_stage_calls_total", "calls", "Aşama çağrı sayısı"),
+                ("hamming_stage_words_total", "words", "Aşamada işlenen sözcük sayısı"),
+                ("hamming_stage_seconds_total", "seconds", "Aşamada geçen toplam süre (saniye)")):
+            family(name, "counter", help_text,
+                   [(code_labels(row["code"], codes[row["code"]]) + (("engine", row["engine"]), ("stage", row["stage"])),
+                     row[field]) for row in snapshot["stages"]])
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def _write_atomic(path, text):
+        # Toplayıcı yarım yazılmış dosya görmesin diye önce geçici dosyaya yazılıp yeniden adlandırılır
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp, path)
+
+    def write_json(self, path):
+        self._write_atomic(path, self.to_json())
+
+    def write_prometheus(self, path):
+        self._write_atomic(path, self.to_prometheus())
+
+    def write(self, path, fmt=None):
+        """ fmt verilmezse uzantıya göre seçilir: .json -> JSON, diğerleri -> Prometheus metni """
+        if fmt is None:
+            fmt = "json" if path.endswith(".json") else "prometheus"
+        (self.write_json if fmt == "json" else self.write_prometheus)(path)
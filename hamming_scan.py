@@ -0,0 +1,227 @@
+"""
+Çok dosyalı paralel doğrulama (toplu tarama) ve tek bir birleşik rapor.
+
+Verilen dosyalar ve dizin ağaçları (HSD1/HSI1 akışları ve HSCF kapsayıcıları başlıklarından tanınır)
+süreç havuzunda eşzamanlı çözülür. Akışlar parça başlıkları yüzünden sıralı okunmak zorunda olduğundan
+dosya başına tek görevdir ve büyük tamponla okunur; kapsayıcılar ise indeksli olduğundan yaklaşık
+task_bytes büyüklüğünde blok aralıklarına bölünür, böylece tek bir büyük döküm de tüm çekirdekleri kullanır.
+Görevler büyükten küçüğe dağıtılır. Rapor, taranan sözcükleri, durum kodu (0..3) sayılarını ve dosya
+başına düzeltilemez (çift) hataların veri bayt ofsetlerini içerir. output_dir verilirse her dosyanın
+düzeltilmiş ham verisi bu dizine göreli yol + DECODED_SUFFIX adıyla yazılır (ör. alt/x.hscf -> alt/x.hscf.dat);
+böylece çıkış dizini yeniden tarandığında ham veri kod sözcüğü dosyası sanılmaz. Veri önce aynı dizindeki
+geçici bir dosyaya yazılır ve yalnızca dosyanın tüm görevleri başarılı olursa os.replace ile yerine konur;
+başarısız dosyaların geçici çıkışı silinir.
+
+    report = scan_files(["dokumler/"], workers=8)
+    print(format_scan_report(report))
+"""
+
+import os
+import struct
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import nullcontext
+
+from hamming import INTERLEAVED_STREAM_MAGIC, STREAM_MAGIC, decode_stream
+from hamming_container import CONTAINER_MAGIC, CodewordContainer
+
+__all__ = ["READ_BUFFER_SIZE", "DEFAULT_TASK_BYTES", "DECODED_SUFFIX", "file_format", "find_codeword_files",
+           "scan_files", "format_scan_report"]
+
+READ_BUFFER_SIZE = 8 << 20  # Akış dosyaları için okuma tamponu (8 MiB)
+DEFAULT_TASK_BYTES = 64 << 20  # Kapsayıcı görevi başına yaklaşık kod sözcüğü baytı
+DECODED_SUFFIX = ".dat"  # Çıkış dizinindeki düzeltilmiş ham veri dosyalarının eki
+
+FORMATS = {CONTAINER_MAGIC: "container", STREAM_MAGIC: "stream", INTERLEAVED_STREAM_MAGIC: "stream"}
+
+
+def file_format(path):
+    """ Dosya başlığına göre "container", "stream" veya None (tanınmayan) """
+    with open(path, "rb") as f:
+        return FORMATS.get(f.read(len(CONTAINER_MAGIC)))
+
+
+def find_codeword_files(paths):
+    """
+    Dosya ve dizinleri (özyinelemeli) kod sözcüğü dosyalarına genişletir.
+    Dizinlerde yalnızca başlığı tanınan ve DECODED_SUFFIX ile bitmeyen (önceki taramaların çıkışı olmayan)
+    dosyalar alınır; açıkça verilen dosyalar her zaman alınır.
+    Dönüş: sıralı [(yol, göreli_ad)] listesi; göreli ad, çıkış dizinindeki yoldur.
+    """
+    found = []
+    for path in paths:
+        if os.path.isdir(path):
+            for root, dirs, names in os.walk(path):
+                dirs.sort()
+                for name in sorted(names):
+                    full = os.path.join(root, name)
+                    if name.endswith(DECODED_SUFFIX):
+                        continue
+                    if os.path.isfile(full) and file_format(full) is not None:
+                        found.append((full, os.path.relpath(full, path)))
+        elif os.path.isfile(path):
+            found.append((path, os.path.basename(path)))
+        else:
+            raise ValueError(f"Dosya veya dizin bulunamadı: {path}")
+    names = [relative for _, relative in found]
+    if len(set(names)) != len(names):
+        raise ValueError("Aynı göreli ada sahip birden fazla dosya var; çıkış yolları çakışır.")
+    return found
+
+
+def _plan_tasks(path, output, task_bytes):
+    """ Bir dosyanın görevleri: [(yol, biçim, blok aralığı veya None, çıkış, bayt)]; çıkış geçici dosyadır """
+    fmt = file_format(path)
+    if fmt != "container":
+        return [(path, fmt, None, output, os.path.getsize(path))]
+    with CodewordContainer(path) as container:
+        block_bytes = max(container.block_words * container.hamming.n // 8, 1)
+        step = max(task_bytes // block_bytes, 1)
+        if output is not None:
+            # Görevler çıkışın kendi bölgelerine yazar; dosya önceden tam boyutuna getirilir
+            with open(output, "wb") as f:
+                f.truncate(container.data_bytes)
+        tasks = []
+        for start in range(0, container.num_blocks, step):
+            stop = min(start + step, container.num_blocks)
+            tasks.append((path, fmt, (start, stop), output, (stop - start) * block_bytes))
+        return tasks or [(path, fmt, (0, 0), output, 0)]
+
+
+def _scan_task(path, fmt, blocks, output, max_offsets):
+    """
+    İşçi süreçte tek görev; hatalı dosyalar istisna yerine "error" alanıyla bildirilir.
+    Kesik/bozuk kapsayıcılar açılışta ValueError verir; struct.error da yakalanır ki tek bir bozuk
+    dosya tüm taramayı durdurmasın.
+    """
+    start = time.perf_counter()
+    try:
+        if fmt is None:
+            raise ValueError("Tanınmayan dosya biçimi (HSD1/HSI1 akışı veya HSCF kapsayıcısı değil).")
+        if fmt == "stream":
+            with open(path, "rb", buffering=READ_BUFFER_SIZE) as src, \
+                    (open(output, "wb", buffering=READ_BUFFER_SIZE) if output else nullcontext()) as dst:
+                stats = decode_stream(src, dst, max_offsets=max_offsets)
+        else:
+            with CodewordContainer(path) as container, \
+                    (open(output, "r+b", buffering=READ_BUFFER_SIZE) if output else nullcontext()) as dst:
+                block_range = range(*blocks)
+                if dst is not None and block_range:
+                    dst.seek(container.block_range(block_range[0])[0] * container.word_bytes)
+                stats = container.scrub(dst=dst, max_offsets=max_offsets, blocks=block_range)
+    except (OSError, ValueError, struct.error) as exc:
+        stats = {"error": str(exc)}
+    stats["path"] = path
+    stats["seconds"] = time.perf_counter() - start
+    return stats
+
+
+def _merge(results, path, max_offsets):
+    """ Bir dosyanın görev sonuçlarını birleştirir """
+    errors = [r["error"] for r in results if "error" in r]
+    if errors:
+        return {"path": path, "error": errors[0]}
+    merged = {"path": path, "k": results[0]["k"], "words": 0, "status_counts": [0, 0, 0, 0],
+              "uncorrectable": 0, "uncorrectable_offsets": []}
+    for r in results:
+        merged["words"] += r["words"]
+        merged["uncorrectable"] += r["uncorrectable"]
+        merged["status_counts"] = [a + b for a, b in zip(merged["status_counts"], r["status_counts"])]
+        merged["uncorrectable_offsets"].extend(r["uncorrectable_offsets"])
+    merged["uncorrectable_offsets"] = sorted(merged["uncorrectable_offsets"])[:max_offsets]
+    return merged
+
+
+def scan_files(paths, workers=None, output_dir=None, max_offsets=1000, task_bytes=DEFAULT_TASK_BYTES):
+    """
+    paths: dosya ve/veya dizin listesi. workers: süreç sayısı (None = çekirdek sayısı, 1 = aynı süreçte).
+    output_dir: verilirse düzeltilmiş veri her dosya için output_dir/<göreli_ad>.dat yoluna yazılır
+    (yalnızca dosya hatasız okunduysa; yarım kalan çıkış bırakılmaz).
+    max_offsets: dosya başına raporlanacak en fazla düzeltilemez hata ofseti.
+    Dönüş: {"files": [dosya başına sonuç], "num_files", "failed_files", "bytes", "words", "status_counts",
+            "uncorrectable", "seconds", "workers"}; çıkışı yazılan dosyaların sonucunda "output" yolu bulunur.
+    """
+    start = time.perf_counter()
+    files = find_codeword_files(paths)
+    inputs = {os.path.realpath(path) for path, _ in files}
+    by_path = {path: [] for path, _ in files}
+    outputs = {}  # yol -> (geçici çıkış, son çıkış)
+    tasks = []
+    try:
+        for path, relative in files:
+            temp = None
+            if output_dir is not None:
+                output = os.path.join(output_dir, relative + DECODED_SUFFIX)
+                if os.path.realpath(output) in inputs:
+                    raise ValueError(f"Çıkış dosyası bir giriş dosyasının üzerine yazardı: {output}")
+                os.makedirs(os.path.dirname(output) or ".", exist_ok=True)
+                # Aynı dizinde geçici ad: os.replace aynı dosya sisteminde atomiktir
+                temp = f"{output}.{os.getpid()}.tmp"
+                outputs[path] = (temp, output)
+            try:
+                tasks.extend(_plan_tasks(path, temp, task_bytes))
+            except (OSError, ValueError, struct.error) as exc:
+                by_path[path].append({"path": path, "error": str(exc)})
+        # En büyük görevler önce: son kalan uzun görev tüm havuzu bekletmez
+        tasks.sort(key=lambda task: -task[4])
+        total_bytes = sum(task[4] for task in tasks)
+
+        workers = workers or os.cpu_count() or 1
+        if workers == 1 or len(tasks) <= 1:
+            for path, fmt, blocks, output, _ in tasks:
+                by_path[path].append(_scan_task(path, fmt, blocks, output, max_offsets))
+        else:
+            with ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as pool:
+                futures = [pool.submit(_scan_task, path, fmt, blocks, output, max_offsets)
+                           for path, fmt, blocks, output, _ in tasks]
+                for future in as_completed(futures):
+                    result = future.result()
+                    by_path[result["path"]].append(result)
+        merged_results = [_merge(by_path[path], path, max_offsets) for path, _ in files]
+        # Çıkış yalnızca dosyanın tüm görevleri başarılıysa yerine konur
+        for merged in merged_results:
+            if "error" not in merged and merged["path"] in outputs:
+                temp, output = outputs.pop(merged["path"])
+                os.replace(temp, output)
+                merged["output"] = output
+    finally:
+        for temp, _ in outputs.values():  # Başarısız veya yarım kalan çıkışlar
+            try:
+                os.remove(temp)
+            except FileNotFoundError:
+                pass
+
+    report = {"files": [], "num_files": len(files), "failed_files": 0, "bytes": total_bytes, "words": 0,
+              "status_counts": [0, 0, 0, 0], "uncorrectable": 0, "workers": workers}
+    for merged in merged_results:
+        report["files"].append(merged)
+        if "error" in merged:
+            report["failed_files"] += 1
+            continue
+        report["words"] += merged["words"]
+        report["uncorrectable"] += merged["uncorrectable"]
+        report["status_counts"] = [a + b for a, b in zip(report["status_counts"], merged["status_counts"])]
+    report["seconds"] = time.perf_counter() - start
+    return report
+
+
+def format_scan_report(report, offset_limit=20):
+    """ Birleşik raporu okunabilir metne dönüştürür; yalnızca hatalı veya çift hatalı dosyalar listelenir """
+    counts = report["status_counts"]
+    mib = report["bytes"] / (1 << 20)
+    seconds = report["seconds"]
+    lines = [f"{report['num_files']} dosya, {report['words']} sözcük, {mib:.1f} MiB, {seconds:.2f} s "
+             f"({mib / seconds if seconds else 0.0:.1f} MiB/s, {report['workers']} işçi)",
+             f"  hatasız={counts[0]}, tek hata düzeltildi={counts[1]}, genel eşlik düzeltildi={counts[3]}, "
+             f"düzeltilemez={counts[2]}"]
+    if report["failed_files"]:
+        lines.append(f"  Okunamayan dosya: {report['failed_files']}")
+    for result in report["files"]:
+        if "error" in result:
+            lines.append(f"  {result['path']}: HATA: {result['error']}")
+        elif result["uncorrectable"]:
+            offsets = result["uncorrectable_offsets"][:offset_limit]
+            more = result["uncorrectable"] - len(offsets)
+            lines.append(f"  {result['path']}: {result['uncorrectable']} düzeltilemez (çift) hata; veri bayt ofsetleri: "
+                         + ", ".join(str(o) for o in offsets) + (f" ... ve {more} tane daha" if more > 0 else ""))
+    return "\n".join(lines)
@@ -0,0 +1,416 @@
+"""
+Hamming SEC-DED asyncio kodlama/çözme sunucusu (yerel yan hizmet), istemcisi ve yük üreteci.
+
+Protokol (tüm tamsayılar büyük-endian). Her istek ve yanıt tek bir çerçevedir:
+    İstek:  FRAME_STRUCT(işlem, bayraklar, k, istek_no, yük_uzunluğu) + yük
+    Yanıt:  FRAME_STRUCT(durum, işlem, k, istek_no, yük_uzunluğu) + yük
+İşlemler:
+    OP_ENCODE: yük = veri (sözcük başına k/8 bayt) -> kod sözcükleri (encode_into düzeni)
+    OP_DECODE: yük = kod sözcükleri -> düzeltilmiş veri + sözcük başına 1 baytlık durum kodları
+    OP_STATS:  yük yok -> sunucu istatistikleri (JSON)
+Bayraklar: FLAG_PACKED ise kod sözcükleri boşluksuz paketlenir (encode_into(packed=True)).
+Yanıt durumu RESP_OK veya RESP_ERROR (yük = UTF-8 hata mesajı). Yanıtlar bağlantı başına istek sırasıyla döner.
+
+Geri basınç: bağlantı başına en fazla queue_depth istek işlemde (işçi havuzunda veya yanıt sırasında)
+olabilir; yuva, istek okunmadan ve havuza gönderilmeden önce alınır. Yuva yoksa soket okunmaz ve istemci
+TCP/Unix soket tamponu üzerinden yavaşlatılır. CPU işi bir işçi havuzunda (varsayılan: süreç havuzu)
+yapılır; olay döngüsü yalnızca G/Ç ile uğraşır. Yanıtlar yazılırken drain() ile yavaş istemciler beklenir.
+"""
+
+import asyncio
+import json
+import os
+import random
+import struct
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from hamming import HammingSECDED
+
+# işlem/durum, bayraklar, k, istek numarası, yük uzunluğu
+FRAME_STRUCT = struct.Struct(">BBHII")
+OP_ENCODE, OP_DECODE, OP_STATS = 1, 2, 3
+FLAG_PACKED = 1
+RESP_OK, RESP_ERROR = 0, 1
+MAX_PAYLOAD = 64 << 20
+DEFAULT_QUEUE_DEPTH = 16
+DEFAULT_PORT = 7313
+# İstek başına k üst sınırı: tablo kurulumu k ile karesel büyür ve her farklı k işçi süreçlerinde
+# CODE_REGISTRY'de kalıcı tablo bırakır (k=1024 kurulumu ~0,5 s)
+MAX_DATA_BITS = 1024
+
+
+def process_request(op, flags, k, payload):
+    """
+    İşçi havuzunda çalışan CPU işi (süreçler arası gönderilebilmesi için modül düzeyinde).
+    Kod tabloları işçi sürecinde CODE_REGISTRY üzerinden bir kez oluşturulur.
+    Dönüş: yanıt yükü (bytes)
+    """
+    code = HammingSECDED(k)
+    packed = bool(flags & FLAG_PACKED)
+    word_bytes = k // 8
+    if op == OP_ENCODE:
+        count = len(payload) // word_bytes
+        out = bytearray(-(-count * code.n // 8) if packed else count * code.codeword_bytes)
+        code.encode_into(payload, out, packed=packed)
+        return bytes(out)
+    count = len(payload) * 8 // code.n if packed else len(payload) // code.codeword_bytes
+    out = bytearray(count * (word_bytes + 1))
+    with memoryview(out) as view:
+        code.decode_into(payload, view[:count * word_bytes], view[count * word_bytes:], packed=packed)
+    return bytes(out)
+
+
+def _validate_request(op, k, length):
+    if op not in (OP_ENCODE, OP_DECODE, OP_STATS):
+        return f"Bilinmeyen işlem: {op}"
+    if op != OP_STATS and (k < 8 or k % 8):
+        return "Veri bitleri 8'in katı olmalıdır."
+    if op != OP_STATS and k > MAX_DATA_BITS:
+        return f"Veri bitleri en fazla {MAX_DATA_BITS} olabilir (istenen: {k})."
+    if length > MAX_PAYLOAD:
+        return f"Yük çok büyük ({length} bayt, en fazla {MAX_PAYLOAD})."
+    return None
+
+
+class ConnectionStats:
+    """ Bağlantı başına sayaçlar; verim, bağlantı açıldığından beri geçen süreye göre hesaplanır """
+
+    def __init__(self, peer, queue_depth):
+        self.peer = peer
+        self.started = time.monotonic()
+        self.requests = 0
+        self.errors = 0
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.queue_depth = queue_depth
+        self.queued = 0
+        self.max_queued = 0
+
+    def as_dict(self):
+        elapsed = max(time.monotonic() - self.started, 1e-9)
+        return {
+            "peer": self.peer, "elapsed": elapsed, "requests": self.requests, "errors": self.errors,
+            "bytes_in": self.bytes_in, "bytes_out": self.bytes_out,
+            "in_mb_per_sec": self.bytes_in / elapsed / 1e6, "out_mb_per_sec": self.bytes_out / elapsed / 1e6,
+            "requests_per_sec": self.requests / elapsed,
+            "queue": self.queued, "max_queue": self.max_queued, "queue_depth": self.queue_depth,
+        }
+
+
+def format_connection_stats(stats):
+    return (f"{stats['peer']}: {stats['requests']} istek ({stats['requests_per_sec']:.0f}/s), "
+            f"giriş {stats['in_mb_per_sec']:.1f} MB/s, çıkış {stats['out_mb_per_sec']:.1f} MB/s, "
+            f"kuyruk {stats['queue']}/{stats['queue_depth']} (en fazla {stats['max_queue']}), hata {stats['errors']}")
+
+
+class CodecServer:
+    """
+    executor: CPU işinin gönderileceği havuz (varsayılan: workers süreçli ProcessPoolExecutor).
+    queue_depth: bağlantı başına işlemdeki (havuza gönderilmiş veya yanıtı bekleyen) en fazla istek sayısı
+    (geri basınç sınırı).
+    """
+
+    def __init__(self, workers=None, queue_depth=DEFAULT_QUEUE_DEPTH, executor=None, stats_interval=None):
+        if queue_depth < 1:
+            raise ValueError("Kuyruk derinliği pozitif olmalıdır.")
+        self.queue_depth = queue_depth
+        self._own_executor = executor is None
+        self.executor = executor or ProcessPoolExecutor(max_workers=workers or os.cpu_count())
+        self.stats_interval = stats_interval
+        self.connections = {}
+        self.closed_connections = 0
+        self._servers = []
+        self._next_id = 0
+
+    async def start_tcp(self, host="127.0.0.1", port=DEFAULT_PORT):
+        server = await asyncio.start_server(self._handle, host, port)
+        self._servers.append(server)
+        return server
+
+    async def start_unix(self, path):
+        server = await asyncio.start_unix_server(self._handle, path)
+        self._servers.append(server)
+        return server
+
+    def stats(self):
+        return {"connections": {cid: c.as_dict() for cid, c in self.connections.items()},
+                "closed_connections": self.closed_connections, "queue_depth": self.queue_depth}
+
+    async def _handle(self, reader, writer):
+        self._next_id += 1
+        cid = self._next_id
+        peer = writer.get_extra_info("peername") or f"unix#{cid}"
+        stats = self.connections[cid] = ConnectionStats(str(peer), self.queue_depth)
+        # Okuyucu her istekten önce bir yuva alır, yanıtlayıcı yanıtı yazınca bırakır (geri basınç).
+        # Kuyruk en fazla queue_depth istek + bitiş işareti tutar; kuyruk sırası yanıt sırasını korur.
+        slots = asyncio.Semaphore(self.queue_depth)
+        pending = asyncio.Queue()
+        reading = asyncio.ensure_future(self._read_requests(reader, pending, slots, stats))
+        responding = asyncio.ensure_future(self._respond(pending, writer, slots, stats))
+        try:
+            await asyncio.wait({reading, responding}, return_when=asyncio.FIRST_COMPLETED)
+            if responding.done():  # Yazma hatası: artık okumaya gerek yok
+                reading.cancel()
+            else:  # İstemci göndermeyi bitirdi: kuyruktaki yanıtlar gönderildikten sonra kapat
+                await asyncio.gather(reading, return_exceptions=True)
+                pending.put_nowait(None)
+            await asyncio.gather(reading, responding, return_exceptions=True)
+        except asyncio.CancelledError:
+            # Sunucu kapanırken bağlantı görevi iptal edildi: alt görevler de durdurulur
+            reading.cancel()
+            responding.cancel()
+            await asyncio.gather(reading, responding, return_exceptions=True)
+            raise
+        finally:
+            while not pending.empty():  # Yanıtlanmayacak işler havuzdan geri çekilir
+                item = pending.get_nowait()
+                if item is not None and isinstance(item[4], asyncio.Future):
+                    item[4].cancel()
+            writer.close()
+            del self.connections[cid]
+            self.closed_connections += 1
+
+    async def _read_requests(self, reader, pending, slots, stats):
+        loop = asyncio.get_running_loop()
+        while True:
+            await slots.acquire()  # Yuva yoksa soket okunmaz
+            try:
+                header = await reader.readexactly(FRAME_STRUCT.size)
+            except asyncio.IncompleteReadError as e:
+                if e.partial:
+                    raise
+                return
+            op, flags, k, request_id, length = FRAME_STRUCT.unpack(header)
+            error = _validate_request(op, k, length)
+            if length > MAX_PAYLOAD:
+                pending.put_nowait((op, k, request_id, error, None))
+                return  # Yük okunamaz; bağlantı kapatılır
+            payload = await reader.readexactly(length)
+            stats.bytes_in += FRAME_STRUCT.size + length
+            if error is None and op == OP_STATS:
+                result = json.dumps(self.stats()).encode()
+            elif error is None:
+                result = loop.run_in_executor(self.executor, process_request, op, flags, k, payload)
+            else:
+                result = None
+            pending.put_nowait((op, k, request_id, error, result))
+            stats.queued = pending.qsize()
+            stats.max_queued = max(stats.max_queued, stats.queued)
+
+    async def _respond(self, pending, writer, slots, stats):
+        while True:
+            item = await pending.get()
+            stats.queued = pending.qsize()
+            if item is None:
+                return
+            op, k, request_id, error, result = item
+            if error is None and isinstance(result, asyncio.Future):
+                try:
+                    result = await result
+                except Exception as e:  # Geçersiz yük vb.: hata yanıtı gönderilir, bağlantı açık kalır
+                    error = str(e)
+            if error is not None:
+                stats.errors += 1
+                body, code = error.encode(), RESP_ERROR
+            else:
+                body, code = result, RESP_OK
+            writer.write(FRAME_STRUCT.pack(code, op, k, request_id, len(body)))
+            writer.write(body)
+            await writer.drain()
+            stats.requests += 1
+            stats.bytes_out += FRAME_STRUCT.size + len(body)
+            slots.release()  # Yanıt yazıldı: okuyucu sıradaki isteği alabilir
+
+    async def _report_stats(self):
+        while True:
+            await asyncio.sleep(self.stats_interval)
+            for stats in self.connections.values():
+                print(format_connection_stats(stats.as_dict()), file=sys.stderr)
+
+    async def serve_forever(self):
+        reporter = asyncio.ensure_future(self._report_stats()) if self.stats_interval else None
+        try:
+            await asyncio.gather(*(server.serve_forever() for server in self._servers))
+        finally:
+            if reporter is not None:
+                reporter.cancel()
+
+    async def close(self):
+        for server in self._servers:
+            server.close()
+            await server.wait_closed()
+        if self._own_executor:
+            self.executor.shutdown()
+
+
+class CodecError(Exception):
+    """ Sunucunun RESP_ERROR ile yanıtladığı istek """
+
+
+class CodecClient:
+    """
+    CodecServer için asyncio istemcisi. İstekler boru hattı (pipelining) ile gönderilebilir;
+    yanıtlar istek numarasıyla eşleştirilir.
+        client = await CodecClient.connect(port=7313)
+        codewords = await client.encode(32, veri)
+        data, status = await client.decode(32, codewords)
+    """
+
+    def __init__(self, reader, writer):
+        self._reader = reader
+        self._writer = writer
+        self._futures = {}
+        self._next_request = 0
+        self._receiver = asyncio.ensure_future(self._receive())
+
+    @classmethod
+    async def connect(cls, host="127.0.0.1", port=DEFAULT_PORT, path=None):
+        if path is not None:
+            reader, writer = await asyncio.open_unix_connection(path)
+        else:
+            reader, writer = await asyncio.open_connection(host, port)
+        return cls(reader, writer)
+
+    async def _receive(self):
+        try:
+            while True:
+                header = await self._reader.readexactly(FRAME_STRUCT.size)
+                code, _, _, request_id, length = FRAME_STRUCT.unpack(header)
+                body = await self._reader.readexactly(length)
+                future = self._futures.pop(request_id, None)
+                if future is None or future.done():
+                    continue
+                if code == RESP_OK:
+                    future.set_result(body)
+                else:
+                    future.set_exception(CodecError(body.decode(errors="replace")))
+        except (asyncio.IncompleteReadError, ConnectionError) as e:
+            for future in self._futures.values():
+                if not future.done():
+                    future.set_exception(ConnectionError(f"Sunucu bağlantısı kapandı: {e}"))
+            self._futures.clear()
+
+    async def request(self, op, k=0, payload=b"", flags=0):
+        """ Ham istek gönderir. Dönüş: yanıt yükü (bytes) """
+        self._next_request = (self._next_request + 1) & 0xFFFFFFFF
+        request_id = self._next_request
+        future = self._futures[request_id] = asyncio.get_running_loop().create_future()
+        self._writer.write(FRAME_STRUCT.pack(op, flags, k, request_id, len(payload)))
+        self._writer.write(payload)
+        await self._writer.drain()
+        return await future
+
+    async def encode(self, k, data, packed=False):
+        return await self.request(OP_ENCODE, k, data, FLAG_PACKED if packed else 0)
+
+    async def decode(self, k, codewords, packed=False):
+        """ Dönüş: (düzeltilmiş veri, sözcük başına durum kodları) """
+        body = await self.request(OP_DECODE, k, codewords, FLAG_PACKED if packed else 0)
+        count = len(body) // (k // 8 + 1)
+        return body[:count * (k // 8)], body[count * (k // 8):]
+
+    async def stats(self):
+        return json.loads(await self.request(OP_STATS))
+
+    async def close(self):
+        self._writer.close()
+        try:
+            await self._writer.wait_closed()
+        except ConnectionError:
+            pass
+        self._receiver.cancel()
+
+
+def _flip_random_bits(codewords, code, rng, error_rate):
+    """ Her kod sözcüğünde error_rate olasılıkla tek bir bit çevirir (düzeltilebilir hata) """
+    buf = bytearray(codewords)
+    slot = code.codeword_bytes
+    pad = slot * 8 - code.n
+    for i in range(len(buf) // slot):
+        if rng.random() < error_rate:
+            bit = pad + rng.randrange(code.n)
+            buf[i * slot + bit // 8] ^= 0x80 >> (bit % 8)
+    return bytes(buf)
+
+
+async def _load_connection(connect, k, requests, words, in_flight, error_rate, seed, latencies):
+    client = await connect()
+    code = HammingSECDED(k)
+    rng = random.Random(seed)
+    data = rng.randbytes(words * k // 8) if hasattr(rng, "randbytes") else os.urandom(words * k // 8)
+    limiter = asyncio.Semaphore(in_flight)
+    failures = 0
+
+    async def one():
+        nonlocal failures
+        async with limiter:
+            start = time.perf_counter()
+            codewords = await client.encode(k, data)
+            decoded, status = await client.decode(k, _flip_random_bits(codewords, code, rng, error_rate))
+            latencies.append(time.perf_counter() - start)
+            if decoded != data or any(s not in (0, 1, 3) for s in status):
+                failures += 1
+
+    try:
+        await asyncio.gather(*(one() for _ in range(requests)))
+    finally:
+        await client.close()
+    return failures
+
+
+async def run_load(host="127.0.0.1", port=DEFAULT_PORT, path=None, k=64, connections=4, requests=100,
+                   words=4096, in_flight=4, error_rate=0.01, seed=0):
+    """
+    Yük üreteci: connections bağlantının her biri requests kez encode + (tek hatalı) decode gönderir
+    ve sonucun orijinal veriyle aynı olduğunu doğrular.
+    Dönüş: {"requests", "seconds", "data_mb_per_sec", "round_trips_per_sec", "p50_ms", "p99_ms", "failures"}
+    """
+    latencies = []
+
+    def connect():
+        return CodecClient.connect(host, port, path)
+
+    start = time.perf_counter()
+    failures = await asyncio.gather(*(
+        _load_connection(connect, k, requests, words, in_flight, error_rate, seed + i, latencies)
+        for i in range(connections)))
+    seconds = time.perf_counter() - start
+    latencies.sort()
+    total = connections * requests
+
+    def percentile(p):
+        return latencies[min(len(latencies) - 1, len(latencies) * p // 100)] * 1e3 if latencies else 0.0
+    return {
+        "requests": total, "seconds": seconds,
+        "data_mb_per_sec": total * words * k / 8 / seconds / 1e6,
+        "round_trips_per_sec": total / seconds,
+        "p50_ms": percentile(50), "p99_ms": percentile(99), "failures": sum(failures),
+    }
+
+
+def format_load_result(result):
+    return (f"{result['requests']} gidiş-dönüş (encode + decode), {result['seconds']:.2f} s: "
+            f"{result['round_trips_per_sec']:.0f}/s, veri {result['data_mb_per_sec']:.1f} MB/s, "
+            f"gecikme p50 {result['p50_ms']:.2f} ms, p99 {result['p99_ms']:.2f} ms, hatalı sonuç {result['failures']}")
+
+
+async def serve(host="127.0.0.1", port=DEFAULT_PORT, path=None, workers=None, threads=False,
+                queue_depth=DEFAULT_QUEUE_DEPTH, stats_interval=None):
+    """ Sunucuyu başlatır ve iptal edilene kadar çalıştırır """
+    executor = ThreadPoolExecutor(max_workers=workers or os.cpu_count()) if threads else None
+    server = CodecServer(workers, queue_depth, executor, stats_interval)
+    if path is not None:
+        await server.start_unix(path)
+        where = path
+    else:
+        await server.start_tcp(host, port)
+        where = f"{host}:{port}"
+    print(f"Hamming SEC-DED sunucusu dinliyor: {where}", file=sys.stderr)
+    try:
+        await server.serve_forever()
+    finally:
+        await server.close()
+        if executor is not None:
+            executor.shutdown()
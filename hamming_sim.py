@@ -0,0 +1,195 @@
+"""
+Hamming SEC-DED çok çekirdekli Monte Carlo hata oranı simülasyonu.
+
+Her deneme rastgele bir veri sözcüğünü kodlar, kod sözcüğüne hata ekler, çözer ve sonucu sınıflandırır:
+    clean        : hata eklenmedi
+    corrected    : hata(lar) düzeltildi, veri doğru (durum 1/3)
+    detected     : düzeltilemez olarak tespit edildi (durum 2)
+    miscorrected : "düzeltildi" dendi ama veri yanlış (durum 1/3)
+    silent       : hata fark edilmedi, veri yanlış (durum 0)
+Denemeler sabit boyutlu görevlere bölünür; her görev SeedSequence'tan türetilen bağımsız bir
+RNG akışı kullanır, bu yüzden sonuçlar işçi sayısından bağımsız olarak tekrarlanabilir.
+"""
+
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+
+import numpy as np
+
+from hamming import HammingSECDED, preload_codes
+from hamming_faults import ErrorMaskGenerator
+
+OUTCOMES = ("clean", "corrected", "detected", "miscorrected", "silent")
+# Görev boyutu: denemeler yaklaşık TARGET_TASKS göreve bölünür (görev başına en az MIN_TASK_TRIALS).
+# Bölme işçi sayısına bağlı değildir; böylece aynı tohum her işçi sayısında aynı sonucu verir.
+TARGET_TASKS = 256
+MIN_TASK_TRIALS = 1 << 14
+DEFAULT_BATCH_SIZE = 1 << 16
+
+
+def wilson_interval(count, trials, z=1.96):
+    """ Binom oranı için Wilson skor güven aralığı (varsayılan %95). Dönüş: (alt, üst) """
+    if trials == 0:
+        return 0.0, 1.0
+    phat = count / trials
+    denom = 1 + z * z / trials
+    center = (phat + z * z / (2 * trials)) / denom
+    half = z * math.sqrt(phat * (1 - phat) / trials + z * z / (4 * trials * trials)) / denom
+    return max(0.0, center - half), min(1.0, center + half)
+
+
+def random_data_words(rng, hamming, count):
+    """ Düzgün dağılımlı rastgele k-bitlik veri sözcükleri (encode_batch düzeninde) """
+    if not hamming.data_lanes:
+        return rng.integers(0, hamming.data_mask, size=count, endpoint=True, dtype=np.uint64).astype(hamming.data_dtype)
+    data = rng.integers(0, np.iinfo(np.uint64).max, size=(count, hamming.data_lanes), endpoint=True, dtype=np.uint64)
+    data[:, -1] &= np.uint64((1 << (hamming.k - 64 * (hamming.data_lanes - 1))) - 1)
+    return data
+
+
+def _conditional_weight_pmf(n, ber):
+    """ En az bir hata olduğu bilindiğinde hata sayısının (1..n) olasılık dağılımı """
+    log_q = math.log1p(-ber)
+    pmf = np.array([math.comb(n, w) * math.exp(w * math.log(ber) + (n - w) * log_q) for w in range(1, n + 1)])
+    return pmf / pmf.sum()
+
+
+def classify_batch(hamming, data, received):
+    """ Alınan kod sözcüklerini çözer ve OUTCOMES sırasıyla (clean hariç) sonuç sayılarını döndürür """
+    decoded, status, _ = hamming.decode_batch(received)
+    data_ok = decoded == data
+    if data_ok.ndim == 2:
+        data_ok = data_ok.all(axis=1)
+    claimed_fix = (status == 1) | (status == 3)
+    return np.array([
+        0,
+        np.count_nonzero(claimed_fix & data_ok),
+        np.count_nonzero(status == 2),
+        np.count_nonzero(claimed_fix & ~data_ok),
+        np.count_nonzero((status == 0) & ~data_ok),
+    ], dtype=np.int64)
+
+
+def _simulate_task(k, trials, seed, ber=None, errors=None, batch_size=DEFAULT_BATCH_SIZE):
+    """
+    Tek bir görevi (tek süreçte) çalıştırır. Dönüş: OUTCOMES sırasıyla sayı dizisi.
+    BER modunda hatasız kalan denemelerin sayısı binom dağılımından çekilir; bunlar kesinlikle
+    durum 0 ile çözüldüğünden yalnızca hatalı denemeler kodlanıp çözülür.
+    """
+    hamming = HammingSECDED(k)
+    hamming._get_numpy_tables()
+    rng = np.random.default_rng(seed)
+    faults = ErrorMaskGenerator(hamming, rng)
+    counts = np.zeros(len(OUTCOMES), dtype=np.int64)
+
+    if errors is not None:
+        erroneous = trials
+        weight_pmf = None
+    else:
+        p_any = -math.expm1(hamming.n * math.log1p(-ber))
+        erroneous = int(rng.binomial(trials, p_any))
+        weight_pmf = _conditional_weight_pmf(hamming.n, ber)
+    counts[0] = trials - erroneous
+
+    remaining = erroneous
+    while remaining:
+        m = min(batch_size, remaining)
+        remaining -= m
+        if weight_pmf is None:
+            weights = np.full(m, errors)
+        else:
+            weights = rng.choice(np.arange(1, hamming.n + 1), size=m, p=weight_pmf)
+        data = random_data_words(rng, hamming, m)
+        codewords = hamming.encode_batch(data)
+        masks = faults.with_weights(weights)
+        counts += classify_batch(hamming, data, codewords ^ masks)
+    return counts
+
+
+def task_size(trials):
+    """
+    Görev başına deneme sayısı: ceil(trials / TARGET_TASKS), en az MIN_TASK_TRIALS.
+    Varsayılan 1e6 denemede ~60 görev oluşur, yani çekirdeklerin hepsi iş alır; görev başına
+    havuz yükü (tablolar fork ile devralınır) toplam sürenin yanında ihmal edilebilir kalır.
+    """
+    return max(MIN_TASK_TRIALS, -(-trials // TARGET_TASKS))
+
+
+def run_simulation(k, trials, ber=None, errors=None, workers=None, seed=0,
+                   task_trials=None, batch_size=DEFAULT_BATCH_SIZE, executor=None):
+    """
+    k-bitlik kod için Monte Carlo simülasyonu.
+    ber: bit başına bağımsız hata olasılığı, veya errors: her denemede tam olarak t hata.
+    workers: süreç sayısı (None = çekirdek sayısı, 1 = aynı süreçte).
+    task_trials: görev başına deneme (None = task_size(trials)).
+    seed: tamsayı veya np.random.SeedSequence (ber_sweep her nokta için ayrı bir alt dizi verir).
+    Dönüş: {"k", "n", "ber", "errors", "trials", "counts", "rates", "intervals"} sözlüğü.
+    """
+    if (ber is None) == (errors is None):
+        raise ValueError("ber veya errors parametrelerinden yalnızca biri verilmelidir.")
+    # Tablolar havuz kurulmadan önce oluşturulur; fork edilen işçiler bunları yeniden hesaplamadan devralır
+    hamming, = preload_codes([k])
+    if ber is not None and not 0 < ber < 1:
+        raise ValueError("BER 0 ile 1 arasında olmalıdır.")
+    if errors is not None and not 1 <= errors <= hamming.n:
+        raise ValueError(f"Hata sayısı 1 ile {hamming.n} arasında olmalıdır.")
+
+    if task_trials is None:
+        task_trials = task_size(trials)
+    sizes = [task_trials] * (trials // task_trials)
+    if trials % task_trials:
+        sizes.append(trials % task_trials)
+    if not isinstance(seed, np.random.SeedSequence):
+        seed = np.random.SeedSequence(seed)
+    seeds = seed.spawn(len(sizes))
+    args = [(k, size, task_seed, ber, errors, batch_size) for size, task_seed in zip(sizes, seeds)]
+
+    counts = np.zeros(len(OUTCOMES), dtype=np.int64)
+    if workers == 1 or len(args) <= 1:
+        for task in args:
+            counts += _simulate_task(*task)
+    elif executor is not None:
+        for task_counts in executor.map(_simulate_task, *zip(*args)):
+            counts += task_counts
+    else:
+        with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+            for task_counts in pool.map(_simulate_task, *zip(*args)):
+                counts += task_counts
+
+    return {
+        "k": k, "n": hamming.n, "ber": ber, "errors": errors, "trials": trials,
+        "counts": {name: int(c) for name, c in zip(OUTCOMES, counts)},
+        "rates": {name: int(c) / trials if trials else 0.0 for name, c in zip(OUTCOMES, counts)},
+        "intervals": {name: wilson_interval(int(c), trials) for name, c in zip(OUTCOMES, counts)},
+    }
+
+
+def ber_sweep(k_values, bers, trials, workers=None, seed=0, **kwargs):
+    """
+    Her (k, BER) çifti için run_simulation sonuçlarının listesi; süreç havuzu paylaşılır
+    (workers == 1 ise havuz kurulmaz). Her nokta seed'den türetilen ayrı bir SeedSequence alt dizisi
+    kullanır, böylece noktaların rastgele akışları ilişkili olmaz.
+    """
+    results = []
+    preload_codes(k_values)
+    points = [(k, ber) for k in k_values for ber in bers]
+    point_seeds = np.random.SeedSequence(seed).spawn(len(points))
+    with (ProcessPoolExecutor(max_workers=workers or os.cpu_count()) if workers != 1 else nullcontext()) as pool:
+        for (k, ber), point_seed in zip(points, point_seeds):
+            results.append(run_simulation(k, trials, ber=ber, workers=workers, seed=point_seed,
+                                          executor=pool, **kwargs))
+    return results
+
+
+def format_result(result):
+    """ Simülasyon sonucunu okunabilir bir metin tablosuna dönüştürür """
+    h = HammingSECDED(result["k"])
+    mode = f"BER={result['ber']:.1e}" if result["ber"] is not None else f"t={result['errors']} hata"
+    lines = [f"Hamming {h.get_code_params_str()} SEC-DED, {mode}, {result['trials']} deneme"]
+    for name in OUTCOMES:
+        low, high = result["intervals"][name]
+        lines.append(f"  {name:<13}{result['counts'][name]:>16}  oran={result['rates'][name]:.3e}  "
+                     f"%95 GA=[{low:.3e}, {high:.3e}]")
+    return "\n".join(lines)
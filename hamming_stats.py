@@ -0,0 +1,148 @@
+"""
+Hata konumu istatistikleri ve takılı bit (hard fault) tespiti.
+
+Bağımsız yumuşak hatalarda düzeltmeler n pozisyona aşağı yukarı eşit dağılır. Takılı bir hücre ise
+her okunuşta aynı pozisyonda düzeltme üretir. ErrorLocationStats, decode/decode_batch sonuçlarından
+pozisyon başına düzeltme sayılarını akış halinde tutar (bellek n'ye bağlıdır, sözcük sayısına değil).
+anomalies(), sayısı diğer pozisyonlardan beklenenin istatistiksel olarak çok üstünde kalan pozisyonları döndürür:
+her pozisyonun beklenen değeri kendisi hariç diğer pozisyonların ortalamasıdır (baskın bir takılı bit
+beklentiyi şişirip kendini gizlemesin diye). Sayı Poisson yaklaşımıyla z-puanına çevrilir ve eşik,
+n pozisyon için Bonferroni düzeltmeli alpha anlamlılık düzeyinden hesaplanır.
+
+    stats = ErrorLocationStats.for_code(code)
+    for block in blocks:
+        _, status, syndromes = code.decode_batch(block)
+        stats.add_batch(code, status, syndromes)
+    print(format_location_report(stats))
+"""
+
+import math
+from statistics import NormalDist
+
+import numpy as np
+
+__all__ = ["ErrorLocationStats", "format_location_report"]
+
+
+class ErrorLocationStats:
+    def __init__(self, n=None, alpha=1e-6, min_count=8):
+        """
+        n: kod sözcüğü uzunluğu (None ise ilk add_batch çağrısındaki koddan alınır).
+        alpha: yanlış alarm olasılığı (tüm pozisyonlar için toplam).
+        min_count: bir pozisyonun işaretlenmesi için gereken en az düzeltme sayısı.
+        """
+        if not 0 < alpha < 1:
+            raise ValueError("alpha 0 ile 1 arasında olmalıdır.")
+        self.alpha = alpha
+        self.min_count = min_count
+        self.words = 0
+        self.status_counts = [0, 0, 0, 0]
+        self.n = None
+        self.position_counts = np.zeros(1, dtype=np.int64)
+        if n is not None:
+            self._allocate(n)
+
+    def _allocate(self, n):
+        if n < 2:
+            raise ValueError("Kod sözcüğü en az 2 bit olmalıdır.")
+        self.n = n
+        # İndeks 1-indeksli pozisyondur; 0 kullanılmaz
+        self.position_counts = np.zeros(n + 1, dtype=np.int64)
+
+    @classmethod
+    def for_code(cls, code, **kwargs):
+        return cls(code.n, **kwargs)
+
+    @property
+    def corrections(self):
+        return int(self.position_counts.sum())
+
+    @property
+    def threshold(self):
+        """ Pozisyon başına tek yönlü z eşiği (Bonferroni) """
+        return NormalDist().inv_cdf(1 - self.alpha / (self.n or 1))
+
+    def add(self, result):
+        """ Tek sözcük: decode(..., structured=True) sonucundaki DecodeResult """
+        if self.n is None:
+            raise ValueError("Tek sözcük eklemek için n (veya for_code) verilmelidir.")
+        self.words += 1
+        self.status_counts[result.status] += 1
+        if result.position:
+            self.position_counts[result.position] += 1
+
+    def add_batch(self, code, status, syndromes):
+        """ decode_batch'in durum ve sendrom dizileri """
+        if self.n is None:
+            self._allocate(code.n)
+        elif code.n != self.n:
+            raise ValueError(f"İstatistik n={self.n} için oluşturuldu, kod n={code.n}.")
+        status = np.asarray(status).reshape(-1)
+        self.words += len(status)
+        for value, count in enumerate(np.bincount(status, minlength=4)):
+            self.status_counts[value] += int(count)
+        positions = code.corrected_positions(status, np.asarray(syndromes).reshape(-1))
+        counts = np.bincount(positions, minlength=self.n + 1)
+        counts[0] = 0  # Düzeltme yapılmayan sözcükler
+        self.position_counts += counts[:self.n + 1]
+
+    def merge(self, other):
+        """ Başka bir (örneğin işçi sürecinden gelen) istatistiği ekler """
+        if self.n is None and other.n is not None:
+            self._allocate(other.n)
+        if other.n is not None and other.n != self.n:
+            raise ValueError("Farklı kod uzunluklarının istatistikleri birleştirilemez.")
+        self.words += other.words
+        self.status_counts = [a + b for a, b in zip(self.status_counts, other.status_counts)]
+        if other.n is not None:
+            self.position_counts += other.position_counts
+        return self
+
+    def scores(self):
+        """ Pozisyon başına (beklenen sayı, z-puanı) dizileri; beklenen değer diğer pozisyonların ortalamasıdır """
+        counts = self.position_counts[1:].astype(np.float64)
+        expected = (counts.sum() - counts) / (self.n - 1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            z = np.where(expected > 0, (counts - expected) / np.sqrt(expected), np.where(counts > 0, np.inf, 0.0))
+        return expected, z
+
+    def anomalies(self):
+        """
+        Olası takılı bitler, en şüpheliden başlayarak.
+        Dönüş: [{"position", "count", "expected", "z", "share"}, ...]; share, tüm düzeltmeler içindeki paydır.
+        """
+        total = self.corrections
+        if not total or self.n is None:
+            return []
+        expected, z = self.scores()
+        threshold = self.threshold
+        flagged = []
+        for index in np.argsort(-z):
+            count = int(self.position_counts[index + 1])
+            if z[index] <= threshold:
+                break
+            if count >= self.min_count:
+                flagged.append({"position": int(index) + 1, "count": count, "expected": float(expected[index]),
+                                "z": float(z[index]), "share": count / total})
+        return flagged
+
+    def to_dict(self):
+        return {"n": self.n, "words": self.words, "status_counts": list(self.status_counts),
+                "corrections": self.corrections,
+                "position_counts": {p: int(c) for p, c in enumerate(self.position_counts) if c},
+                "anomalies": self.anomalies()}
+
+
+def format_location_report(stats, top=5):
+    lines = [f"{stats.words} sözcük, {stats.corrections} düzeltme (n={stats.n}, "
+             f"z eşiği {stats.threshold:.2f}, alpha={stats.alpha:g})"]
+    anomalies = stats.anomalies()
+    if not anomalies:
+        busiest = np.argsort(-stats.position_counts[1:])[:top] + 1
+        listed = ", ".join(f"{p}:{int(stats.position_counts[p])}" for p in busiest if stats.position_counts[p])
+        lines.append("  Anormal pozisyon yok" + (f" (en sık: {listed})" if listed else ""))
+    for row in anomalies:
+        z = "inf" if math.isinf(row["z"]) else f"{row['z']:.1f}"
+        lines.append(f"  Olası takılı bit: pozisyon {row['position']} -> {row['count']} düzeltme "
+                     f"(beklenen {row['expected']:.1f}, z={z}, pay %{row['share'] * 100:.1f})")
+    return "\n".join(lines)
@@ -0,0 +1,91 @@
+"""
+"Hata Testi" sekmesinin toplu (arka planda çalıştırılabilen) test işleri.
+
+Tek bir veri sözcüğü kodlanır; hata desenleri (rastgele veya kapsamlı tek/çift bit) parti parti
+NumPy ile eklenip decode_batch ile çözülür. iter_test_batches her partiden sonra bir özet üretir;
+çağıran taraf (GUI'nin işçi iş parçacığı) partiler arasında iptal isteğini denetleyebilir ve
+ilerlemeyi kuyruğa aktarabilir. Modül tkinter içe aktarmaz.
+
+    for summary in iter_test_batches(HammingSECDED(8), 0b10110010, "exhaustive_double"):
+        print(summary["done"], summary["total"], summary["status_counts"])
+"""
+
+import numpy as np
+
+from hamming import _int_to_lanes
+from hamming_faults import ErrorMaskGenerator
+
+__all__ = ["TEST_MODES", "DEFAULT_BATCH_SIZE", "test_mode_trials", "iter_test_batches"]
+
+# mod -> (hata biti sayısı, kapsamlı mı)
+TEST_MODES = {
+    "random_single": (1, False),
+    "random_double": (2, False),
+    "exhaustive_single": (1, True),
+    "exhaustive_double": (2, True),
+}
+DEFAULT_BATCH_SIZE = 4096
+
+
+def test_mode_trials(n, mode, trials):
+    """ Toplam deneme sayısı: kapsamlı modlarda tüm desenler (n veya n(n-1)/2), aksi halde trials """
+    weight, exhaustive = TEST_MODES[mode]
+    if not exhaustive:
+        return trials
+    return n if weight == 1 else n * (n - 1) // 2
+
+
+def _exhaustive_positions(n, weight):
+    if weight == 1:
+        return np.arange(1, n + 1).reshape(-1, 1)
+    first, second = np.triu_indices(n, 1)
+    return np.stack([first, second], axis=1) + 1
+
+
+def iter_test_batches(code, data_word, mode, trials=100000, batch_size=DEFAULT_BATCH_SIZE, seed=None,
+                      max_failures=100):
+    """
+    code: HammingSECDED örneği, data_word: k bitlik veri (tamsayı), mode: TEST_MODES anahtarı.
+    Her parti için bir sözlük üretir:
+        {"done", "total", "failed", "status_counts" (bu parti, 4), "failures": [(pozisyonlar, durum), ...]}
+    Tek hatada durum 1/3 ve verinin doğru çıkması, çift hatada durum 2 beklenir.
+    Toplam en fazla max_failures başarısız deneme ayrıntısıyla bildirilir (sayımlar her zaman tamdır).
+    """
+    if mode not in TEST_MODES:
+        raise ValueError(f"Bilinmeyen test modu: {mode}")
+    if not 0 <= data_word <= code.data_mask:
+        raise ValueError(f"Veri {code.k} bite sığmalıdır.")
+    weight, exhaustive = TEST_MODES[mode]
+    if code.n < weight:
+        raise ValueError("Kod sözcüğü uzunluğu bu test için çok kısa.")
+    code._get_numpy_tables()
+    data = np.array([_int_to_lanes(data_word, code.data_lanes)], dtype=code.data_dtype)
+    codeword = code.encode_batch(data)
+    total = test_mode_trials(code.n, mode, trials)
+    all_positions = _exhaustive_positions(code.n, weight) if exhaustive else None
+    faults = ErrorMaskGenerator(code, seed)
+    reported = 0
+
+    for start in range(0, total, batch_size):
+        count = min(batch_size, total - start)
+        if exhaustive:
+            positions = all_positions[start:start + count]
+        else:
+            positions = faults.random_positions(count, weight)
+        received = codeword ^ faults.masks_from_positions(positions)
+        decoded, status, _ = code.decode_batch(received)
+
+        if weight == 1:
+            data_ok = decoded == data[0]
+            if data_ok.ndim > 1:
+                data_ok = data_ok.all(axis=1)
+            passed = ((status == 1) | (status == 3)) & data_ok
+        else:
+            passed = status == 2
+        failures = []
+        if reported < max_failures:
+            for index in np.flatnonzero(~passed)[:max_failures - reported]:
+                failures.append((tuple(int(p) for p in positions[index]), int(status[index])))
+            reported += len(failures)
+        yield {"done": start + count, "total": total, "failed": int(count - passed.sum()),
+               "status_counts": [int(c) for c in np.bincount(status, minlength=4)], "failures": failures}
@@ -0,0 +1,204 @@
+"""
+Hamming SEC-DED kapsamlı (exhaustive) hata deseni doğrulayıcısı.
+
+Kod doğrusal olduğundan, alınan sözcüğün çözüm sonucu yalnızca hata desenine bağlıdır:
+sendrom(cw ^ e) = sendrom(e) ve çözülen veri = veri ^ veri_bolumu(e ^ duzeltme).
+Bu yüzden her k için ağırlığı <= max_weight olan tüm hata desenleri, sendrom -> eylem
+tablosu ve toplu bir XOR çekirdeğiyle sıfır veri sözcüğü üzerinde kontrol edilir.
+Desen sonuçları ayrıca gerçek decode_batch ile çapraz kontrol edilir; (13,8) için
+tüm 2^8 veri sözcüğü × tüm desenler doğrudan decode_batch ile de çözülür.
+Artımlı güncelleme (update_int/update_batch) de tam yeniden kodlamayla karşılaştırılır.
+Üretilmiş döngüsüz fonksiyonlar (compiled()) ve G/H matris motoru (matrices()) da genel yolla
+karşılaştırılır; matris denetimi Hsiao düzenini de kapsar.
+"""
+
+from itertools import combinations
+
+import numpy as np
+
+from hamming import HammingSECDED, _int_to_lanes, _popcount, _values_from_bit_rows
+from hamming_hsiao import HsiaoSECDED
+
+OUTCOMES = ("corrected", "detected", "miscorrected", "silent")
+
+
+def build_syndrome_actions(hamming):
+    """
+    Genişletilmiş sendrom ((sendrom << 1) | genel_eşlik_hatası) -> (durum kodu, düzeltme maskesi) tabloları.
+    decode ile aynı kararları verir; düzeltme maskesi kod sözcüğü tamsayısı üzerindedir.
+    """
+    size = 1 << (hamming.p_sec + 1)
+    status = np.full(size, 2, dtype=np.uint8)
+    correction = [0] * size
+    status[0] = 0
+    status[1] = 3
+    correction[1] = 1  # Genel eşlik biti (pozisyon n -> bit 0)
+    for syndrome_val in range(1, min(hamming.n, 1 << hamming.p_sec)):
+        status[(syndrome_val << 1) | 1] = 1
+        correction[(syndrome_val << 1) | 1] = 1 << (hamming.n - syndrome_val)
+    return status, np.array([_int_to_lanes(c, hamming.codeword_lanes) for c in correction], dtype=hamming.codeword_dtype)
+
+
+def error_patterns(n, weight):
+    """ Ağırlığı tam olarak weight olan tüm desenlerin bit indeksleri, şekil (C(n, weight), weight) """
+    if weight == 0:
+        return np.zeros((1, 0), dtype=np.int64)
+    return np.array(list(combinations(range(n), weight)), dtype=np.int64).reshape(-1, weight)
+
+
+def classify_patterns(hamming, positions, actions):
+    """
+    Toplu çekirdek: her desen için sendrom sütunlarını XOR'lar, eylem tablosuna bakar ve
+    kalan hatanın veri bölümüne göre sonucu belirler.
+    Dönüş: (durum kodları, veri_dogru_mu, sonuç indeksleri (OUTCOMES), hata maskeleri)
+    """
+    status_table, correction_table = actions
+    columns = np.array(hamming.syndrome_columns, dtype=np.int64)
+    extended = np.zeros(len(positions), dtype=np.int64)
+    bits = np.zeros((len(positions), hamming.n), dtype=np.uint8)
+    rows = np.arange(len(positions))
+    for j in range(positions.shape[1]):
+        extended ^= columns[positions[:, j]]
+        bits[rows, hamming.n - 1 - positions[:, j]] = 1  # Bit satırları MSB (pozisyon 1) önce
+    masks = _values_from_bit_rows(bits, hamming.n)
+
+    data_mask = np.array(_int_to_lanes(sum(1 << (hamming.n - p) for p in hamming.data_positions),
+                                       hamming.codeword_lanes), dtype=hamming.codeword_dtype)
+    status = status_table[extended]
+    data_ok = ((masks ^ correction_table[extended]) & data_mask) == 0
+    if hamming.codeword_lanes:
+        data_ok = data_ok.all(axis=-1)
+    outcome = np.where(status == 2, 1, np.where(data_ok, 0, np.where(status == 0, 3, 2)))
+    return status, data_ok, outcome, masks
+
+
+def verify_incremental(hamming, words=256, seed=0):
+    """
+    Artımlı güncellemenin tam yeniden kodlamayla aynı sonucu verdiğini doğrular: her veri sütunu
+    o bitin tek başına kodlanmasına eşit olmalı ve rastgele update_batch sonuçları encode_batch ile aynı olmalıdır.
+    """
+    k = hamming.k
+    if any(column != hamming.encode_int(1 << (k - 1 - i)) for i, column in enumerate(hamming.data_columns)):
+        return False
+    rng = np.random.default_rng(seed)
+    bits = rng.integers(0, 2, size=(words, k), dtype=np.uint8)
+    codewords = hamming.encode_batch(_values_from_bit_rows(bits, k))
+    # Tekrarsız (sözcük, bit) çiftleri: NumPy'nin tekrarlanan indeksli atama sırası tanımsızdır
+    keys = rng.choice(words * k, size=min(4 * words, words * k), replace=False)
+    word_idx, bit_idx = keys // k, keys % k
+    values = rng.integers(0, 2, len(keys), dtype=np.uint8)
+    updated = hamming.update_batch(codewords, word_idx, bit_idx, values)
+    bits[word_idx, bit_idx] = values
+    return bool(np.array_equal(updated, hamming.encode_batch(_values_from_bit_rows(bits, k))))
+
+
+def verify_compiled(hamming, words=512, max_errors=3, seed=0):
+    """
+    compiled() fonksiyonlarının genel yolla aynı sonucu verdiğini doğrular: rastgele veri sözcükleri
+    (k <= 8 ise tümü) ve her birine 0..max_errors rastgele bit hatası eklenmiş kod sözcükleri için
+    encode/encode_int, sendrom, decode ve decode_int sonuçları karşılaştırılır.
+    """
+    fast = hamming.compiled()
+    k, n = hamming.k, hamming.n
+    rng = np.random.default_rng(seed)
+    if k <= 8:
+        data_words = range(1 << k)
+    else:
+        data_words = [int.from_bytes(rng.bytes((k + 7) // 8), "big") & hamming.data_mask for _ in range(words)]
+    for data in data_words:
+        bits = [(data >> (k - 1 - i)) & 1 for i in range(k)]
+        codeword = hamming.encode_int(data)
+        if fast.encode_int(data) != codeword or fast.encode(bits) != hamming.encode(bits):
+            return False
+        for errors in range(max_errors + 1):
+            received = codeword
+            for bit in rng.choice(n, size=errors, replace=False):
+                received ^= 1 << int(bit)
+            received_bits = [(received >> (n - 1 - i)) & 1 for i in range(n)]
+            data_bits, status, result = hamming.decode(received_bits, structured=True)
+            if (fast.decode(received_bits) != (data_bits, status, result.syndrome)
+                    or fast.syndrome(received_bits) != hamming._calculate_syndrome_and_overall_parity_status(received_bits)
+                    or fast.decode_int(received) != hamming.decode_int(received)):
+                return False
+    return True
+
+
+def verify_matrices(hamming, words=4096, max_errors=3, seed=0):
+    """
+    matrices() motorunu doğrular: G · Hᵀ = 0, matris kodlaması encode_batch ile ve matris çözmesi
+    0..max_errors rastgele bit hatalı sözcüklerde decode_batch ile bit bit aynı olmalıdır.
+    """
+    from hamming_faults import ErrorMaskGenerator
+
+    matrices = hamming.matrices()
+    if any(_popcount(g & h) & 1 for g in matrices.generator_rows for h in matrices.parity_check_rows):
+        return False
+    hamming._get_numpy_tables()
+    rng = np.random.default_rng(seed)
+    data = _values_from_bit_rows(rng.integers(0, 2, size=(words, hamming.k), dtype=np.uint8), hamming.k)
+    codewords = hamming.encode_batch(data)
+    if not np.array_equal(matrices.encode(data), codewords):
+        return False
+    faults = ErrorMaskGenerator(hamming, rng)
+    received = codewords ^ faults.with_weights(rng.integers(0, max_errors + 1, size=words))
+    return all(np.array_equal(a, b) for a, b in zip(matrices.decode(received), hamming.decode_batch(received)))
+
+
+def verify_code(k, max_weight=3, exhaustive_data=None):
+    """
+    k-bitlik kod için ağırlığı 1..max_weight olan tüm hata desenlerini doğrular.
+    exhaustive_data: tüm 2^k veri sözcüğünü ayrıca decode_batch ile çöz (varsayılan: yalnızca k <= 8).
+    Dönüş: {"k", "n", "weights": {w: {"patterns", sonuç sayıları}}, "sec_ok", "ded_ok", "consistent",
+            "incremental_ok", "compiled_ok", "matrix_ok"}
+    """
+    hamming = HammingSECDED(k)
+    hamming._get_numpy_tables()
+    actions = build_syndrome_actions(hamming)
+    if exhaustive_data is None:
+        exhaustive_data = k <= 8
+    if exhaustive_data:
+        all_data = np.arange(1 << k, dtype=hamming.data_dtype)
+        all_codewords = hamming.encode_batch(all_data)
+
+    report = {"k": k, "n": hamming.n, "weights": {}, "consistent": True}
+    for weight in range(1, max_weight + 1):
+        positions = error_patterns(hamming.n, weight)
+        status, data_ok, outcome, masks = classify_patterns(hamming, positions, actions)
+        counts = np.bincount(outcome, minlength=len(OUTCOMES))
+        report["weights"][weight] = {"patterns": len(positions),
+                                     **{name: int(c) for name, c in zip(OUTCOMES, counts)}}
+
+        # Tablo çekirdeğini gerçek kod çözücüyle karşılaştır: sıfır veri sözcüğünün kod sözcüğü 0'dır
+        decoded, real_status, _ = hamming.decode_batch(masks)
+        decoded_zero = decoded == 0
+        if hamming.data_lanes:
+            decoded_zero = decoded_zero.all(axis=-1)
+        if not (np.array_equal(real_status, status) and np.array_equal(decoded_zero, data_ok)):
+            report["consistent"] = False
+        if exhaustive_data:
+            decoded, real_status, _ = hamming.decode_batch(all_codewords[:, None] ^ masks[None, :])
+            if not (np.all(real_status == status) and np.all((decoded == all_data[:, None]) == data_ok)):
+                report["consistent"] = False
+
+    weights = report["weights"]
+    report["sec_ok"] = weights.get(1, {}).get("corrected") == weights.get(1, {}).get("patterns")
+    report["ded_ok"] = 2 not in weights or weights[2]["detected"] == weights[2]["patterns"]
+    report["incremental_ok"] = verify_incremental(hamming)
+    report["compiled_ok"] = verify_compiled(hamming)
+    report["matrix_ok"] = verify_matrices(hamming) and verify_matrices(HsiaoSECDED(k))
+    return report
+
+
+def format_report(report):
+    h = HammingSECDED(report["k"])
+    lines = [f"Hamming {h.get_code_params_str()} SEC-DED kapsamlı doğrulama"]
+    for weight, counts in report["weights"].items():
+        lines.append(f"  {weight} hata: {counts['patterns']} desen -> " +
+                     ", ".join(f"{name}={counts[name]}" for name in OUTCOMES))
+    lines.append(f"  Tüm tek hatalar düzeltildi: {'EVET' if report['sec_ok'] else 'HAYIR'}")
+    lines.append(f"  Tüm çift hatalar tespit edildi: {'EVET' if report['ded_ok'] else 'HAYIR'}")
+    lines.append(f"  Tablo çekirdeği ve decode_batch tutarlı: {'EVET' if report['consistent'] else 'HAYIR'}")
+    lines.append(f"  Artımlı güncelleme tam kodlamayla aynı: {'EVET' if report['incremental_ok'] else 'HAYIR'}")
+    lines.append(f"  Üretilmiş döngüsüz kod genel yolla aynı: {'EVET' if report['compiled_ok'] else 'HAYIR'}")
+    lines.append(f"  G/H matris motoru toplu yolla aynı: {'EVET' if report['matrix_ok'] else 'HAYIR'}")
+    return "\n".join(lines)
@@ -0,0 +1,30 @@
+import os
+
+import pytest
+
+from hamming import HammingSECDED
+
+
+@pytest.mark.parametrize("k", [8, 32, 64, 128])
+@pytest.mark.parametrize("packed", [False, True])
+def test_empty_input_returns_zero(k, packed):
+    code = HammingSECDED(k)
+    out = bytearray(4)
+    assert code.encode_into(b"", out, packed=packed) == 0
+    assert code.decode_into(b"", bytearray(), bytearray(), packed=packed) == 0
+    assert out == bytearray(4)
+
+
+@pytest.mark.parametrize("k", [8, 32, 128])
+@pytest.mark.parametrize("packed", [False, True])
+def test_roundtrip(k, packed):
+    code = HammingSECDED(k)
+    data = os.urandom(k // 8 * 37)
+    encoded = bytearray(37 * code.codeword_bytes)
+    count = code.encode_into(data, encoded, packed=packed)
+    if packed:
+        encoded = encoded[:-(-count * code.n // 8)]
+    decoded, status = bytearray(len(data)), bytearray(count)
+    assert code.decode_into(encoded, decoded, status, packed=packed) == count == 37
+    assert bytes(decoded) == data
+    assert set(status) == {0}
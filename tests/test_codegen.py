@@ -0,0 +1,64 @@
+import random
+
+import numpy as np
+import pytest
+
+from hamming import HammingSECDED, _int_to_lanes
+from hamming_hsiao import HsiaoSECDED
+
+CODES = [(cls, k) for cls in (HammingSECDED, HsiaoSECDED) for k in (8, 16, 64, 128)]
+
+
+def _bits(value, width):
+    return [(value >> (width - 1 - i)) & 1 for i in range(width)]
+
+
+def _as_int(value):
+    """ decode_batch elemanını tamsayıya çevirir (şerit 0 en düşük 64 bit) """
+    if getattr(value, "ndim", 0):
+        return sum(int(lane) << (64 * i) for i, lane in enumerate(value))
+    return int(value)
+
+
+def _received_words(code, rng, count=100):
+    """ Her biri 0..3 rastgele bit hatası içeren kod sözcükleri """
+    received = []
+    for _ in range(count):
+        codeword = code.encode_int(rng.getrandbits(code.k))
+        for bit in rng.sample(range(code.n), rng.randrange(4)):
+            codeword ^= 1 << bit
+        received.append(codeword)
+    return received
+
+
+@pytest.mark.parametrize("cls, k", CODES)
+def test_compiled_encode_matches_reference(cls, k):
+    code = cls(k)
+    fast = code.compiled()
+    rng = random.Random(k)
+    for data in [rng.getrandbits(k) for _ in range(100)] + [0, code.data_mask]:
+        codeword = code.encode_int(data)
+        assert fast.encode_int(data) == codeword
+        assert fast.encode(_bits(data, k)) == code.encode(_bits(data, k)) == _bits(codeword, code.n)
+
+
+@pytest.mark.parametrize("cls, k", CODES)
+def test_compiled_decode_matches_reference(cls, k):
+    code = cls(k)
+    fast = code.compiled()
+    code._get_numpy_tables()
+    received = _received_words(code, random.Random(k + 1))
+    if code.codeword_lanes:
+        batch = np.array([_int_to_lanes(v, code.codeword_lanes) for v in received], dtype=np.uint64)
+    else:
+        batch = np.array(received, dtype=code.codeword_dtype)
+    batch_data, batch_status, batch_syndromes = code.decode_batch(batch)
+    for i, codeword in enumerate(received):
+        bits = _bits(codeword, code.n)
+        data_bits, status, result = code.decode(bits, structured=True)
+        data, int_status, syndrome = code.decode_int(codeword)
+        assert (data_bits, status, result.syndrome) == (_bits(data, k), int_status, syndrome)
+        assert fast.decode(bits) == (data_bits, status, result.syndrome)
+        assert fast.syndrome(bits) == code._calculate_syndrome_and_overall_parity_status(bits)
+        assert fast.decode_int(codeword) == (data, int_status, syndrome)
+        assert (_as_int(batch_data[i]), int(batch_status[i]), int(batch_syndromes[i])) == (data, status, syndrome)
@@ -0,0 +1,94 @@
+import io
+import struct
+
+import numpy as np
+import pytest
+
+from hamming_container import HEADER_STRUCT, CodewordContainer, ContainerRows, write_container
+
+
+@pytest.fixture
+def container_path(tmp_path):
+    path = tmp_path / "goruntu.hscf"
+    data = bytes(range(256)) * 40
+    write_container(str(path), io.BytesIO(data), 32, block_words=256)
+    return path, data
+
+
+def _patch_header(path, **fields):
+    raw = bytearray(path.read_bytes())
+    names = ("magic", "version", "k", "n", "p_sec", "block_words", "num_words", "data_bytes",
+             "index_offset", "num_blocks")
+    values = dict(zip(names, HEADER_STRUCT.unpack_from(raw, 0)))
+    values.update(fields)
+    HEADER_STRUCT.pack_into(raw, 0, *(values[name] for name in names))
+    path.write_bytes(bytes(raw))
+
+
+def test_valid_container_roundtrip(container_path):
+    path, data = container_path
+    out = io.BytesIO()
+    with CodewordContainer(str(path)) as container:
+        stats = container.scrub(dst=out)
+    assert out.getvalue() == data
+    assert stats["status_counts"][0] == stats["words"] == len(data) // 4
+
+
+@pytest.mark.parametrize("size", [0, 3, HEADER_STRUCT.size - 1, HEADER_STRUCT.size + 4, 200, -20])
+def test_truncated_container_raises_value_error(container_path, size):
+    path, _ = container_path
+    raw = path.read_bytes()
+    path.write_bytes(raw[:size])
+    with pytest.raises(ValueError):
+        CodewordContainer(str(path))
+
+
+@pytest.mark.parametrize("fields", [
+    {"num_words": 10 ** 6},                  # şişirilmiş sözcük sayısı
+    {"num_words": 10 ** 6, "data_bytes": 4 * 10 ** 6},
+    {"num_blocks": 1},
+    {"block_words": 0},
+    {"index_offset": 8},
+    {"k": 12},
+    {"k": 0xFFF8},
+    {"p_sec": 200},
+])
+def test_inconsistent_header_raises_value_error(container_path, fields):
+    path, _ = container_path
+    _patch_header(path, **fields)
+    with pytest.raises(ValueError):
+        CodewordContainer(str(path))
+
+
+def test_block_offset_outside_file_raises_value_error(container_path):
+    path, _ = container_path
+    raw = bytearray(path.read_bytes())
+    index_offset = HEADER_STRUCT.unpack_from(raw, 0)[8]
+    struct.pack_into(">Q", raw, index_offset, len(raw) + 100)
+    path.write_bytes(bytes(raw))
+    with pytest.raises(ValueError):
+        CodewordContainer(str(path))
+
+
+def test_empty_container(tmp_path):
+    path = tmp_path / "bos.hscf"
+    write_container(str(path), io.BytesIO(b""), 16)
+    with CodewordContainer(str(path)) as container:
+        assert container.num_blocks == 0
+        assert container.scrub()["words"] == 0
+
+
+def test_container_rows_reads_only_requested_blocks(container_path):
+    path, _ = container_path
+    with CodewordContainer(str(path), writable=True) as container:
+        container._mm[container.block_offsets[1] + 3] ^= 0x10  # Blok 1'de tek bit hatası
+        expected = np.concatenate([container.read_block(b) for b in range(container.num_blocks)])
+        rows = ContainerRows(container, cache_blocks=2)
+        assert len(rows) == len(rows.status) == len(expected)
+        for index in (0, 300, 257, 2559, 1000):
+            assert rows[index] == expected[index]
+        assert len(rows._cache) == 2
+        status = [int(rows.status[i]) for i in range(256, 512)]
+        assert status.count(1) == 1 and status.count(0) == 255
+        with pytest.raises(IndexError):
+            rows[len(expected)]
@@ -0,0 +1,18 @@
+import random
+
+import pytest
+
+from hamming import HammingSECDED
+from hamming_hsiao import HsiaoSECDED
+
+
+@pytest.mark.parametrize("cls", [HammingSECDED, HsiaoSECDED])
+@pytest.mark.parametrize("k", [8, 13, 32, 64, 128])
+def test_decode_lut_matches_decode_int(cls, k):
+    code = cls(k)
+    rng = random.Random(k)
+    for _ in range(200):
+        codeword = code.encode_int(rng.getrandbits(k))
+        for _ in range(rng.randrange(3)):
+            codeword ^= 1 << rng.randrange(code.n)
+        assert code.decode_lut(codeword) == code.decode_int(codeword)
@@ -0,0 +1,71 @@
+import random
+
+import numpy as np
+import pytest
+
+from hamming import HammingSECDED, _int_to_lanes
+from hamming_hsiao import HsiaoSECDED
+
+CODES = [(cls, k) for cls in (HammingSECDED, HsiaoSECDED) for k in (8, 32, 64, 128)]
+
+
+def _bits(value, width):
+    return [(value >> (width - 1 - i)) & 1 for i in range(width)]
+
+
+def _as_int(value):
+    """ encode_batch elemanını tamsayıya çevirir (şerit 0 en düşük 64 bit) """
+    if getattr(value, "ndim", 0):
+        return sum(int(lane) << (64 * i) for i, lane in enumerate(value))
+    return int(value)
+
+
+def _apply(data, k, changes):
+    """ changes ({veri_biti_indeksi: değer}, indeks 0 = MSB) uygulanmış veri """
+    for index, value in changes.items():
+        shift = k - 1 - index
+        data = (data & ~(1 << shift)) | (value << shift)
+    return data
+
+
+@pytest.mark.parametrize("cls, k", CODES)
+def test_data_columns_are_single_bit_codewords(cls, k):
+    code = cls(k)
+    assert [code.encode_int(1 << (k - 1 - i)) for i in range(k)] == list(code.data_columns)
+
+
+@pytest.mark.parametrize("cls, k", CODES)
+def test_update_matches_full_reencode(cls, k):
+    code = cls(k)
+    rng = random.Random(k)
+    for _ in range(100):
+        data = rng.getrandbits(k)
+        changes = {rng.randrange(k): rng.randrange(2) for _ in range(rng.randrange(1, 6))}
+        expected = code.encode_int(_apply(data, k, changes))
+        assert code.update_int(code.encode_int(data), changes) == expected
+        assert code.update(code.encode(_bits(data, k)), changes) == _bits(expected, code.n)
+
+
+@pytest.mark.parametrize("cls, k", CODES)
+def test_update_batch_matches_update_int(cls, k):
+    code = cls(k)
+    code._get_numpy_tables()
+    rng = random.Random(k + 1)
+    data = [rng.getrandbits(k) for _ in range(64)]
+    if code.data_lanes:
+        batch = np.array([_int_to_lanes(d, code.data_lanes) for d in data], dtype=np.uint64)
+    else:
+        batch = np.array(data, dtype=code.data_dtype)
+    codewords = code.encode_batch(batch)
+    words = [rng.randrange(len(data)) for _ in range(200)]
+    bits = [rng.randrange(k) for _ in range(200)]
+    values = [rng.randrange(2) for _ in range(200)]
+    updated = code.update_batch(codewords, words, bits, values)
+
+    changes = [{} for _ in data]
+    for word, bit, value in zip(words, bits, values):  # Son yazan kazanır
+        changes[word][bit] = value
+    for i, d in enumerate(data):
+        assert _as_int(codewords[i]) == code.encode_int(d)
+        assert _as_int(updated[i]) == code.update_int(code.encode_int(d), changes[i]) \
+            == code.encode_int(_apply(d, k, changes[i]))
@@ -0,0 +1,65 @@
+import random
+
+import numpy as np
+import pytest
+
+from hamming import HammingSECDED, _int_to_lanes, _popcount
+from hamming_hsiao import HsiaoSECDED
+
+CODES = [(cls, k) for cls in (HammingSECDED, HsiaoSECDED) for k in (8, 32, 64, 128)]
+
+
+def _as_int(value):
+    """ Toplu dizi elemanını tamsayıya çevirir (şerit 0 en düşük 64 bit) """
+    if getattr(value, "ndim", 0):
+        return sum(int(lane) << (64 * i) for i, lane in enumerate(value))
+    return int(value)
+
+
+def _batch(values, lanes, dtype):
+    if lanes:
+        return np.array([_int_to_lanes(v, lanes) for v in values], dtype=np.uint64)
+    return np.array(values, dtype=dtype)
+
+
+@pytest.mark.parametrize("cls, k", CODES)
+def test_generator_is_orthogonal_to_parity_check(cls, k):
+    matrices = cls(k).matrices()
+    assert all(_popcount(g & h) % 2 == 0 for g in matrices.generator_rows for h in matrices.parity_check_rows)
+
+
+@pytest.mark.parametrize("cls, k", CODES)
+def test_matrix_encode_matches_reference(cls, k):
+    code = cls(k)
+    code._get_numpy_tables()
+    matrices = code.matrices()
+    rng = random.Random(k)
+    data = [rng.getrandbits(k) for _ in range(200)] + [0, code.data_mask]
+    batch = _batch(data, code.data_lanes, code.data_dtype)
+    encoded = matrices.encode(batch)
+    reference = code.encode_batch(batch)
+    for i, d in enumerate(data):
+        assert _as_int(encoded[i]) == _as_int(reference[i]) == code.encode_int(d)
+
+
+@pytest.mark.parametrize("cls, k", CODES)
+def test_matrix_decode_matches_reference(cls, k):
+    code = cls(k)
+    code._get_numpy_tables()
+    matrices = code.matrices()
+    rng = random.Random(k + 1)
+    received = []
+    for _ in range(200):
+        codeword = code.encode_int(rng.getrandbits(k))
+        for bit in rng.sample(range(code.n), rng.randrange(4)):  # 0..3 hata
+            codeword ^= 1 << bit
+        received.append(codeword)
+    batch = _batch(received, code.codeword_lanes, code.codeword_dtype)
+    data, status, syndromes = matrices.decode(batch)
+    ref_data, ref_status, ref_syndromes = code.decode_batch(batch)
+    extended = matrices.syndrome(batch)
+    for i, codeword in enumerate(received):
+        expected = code.decode_int(codeword)
+        assert (_as_int(data[i]), int(status[i]), int(syndromes[i])) == expected
+        assert (_as_int(ref_data[i]), int(ref_status[i]), int(ref_syndromes[i])) == expected
+        assert int(extended[i]) >> matrices.sec_shift == expected[2]
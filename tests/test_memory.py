@@ -0,0 +1,17 @@
+import math
+
+from hamming import HammingSECDED
+from hamming_memory import DEFAULT_SLICE_WORDS, simulate_scrubbing
+
+
+def test_uncorrectable_rate_matches_analytic_for_partial_last_slice():
+    # num_words dilim boyutunun katı değil: her geçişin son dilimi kısadır
+    num_words = 100000
+    assert num_words % DEFAULT_SLICE_WORDS
+    code = HammingSECDED(32)
+    upset_rate = 0.01 / code.n  # Temizleme aralığında sözcük başına ~0,01 upset
+    result = simulate_scrubbing(code, num_words, upset_rate, scrub_interval=1.0, duration=100.0, seed=1)
+    expected = result["analytic_rate"] * result["duration"]
+    observed = result["uncorrectable"] + result["miscorrected"] + result["silent"]
+    # Poisson sayımı için ~%99,99 güven aralığı
+    assert abs(observed - expected) < 4 * math.sqrt(expected)
@@ -0,0 +1,48 @@
+import io
+import os
+
+import pytest
+
+from hamming import HammingSECDED, encode_stream
+from hamming_container import write_container
+from hamming_scan import DECODED_SUFFIX, find_codeword_files, format_scan_report, scan_files
+
+
+@pytest.fixture
+def scan_dir(tmp_path):
+    # Veri bir akış başlığıyla başlar: çıkışlar yalnızca içeriğe bakılarak ayırt edilemez
+    data = b"HSD1" + bytes(range(256)) * 64
+    write_container(str(tmp_path / "iyi.hscf"), io.BytesIO(data), 32, block_words=128)
+    write_container(str(tmp_path / "kesik.hscf"), io.BytesIO(data), 32, block_words=128)
+    truncated = tmp_path / "kesik.hscf"
+    truncated.write_bytes(truncated.read_bytes()[:-100])
+    (tmp_path / "alt").mkdir()
+    with open(tmp_path / "alt" / "akis.hsd", "wb") as dst:
+        encode_stream(HammingSECDED(8), io.BytesIO(data), dst)
+    return tmp_path, data
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+@pytest.mark.parametrize("task_bytes", [1 << 20, 512])
+def test_truncated_container_does_not_stop_scan(scan_dir, task_bytes, workers):
+    path, data = scan_dir
+    output = path.parent / "cikis"
+    report = scan_files([str(path)], workers=workers, output_dir=str(output), task_bytes=task_bytes)
+    results = {os.path.basename(r["path"]): r for r in report["files"]}
+    assert report["num_files"] == 3 and report["failed_files"] == 1
+    assert "error" in results["kesik.hscf"]
+    assert results["iyi.hscf"]["words"] == results["iyi.hscf"]["status_counts"][0] == -(-len(data) // 4)
+    assert "kesik.hscf: HATA" in format_scan_report(report)
+
+
+def test_output_files_are_renamed_and_complete(scan_dir):
+    path, data = scan_dir
+    output = path.parent / "cikis"
+    scan_files([str(path)], workers=1, output_dir=str(output))
+    written = sorted(str(p.relative_to(output)) for p in output.rglob("*") if p.is_file())
+    # Başarısız dosyanın (kesik.hscf) yarım çıkışı ve geçici dosyalar kalmaz
+    assert written == [os.path.join("alt", "akis.hsd" + DECODED_SUFFIX), "iyi.hscf" + DECODED_SUFFIX]
+    assert (output / ("iyi.hscf" + DECODED_SUFFIX)).read_bytes() == data
+    assert (output / "alt" / ("akis.hsd" + DECODED_SUFFIX)).read_bytes() == data
+    # Çıkış dizini yeniden tarandığında ham veri kod sözcüğü dosyası sanılmaz
+    assert find_codeword_files([str(output)]) == []
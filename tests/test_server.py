@@ -0,0 +1,106 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from hamming_server import (FRAME_STRUCT, MAX_DATA_BITS, OP_ENCODE, CodecClient, CodecError, CodecServer,
+                            _validate_request)
+
+
+def test_validate_request_caps_data_bits():
+    assert _validate_request(OP_ENCODE, MAX_DATA_BITS, 0) is None
+    assert _validate_request(OP_ENCODE, 0xFFF8, 0) is not None
+    assert _validate_request(OP_ENCODE, MAX_DATA_BITS + 8, 0) is not None
+
+
+class _CountingExecutor(ThreadPoolExecutor):
+    """ Gönderilen işleri sayar ve gate açılana kadar bekletir """
+
+    def __init__(self):
+        super().__init__(max_workers=4)
+        self.gate = threading.Event()
+        self.submitted = 0
+
+    def submit(self, fn, *args):
+        self.submitted += 1
+
+        def wait_then_run():
+            self.gate.wait(5)
+            return fn(*args)
+        return super().submit(wait_then_run)
+
+
+async def _with_server(executor, queue_depth, body):
+    server = CodecServer(queue_depth=queue_depth, executor=executor)
+    tcp = await server.start_tcp(port=0)
+    port = tcp.sockets[0].getsockname()[1]
+    try:
+        return await body(server, port)
+    finally:
+        await server.close()
+
+
+def test_rejects_oversized_k_over_connection():
+    async def body(server, port):
+        client = await CodecClient.connect(port=port)
+        try:
+            with pytest.raises(CodecError):
+                await client.encode(MAX_DATA_BITS + 8, b"\0" * ((MAX_DATA_BITS + 8) // 8))
+            assert await client.encode(8, b"\x5a") != b""
+        finally:
+            await client.close()
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        asyncio.run(_with_server(executor, 4, body))
+
+
+def test_backpressure_limits_submitted_work():
+    executor = _CountingExecutor()
+
+    async def body(server, port):
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        for request_id in range(10):
+            writer.write(FRAME_STRUCT.pack(OP_ENCODE, 0, 8, request_id, 1) + b"\x01")
+        await writer.drain()
+        await asyncio.sleep(0.2)
+        assert executor.submitted == 2  # queue_depth
+        executor.gate.set()
+        for _ in range(10):
+            header = await reader.readexactly(FRAME_STRUCT.size)
+            await reader.readexactly(FRAME_STRUCT.unpack(header)[4])
+        writer.close()
+        assert executor.submitted == 10
+
+    try:
+        asyncio.run(_with_server(executor, 2, body))
+    finally:
+        executor.gate.set()
+        executor.shutdown()
+
+
+def test_cancelled_connection_closes_writer():
+    executor = _CountingExecutor()
+
+    async def body(server, port):
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(FRAME_STRUCT.pack(OP_ENCODE, 0, 8, 1, 1) + b"\x01")
+        await writer.drain()
+        await asyncio.sleep(0.1)
+        handlers = [task for task in asyncio.all_tasks()
+                    if getattr(task.get_coro(), "__name__", "") == "_handle"]
+        assert len(handlers) == 1 and server.connections
+        handlers[0].cancel()
+        await asyncio.gather(*handlers, return_exceptions=True)
+        assert not server.connections
+        children = [task for task in asyncio.all_tasks()
+                    if getattr(task.get_coro(), "__name__", "") in ("_read_requests", "_respond")]
+        assert not children
+        assert await reader.read() == b""  # Sunucu bağlantıyı kapattı
+        writer.close()
+
+    try:
+        asyncio.run(_with_server(executor, 2, body))
+    finally:
+        executor.gate.set()
+        executor.shutdown()
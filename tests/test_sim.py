@@ -0,0 +1,32 @@
+import hamming_sim
+from hamming_sim import MIN_TASK_TRIALS, TARGET_TASKS, ber_sweep, run_simulation, task_size
+
+
+def test_default_trials_split_into_many_tasks():
+    # Varsayılan 1e6 deneme tek göreve düşmemeli (süreç havuzu paralel çalışabilmeli)
+    assert -(-10 ** 6 // task_size(10 ** 6)) >= 32
+    assert task_size(1000) == MIN_TASK_TRIALS
+    assert -(-10 ** 9 // task_size(10 ** 9)) == TARGET_TASKS
+
+
+def test_results_independent_of_worker_count():
+    one = run_simulation(8, 50000, errors=2, workers=1, seed=3, task_trials=8192)
+    two = run_simulation(8, 50000, errors=2, workers=2, seed=3, task_trials=8192)
+    assert one["counts"] == two["counts"]
+    assert one["counts"]["detected"] == 50000
+
+
+def test_ber_sweep_single_worker_skips_pool(monkeypatch):
+    def no_pool(*args, **kwargs):
+        raise AssertionError("workers=1 iken süreç havuzu kurulmamalı")
+    monkeypatch.setattr(hamming_sim, "ProcessPoolExecutor", no_pool)
+    results = ber_sweep([8], [1e-2], 20000, workers=1, seed=5)
+    assert results[0]["trials"] == 20000
+
+
+def test_ber_sweep_points_use_independent_seeds():
+    # Aynı (k, BER) iki kez: ortak tohumla sayılar aynı olurdu, ayrı alt dizilerle farklıdır
+    first, second = ber_sweep([8], [5e-2, 5e-2], 20000, workers=1, seed=7)
+    assert first["counts"] != second["counts"]
+    again = ber_sweep([8], [5e-2, 5e-2], 20000, workers=1, seed=7)
+    assert [r["counts"] for r in again] == [first["counts"], second["counts"]]